@@ -0,0 +1,69 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# Statements timed in a fresh interpreter each, from the cheapest entry point to a ready client
+STATEMENTS = [
+    "import src",
+    "from src import CoingeckoApi",
+    "from src import CoingeckoApi; CoingeckoApi()",
+    "from src import AsyncCoingeckoApi",
+    "from src.util import TimeSeriesStore"
+]
+
+# Optional or heavy dependencies that must not be loaded by the statements above unless they are used
+HEAVY_MODULES = ("requests", "urllib3", "numpy", "aiohttp", "asyncio", "telnetlib")
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+loaded = [name for name in {modules!r} if name in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure(statement: str) -> Dict:
+    """Seconds a fresh interpreter spends on statement and the heavy modules it actually loaded"""
+
+    output = subprocess.run([sys.executable, "-c", _PROBE.format(statement=statement, modules=HEAVY_MODULES)],
+                            capture_output=True, text=True, check=True).stdout.split()
+    return {"seconds": float(output[0]), "loaded": output[1].split(",") if len(output) > 1 else []}
+
+
+def run_import_benchmark(statements: List[str] = None, repeat: int = 5) -> Dict:
+    results = []
+    for statement in statements or STATEMENTS:
+        samples = [measure(statement) for _ in range(repeat)]
+        seconds = [sample["seconds"] for sample in samples]
+        results.append({
+            "statement": statement,
+            "median_ms": statistics.median(seconds) * 1000,
+            "min_ms": min(seconds) * 1000,
+            "loaded": samples[-1]["loaded"]
+        })
+
+    return {"python": sys.version.split()[0], "repeat": repeat, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of the package in fresh interpreters")
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreters started per statement")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = run_import_benchmark(repeat=args.repeat)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,549 @@
+import argparse
+import json
+import multiprocessing
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.config import ApiConfig
+
+Url = ApiConfig.Url
+
+DAY = 24 * 60 * 60 * 1000
+VS_CURRENCIES = ["btc", "eth", "ltc", "bch", "bnb", "eos", "xrp", "xlm", "link", "dot", "yfi", "usd", "aed", "ars", "aud", "bdt", "bhd",
+                 "bmd", "brl", "cad", "chf", "clp", "cny", "czk", "dkk", "eur", "gbp", "hkd", "huf", "idr", "ils", "inr", "jpy", "krw",
+                 "kwd", "lkr", "mmk", "mxn", "myr", "ngn", "nok", "nzd", "php", "pkr", "pln", "rub", "sar", "sek", "sgd", "thb", "try",
+                 "twd", "uah", "vef", "vnd", "zar", "xdr", "xag", "xau", "bits", "sats"]
+
+
+class Fixtures:
+    """Deterministic, realistic-looking response bodies for every ApiConfig.Url route
+
+    @size: Number of items in list responses (coins, points, tickers...) Default: 100
+    @seed: Random seed, equal seeds produce equal bodies Default: 0
+    """
+
+    def __init__(self, size: int = 100, seed: int = 0):
+        self.size = size
+        self.seed = seed
+
+    def build(self, path: str, path_vars: Dict, params: Dict) -> Tuple[object, int]:
+        """Body for a route and the total item count of paginated routes (None for the others)"""
+
+        handler = getattr(self, "_" + re.sub(r"\W+", "_", path).strip("_").lower())
+        random_ = random.Random(f"{self.seed}:{path}:{sorted(path_vars.items())}:{sorted(params.items())}")
+        return handler(random_, path_vars, params)
+
+    def _page(self, params: Dict, total: int, per_page: int = 100) -> range:
+        per_page = int(params.get("per_page", per_page))
+        page = int(params.get("page", 1))
+        return range((page - 1) * per_page, min(page * per_page, total))
+
+    def _coin(self, random_: random.Random, coin_id: str) -> Dict:
+        return {
+            "id": coin_id,
+            "symbol": coin_id[:4],
+            "name": coin_id.replace("-", " ").title(),
+            "asset_platform_id": None,
+            "platforms": {"ethereum": "0x" + "".join(random_.choice("0123456789abcdef") for _ in range(40))},
+            "categories": ["Cryptocurrency"],
+            "description": {"en": "Lorem ipsum dolor sit amet. " * 20},
+            "links": {"homepage": [f"https://{coin_id}.example.org"], "blockchain_site": [], "repos_url": {"github": []}},
+            "image": {"thumb": f"https://assets.example.org/{coin_id}/thumb.png", "small": f"https://assets.example.org/{coin_id}/small.png"},
+            "market_cap_rank": random_.randint(1, 5000),
+            "market_data": {
+                "current_price": {vs: random_.uniform(0.01, 50000) for vs in VS_CURRENCIES},
+                "market_cap": {vs: random_.uniform(1e6, 1e12) for vs in VS_CURRENCIES},
+                "total_volume": {vs: random_.uniform(1e4, 1e10) for vs in VS_CURRENCIES},
+                "price_change_percentage_24h": random_.uniform(-10, 10),
+                "last_updated": "2024-01-01T00:00:00.000Z"
+            },
+            "tickers": [self._ticker(random_, index) for index in range(min(self.size, 100))],
+            "last_updated": "2024-01-01T00:00:00.000Z"
+        }
+
+    def _ticker(self, random_: random.Random, index: int) -> Dict:
+        return {
+            "base": f"COIN{index}",
+            "target": "USDT",
+            "market": {"name": f"Exchange {index % 50}", "identifier": f"exchange-{index % 50}", "has_trading_incentive": False},
+            "last": random_.uniform(0.01, 50000),
+            "volume": random_.uniform(1e3, 1e8),
+            "converted_last": {"btc": random_.random(), "eth": random_.random(), "usd": random_.uniform(0.01, 50000)},
+            "converted_volume": {"btc": random_.random(), "eth": random_.random(), "usd": random_.uniform(1e3, 1e8)},
+            "trust_score": "green",
+            "bid_ask_spread_percentage": random_.random(),
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "is_anomaly": False,
+            "is_stale": False,
+            "trade_url": f"https://exchange-{index % 50}.example.org/trade/COIN{index}_USDT",
+            "coin_id": f"coin-{index}",
+            "target_coin_id": "tether"
+        }
+
+    def _status_update(self, random_: random.Random, index: int) -> Dict:
+        return {
+            "description": "Status update " * 10,
+            "category": random_.choice(["general", "milestone", "partnership", "exchange_listing", "software_release"]),
+            "created_at": "2024-01-01T00:00:00.000Z",
+            "user": "Team",
+            "user_title": "Marketing",
+            "pin": False,
+            "project": {"type": "Coin", "id": f"coin-{index}", "name": f"Coin {index}", "image": {}}
+        }
+
+    def _exchange(self, random_: random.Random, index: int) -> Dict:
+        return {
+            "id": f"exchange-{index}",
+            "name": f"Exchange {index}",
+            "year_established": random_.randint(2010, 2023),
+            "country": "Cayman Islands",
+            "description": "",
+            "url": f"https://exchange-{index}.example.org",
+            "image": f"https://assets.example.org/exchange-{index}.png",
+            "has_trading_incentive": False,
+            "trust_score": random_.randint(1, 10),
+            "trust_score_rank": index + 1,
+            "trade_volume_24h_btc": random_.uniform(1, 1e6),
+            "trade_volume_24h_btc_normalized": random_.uniform(1, 1e6)
+        }
+
+    def _market_chart(self, random_: random.Random, start: int, end: int) -> Dict:
+        step = max((end - start) // max(self.size, 1), 1)
+        timestamps = range(start, start + step * self.size, step)
+        return {name: [[timestamp, random_.uniform(1, 1e9)] for timestamp in timestamps] for name in ("prices", "market_caps", "total_volumes")}
+
+    def _market_chart_days(self, random_: random.Random, params: Dict) -> Dict:
+        end = 1704067200000
+        days = params.get("days", "1")
+        return self._market_chart(random_, end - (3650 if days == "max" else int(days)) * DAY, end)
+
+    def _market_chart_range(self, random_: random.Random, params: Dict) -> Dict:
+        return self._market_chart(random_, int(float(params["from"])) * 1000, int(float(params["to"])) * 1000)
+
+    def _ping(self, random_, path_vars, params):
+        return {"gecko_says": "(V3) To the Moon!"}, None
+
+    def _simple_price(self, random_, path_vars, params, ids_param: str = "ids"):
+        response = {}
+        for coin_id in params.get(ids_param, "").split(","):
+            if not coin_id:
+                continue
+            prices = response[coin_id] = {}
+            for vs_currency in params.get("vs_currencies", "usd").split(","):
+                prices[vs_currency] = random_.uniform(0.01, 50000)
+                if params.get("include_market_cap") == "true":
+                    prices[f"{vs_currency}_market_cap"] = random_.uniform(1e6, 1e12)
+                if params.get("include_24hr_vol") == "true":
+                    prices[f"{vs_currency}_24h_vol"] = random_.uniform(1e4, 1e10)
+                if params.get("include_24hr_change") == "true":
+                    prices[f"{vs_currency}_24h_change"] = random_.uniform(-10, 10)
+            if params.get("include_last_updated_at") == "true":
+                prices["last_updated_at"] = 1704067200
+        return response, None
+
+    def _simple_token_price_asset_platform_id(self, random_, path_vars, params):
+        return self._simple_price(random_, path_vars, params, ids_param="contract_addresses")
+
+    def _simple_supported_vs_currencies(self, random_, path_vars, params):
+        return VS_CURRENCIES, None
+
+    def _coins_list(self, random_, path_vars, params):
+        coins = []
+        for index in range(self.size):
+            coin = {"id": f"coin-{index}", "symbol": f"c{index}", "name": f"Coin {index}"}
+            if params.get("include_platform") == "true":
+                coin["platforms"] = {"ethereum": f"0x{index:040x}"} if index % 2 else {}
+            coins.append(coin)
+        return coins, None
+
+    def _coins_markets(self, random_, path_vars, params):
+        coin_ids = params["ids"].split(",") if params.get("ids") else [f"coin-{index}" for index in self._page(params, self.size)]
+        return [{
+            "id": coin_id,
+            "symbol": coin_id[:4],
+            "name": coin_id.title(),
+            "image": f"https://assets.example.org/{coin_id}.png",
+            "current_price": random_.uniform(0.01, 50000),
+            "market_cap": random_.uniform(1e6, 1e12),
+            "market_cap_rank": index + 1,
+            "total_volume": random_.uniform(1e4, 1e10),
+            "high_24h": random_.uniform(0.01, 50000),
+            "low_24h": random_.uniform(0.01, 50000),
+            "price_change_24h": random_.uniform(-100, 100),
+            "price_change_percentage_24h": random_.uniform(-10, 10),
+            "circulating_supply": random_.uniform(1e6, 1e10),
+            "total_supply": random_.uniform(1e6, 1e10),
+            "ath": random_.uniform(0.01, 50000),
+            "atl": random_.uniform(0.01, 50000),
+            "last_updated": "2024-01-01T00:00:00.000Z"
+        } for index, coin_id in enumerate(coin_ids)], None
+
+    def _coins_coin_id(self, random_, path_vars, params):
+        return self._coin(random_, path_vars["coin_id"]), None
+
+    def _coins_coin_id_tickers(self, random_, path_vars, params):
+        tickers = [self._ticker(random_, index) for index in self._page(params, self.size, ApiConfig.Pagination.TICKERS_PER_PAGE)]
+        return {"name": path_vars["coin_id"].title(), "tickers": tickers}, None
+
+    def _coins_coin_id_history(self, random_, path_vars, params):
+        coin = self._coin(random_, path_vars["coin_id"])
+        return {key: coin[key] for key in ("id", "symbol", "name", "image", "market_data")}, None
+
+    def _coins_coin_id_market_chart(self, random_, path_vars, params):
+        return self._market_chart_days(random_, params), None
+
+    def _coins_coin_id_market_chart_range(self, random_, path_vars, params):
+        return self._market_chart_range(random_, params), None
+
+    def _coins_coin_id_status_updates(self, random_, path_vars, params):
+        return {"status_updates": [self._status_update(random_, index) for index in self._page(params, self.size, 50)]}, self.size
+
+    def _coins_coin_id_ohlc(self, random_, path_vars, params):
+        end = 1704067200000
+        step = int(params.get("days", "1") if params.get("days") != "max" else 3650) * DAY // max(self.size, 1)
+        return [[end - (self.size - index) * step] + [random_.uniform(1, 50000) for _ in range(4)] for index in range(self.size)], None
+
+    def _coins_asset_platform_id_contract_contract_address(self, random_, path_vars, params):
+        return self._coin(random_, f"token-{path_vars['contract_address'][-6:]}"), None
+
+    def _coins_asset_platform_id_contract_contract_address_market_chart(self, random_, path_vars, params):
+        return self._market_chart_days(random_, params), None
+
+    def _coins_asset_platform_id_contract_contract_address_market_chart_range(self, random_, path_vars, params):
+        return self._market_chart_range(random_, params), None
+
+    def _asset_platforms(self, random_, path_vars, params):
+        return [{"id": f"platform-{index}", "chain_identifier": index, "name": f"Platform {index}", "shortname": f"p{index}"} for index in range(min(self.size, 200))], None
+
+    def _coins_categories_list(self, random_, path_vars, params):
+        return [{"category_id": f"category-{index}", "name": f"Category {index}"} for index in range(min(self.size, 500))], None
+
+    def _coins_categories(self, random_, path_vars, params):
+        return [{
+            "id": f"category-{index}",
+            "name": f"Category {index}",
+            "market_cap": random_.uniform(1e6, 1e12),
+            "market_cap_change_24h": random_.uniform(-10, 10),
+            "content": "",
+            "top_3_coins": [f"https://assets.example.org/coin-{index}.png"] * 3,
+            "volume_24h": random_.uniform(1e4, 1e10),
+            "updated_at": "2024-01-01T00:00:00.000Z"
+        } for index in range(min(self.size, 500))], None
+
+    def _exchanges(self, random_, path_vars, params):
+        return [self._exchange(random_, index) for index in self._page(params, self.size)], self.size
+
+    def _exchanges_list(self, random_, path_vars, params):
+        return [{"id": f"exchange-{index}", "name": f"Exchange {index}"} for index in range(self.size)], None
+
+    def _exchanges_exchange_id(self, random_, path_vars, params):
+        exchange = self._exchange(random_, 0)
+        exchange.update({"id": path_vars["exchange_id"], "tickers": [self._ticker(random_, index) for index in range(min(self.size, 100))], "status_updates": []})
+        return exchange, None
+
+    def _exchanges_exchange_id_tickers(self, random_, path_vars, params):
+        tickers = [self._ticker(random_, index) for index in self._page(params, self.size, ApiConfig.Pagination.TICKERS_PER_PAGE)]
+        return {"name": path_vars["exchange_id"].title(), "tickers": tickers}, self.size
+
+    def _exchanges_exchange_id_status_updates(self, random_, path_vars, params):
+        return {"status_updates": [self._status_update(random_, index) for index in self._page(params, self.size)]}, self.size
+
+    def _exchanges_exchange_id_volume_chart(self, random_, path_vars, params):
+        end = 1704067200000.0
+        step = int(params.get("days", "1")) * DAY / max(self.size, 1)
+        return [[end - (self.size - index) * step, f"{random_.uniform(1, 1e6):.16f}"] for index in range(self.size)], None
+
+    def _finance_platforms(self, random_, path_vars, params):
+        return [{"name": f"Platform {index}", "facts": "", "category": "CeFi", "centralized": True, "website_url": ""} for index in self._page(params, self.size)], None
+
+    def _finance_products(self, random_, path_vars, params):
+        return [{"platform": f"Platform {index}", "identifier": f"product-{index}", "supply_rate_percentage": str(random_.random()),
+                 "borrow_rate_percentage": None, "number_duration": None, "length_duration": None,
+                 "start_at": 0, "end_at": 0, "value_at": 0, "redeem_at": 0} for index in self._page(params, self.size)], self.size
+
+    def _indexes(self, random_, path_vars, params):
+        return [{"name": f"Index {index}", "id": f"INDEX{index}", "market": f"Market {index % 20}", "last": random_.uniform(1, 50000),
+                 "is_multi_asset_composite": False} for index in self._page(params, self.size)], self.size
+
+    def _indexes_market_id_index_id(self, random_, path_vars, params):
+        return {"name": path_vars["index_id"], "market": path_vars["market_id"], "last": random_.uniform(1, 50000), "is_multi_asset_composite": False}, None
+
+    def _indexes_list(self, random_, path_vars, params):
+        return [{"id": f"INDEX{index}", "name": f"Index {index}"} for index in range(self.size)], None
+
+    def _derivatives(self, random_, path_vars, params):
+        return [{
+            "market": f"Exchange {index % 50} (Futures)",
+            "symbol": f"COIN{index}USDT",
+            "index_id": f"COIN{index}",
+            "price": str(random_.uniform(0.01, 50000)),
+            "price_percentage_change_24h": random_.uniform(-10, 10),
+            "contract_type": "perpetual",
+            "index": random_.uniform(0.01, 50000),
+            "basis": random_.uniform(-1, 1),
+            "spread": random_.random(),
+            "funding_rate": random_.uniform(-0.1, 0.1),
+            "open_interest": random_.uniform(1e3, 1e9),
+            "volume_24h": random_.uniform(1e3, 1e9),
+            "last_traded_at": 1704067200,
+            "expired_at": None
+        } for index in range(self.size)], None
+
+    def _derivatives_exchanges(self, random_, path_vars, params):
+        return [{
+            "name": f"Exchange {index} (Futures)",
+            "id": f"exchange-{index}-futures",
+            "open_interest_btc": random_.uniform(1, 1e6),
+            "trade_volume_24h_btc": str(random_.uniform(1, 1e6)),
+            "number_of_perpetual_pairs": random_.randint(1, 500),
+            "number_of_futures_pairs": random_.randint(0, 100),
+            "image": "",
+            "year_established": 2019,
+            "country": None,
+            "description": "",
+            "url": f"https://exchange-{index}.example.org"
+        } for index in self._page(params, self.size)], None
+
+    def _derivatives_exchanges_exchange_id(self, random_, path_vars, params):
+        exchange, _ = self._derivatives_exchanges(random_, path_vars, {"per_page": 1})
+        exchange[0]["id"] = path_vars["exchange_id"]
+        return exchange[0], None
+
+    def _derivatives_exchanges_list(self, random_, path_vars, params):
+        return [{"id": f"exchange-{index}-futures", "name": f"Exchange {index} (Futures)"} for index in range(self.size)], None
+
+    def _status_updates(self, random_, path_vars, params):
+        return {"status_updates": [self._status_update(random_, index) for index in self._page(params, self.size)]}, self.size
+
+    def _exchange_rates(self, random_, path_vars, params):
+        rates = {"btc": {"name": "Bitcoin", "unit": "BTC", "value": 1.0, "type": "crypto"}}
+        for vs_currency in VS_CURRENCIES[1:]:
+            rates[vs_currency] = {"name": vs_currency.upper(), "unit": vs_currency.upper(), "value": random_.uniform(0.001, 1e9),
+                                  "type": "crypto" if vs_currency in VS_CURRENCIES[:11] else "fiat"}
+        return {"rates": rates}, None
+
+    def _search(self, random_, path_vars, params):
+        query = params.get("query", "")
+        count = min(self.size, 25)
+        return {
+            "coins": [{"id": f"{query}-{index}", "name": f"{query.title()} {index}", "api_symbol": f"{query}-{index}", "symbol": query[:4].upper(),
+                       "market_cap_rank": index + 1, "thumb": "", "large": ""} for index in range(count)],
+            "exchanges": [{"id": f"{query}-exchange-{index}", "name": f"{query.title()} Exchange {index}", "market_type": "spot", "thumb": "", "large": ""} for index in range(count // 5)],
+            "icos": [],
+            "categories": [{"id": index, "name": f"{query.title()} Category {index}"} for index in range(count // 5)],
+            "nfts": []
+        }, None
+
+    def _search_trending(self, random_, path_vars, params):
+        return {"coins": [{"item": {"id": f"coin-{index}", "coin_id": index, "name": f"Coin {index}", "symbol": f"C{index}",
+                                    "market_cap_rank": index + 1, "thumb": "", "small": "", "large": "", "slug": f"coin-{index}",
+                                    "price_btc": random_.random(), "score": index}} for index in range(7)], "exchanges": []}, None
+
+    def _global(self, random_, path_vars, params):
+        return {"data": {
+            "active_cryptocurrencies": self.size,
+            "upcoming_icos": 0,
+            "ongoing_icos": 49,
+            "ended_icos": 3376,
+            "markets": 800,
+            "total_market_cap": {vs: random_.uniform(1e9, 1e13) for vs in VS_CURRENCIES},
+            "total_volume": {vs: random_.uniform(1e8, 1e12) for vs in VS_CURRENCIES},
+            "market_cap_percentage": {f"c{index}": random_.uniform(0, 50) for index in range(10)},
+            "market_cap_change_percentage_24h_usd": random_.uniform(-10, 10),
+            "updated_at": 1704067200
+        }}, None
+
+    def _global_decentralized_finance_defi(self, random_, path_vars, params):
+        return {"data": {"defi_market_cap": str(random_.uniform(1e9, 1e11)), "eth_market_cap": str(random_.uniform(1e9, 1e12)),
+                         "defi_to_eth_ratio": str(random_.uniform(0, 100)), "trading_volume_24h": str(random_.uniform(1e8, 1e10)),
+                         "defi_dominance": str(random_.uniform(0, 10)), "top_coin_name": "Coin 0", "top_coin_defi_dominance": random_.uniform(0, 50)}}, None
+
+    def _companies_public_treasury_coin_id(self, random_, path_vars, params):
+        companies = [{"name": f"Company {index}", "symbol": f"C{index}:NASDAQ", "country": "US", "total_holdings": random_.uniform(1, 1e5),
+                      "total_entry_value_usd": random_.uniform(1e6, 1e9), "total_current_value_usd": random_.uniform(1e6, 1e9),
+                      "percentage_of_total_supply": random_.random()} for index in range(min(self.size, 100))]
+        return {"total_holdings": sum(company["total_holdings"] for company in companies), "total_value_usd": random_.uniform(1e9, 1e11),
+                "market_cap_dominance": random_.uniform(0, 5), "companies": companies}, None
+
+
+class MockServer:
+    """Local stand-in for the CoinGecko API serving Fixtures for every ApiConfig.Url route under ApiConfig.Default.BASE_PATH
+
+    Paginated routes report the total and per-page headers. Point a client at it with
+    CoingeckoApi(scheme="http", host=server.host).
+
+    @size: Number of items in list responses Default: 100
+    @latency: Seconds added to every response Default: 0
+    @rate_limit_every: Answer every n-th request with 429 Too Many Requests, 0 never does Default: 0
+    @retry_after: Retry-After header sent with injected 429 responses Default: 0
+    @seed: Random seed of the fixtures Default: 0
+    @port: Port to listen on, 0 picks a free one Default: 0
+    @process: Serve from a child process so its CPU time does not count against the client Default: False
+    """
+
+    def __init__(self, size: int = 100, latency: float = 0.0, rate_limit_every: int = 0, retry_after: float = 0, seed: int = 0,
+                 port: int = 0, process: bool = False):
+        self._options = {"size": size, "latency": latency, "rate_limit_every": rate_limit_every, "retry_after": retry_after, "seed": seed, "port": port}
+        self._process = process
+        self._server = None
+        self._child = None
+        self.port = None
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self.port}"
+
+    def start(self) -> "MockServer":
+        if self._process:
+            ports = multiprocessing.Queue()
+            self._child = multiprocessing.Process(target=MockServer._serve_forever, args=(self._options, ports), daemon=True)
+            self._child.start()
+            self.port = ports.get(timeout=30)
+        else:
+            self._server = MockServer._create_server(**self._options)
+            self.port = self._server.server_address[1]
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._child is not None:
+            self._child.terminate()
+            self._child.join()
+            self._child = None
+
+    def get_request_count(self) -> int:
+        """Requests served so far, only tracked for in-process servers"""
+
+        return self._server.request_count if self._server is not None else None
+
+    def get_connection_count(self) -> int:
+        """Connections accepted so far, only tracked for in-process servers"""
+
+        return self._server.connection_count if self._server is not None else None
+
+    def get_max_in_flight(self) -> int:
+        """Most requests handled at the same time so far, only tracked for in-process servers"""
+
+        return self._server.max_in_flight if self._server is not None else None
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @staticmethod
+    def _serve_forever(options: Dict, ports):
+        server = MockServer._create_server(**options)
+        ports.put(server.server_address[1])
+        server.serve_forever()
+
+    @staticmethod
+    def _create_server(size: int, latency: float, rate_limit_every: int, retry_after: float, seed: int, port: int) -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        server.daemon_threads = True
+        server.fixtures = Fixtures(size=size, seed=seed)
+        server.routes = MockServer._build_routes()
+        server.latency = latency
+        server.rate_limit_every = rate_limit_every
+        server.retry_after = retry_after
+        server.request_count = 0
+        server.connection_count = 0
+        server.in_flight = 0
+        server.max_in_flight = 0
+        server.lock = threading.Lock()
+        return server
+
+    @staticmethod
+    def _build_routes() -> List[Tuple]:
+        templates = [value for name, value in vars(Url).items() if not name.startswith("_")]
+        # Literal segments must win over path variables, eg. /coins/list over /coins/{coin_id}
+        templates.sort(key=lambda template: (template.count("{"), -len(template)))
+        return [(re.compile("^" + re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(template)) + "$"), template) for template in templates]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes, with Nagle's algorithm the body waits for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.request_count += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            request_count = server.request_count
+
+        try:
+            self._handle(request_count)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _handle(self, request_count: int):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+
+        if server.rate_limit_every and request_count % server.rate_limit_every == 0:
+            return self._send(429, {"status": {"error_code": 429, "error_message": "You've exceeded the Rate Limit."}}, {"Retry-After": str(server.retry_after)})
+
+        url = urlsplit(self.path)
+        path = url.path[len(ApiConfig.Default.BASE_PATH):] if url.path.startswith(ApiConfig.Default.BASE_PATH) else None
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        for pattern, template in server.routes if path is not None else []:
+            match = pattern.match(path)
+            if match:
+                body, total = server.fixtures.build(template, match.groupdict(), params)
+                headers = {}
+                if total is not None:
+                    headers = {"total": str(total), "per-page": params.get("per_page", "100")}
+                return self._send(200, body, headers)
+
+        self._send(404, {"error": "Not Found"})
+
+    def _send(self, status: int, body, headers: Dict = None):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve CoinGecko API fixtures locally")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockServer._create_server(size=args.size, latency=args.latency, rate_limit_every=args.rate_limit_every, retry_after=0, seed=0, port=args.port)
+    print(f"Serving on http://127.0.0.1:{server.server_address[1]}{ApiConfig.Default.BASE_PATH}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from benchmarks.mock_server import MockServer
+from src.api.coingecko_api import CoingeckoApi
+from src.util import RateLimiter, ResponseCache, RetryPolicy, SingleFlight
+
+START_DATE = datetime(2023, 1, 1)
+
+# One call per route, the index varies the arguments where the route takes any
+SCENARIOS: Dict[str, Callable[[CoingeckoApi, int], object]] = {
+    "get_ping": lambda api, index: api.get_ping(),
+    "get_simple_price": lambda api, index: api.get_simple_price(coin_ids=[f"coin-{index}", f"coin-{index + 1}"], vs_currencies=["usd", "eur"], include_market_cap=True),
+    "get_simple_token_price": lambda api, index: api.get_simple_token_price(asset_platform_id="ethereum", contract_addresses=[f"0x{index:040x}"], vs_currencies=["usd"]),
+    "get_simple_supported_vs_currencies": lambda api, index: api.get_simple_supported_vs_currencies(),
+    "get_coin_list": lambda api, index: api.get_coin_list(include_platform=bool(index % 2)),
+    "get_coin_markets": lambda api, index: api.get_coin_markets(vs_currency="usd", page=index + 1),
+    "get_coin": lambda api, index: api.get_coin(coin_id=f"coin-{index}"),
+    "get_coin_tickers": lambda api, index: api.get_coin_tickers(coin_id=f"coin-{index}", exchange_ids=[]),
+    "get_coin_history": lambda api, index: api.get_coin_history(coin_id=f"coin-{index}", start_date=START_DATE),
+    "get_coin_marketchart": lambda api, index: api.get_coin_marketchart(coin_id=f"coin-{index}", vs_currency="usd", days=30),
+    "get_coin_marketchart_range": lambda api, index: api.get_coin_marketchart_range(coin_id=f"coin-{index}", vs_currency="usd", from_date=START_DATE, to_date=START_DATE + timedelta(days=30)),
+    "get_coin_status_updates": lambda api, index: api.get_coin_status_updates(coin_id=f"coin-{index}"),
+    "get_coin_ohlc": lambda api, index: api.get_coin_ohlc(coin_id=f"coin-{index}", vs_currency="usd", days=30),
+    "get_coin_contract": lambda api, index: api.get_coin_contract(asset_platform_id="ethereum", contract_address=f"0x{index:040x}"),
+    "get_coin_contract_market_chart": lambda api, index: api.get_coin_contract_market_chart(asset_platform_id="ethereum", contract_address=f"0x{index:040x}", vs_currency="usd", days=30),
+    "get_coin_contract_market_chart_range": lambda api, index: api.get_coin_contract_market_chart_range(asset_platform_id="ethereum", contract_address=f"0x{index:040x}", vs_currency="usd",
+                                                                                                        from_date=START_DATE, to_date=START_DATE + timedelta(days=30)),
+    "get_asset_platforms": lambda api, index: api.get_asset_platforms(),
+    "get_coin_category_list": lambda api, index: api.get_coin_category_list(),
+    "get_coin_categories": lambda api, index: api.get_coin_categories(),
+    "get_exchanges": lambda api, index: api.get_exchanges(page=index + 1),
+    "get_exchange_list": lambda api, index: api.get_exchange_list(),
+    "get_exchange": lambda api, index: api.get_exchange(exchange_id=f"exchange-{index}"),
+    "get_exchange_tickers": lambda api, index: api.get_exchange_tickers(exchange_id=f"exchange-{index}"),
+    "get_exchange_statusupdates": lambda api, index: api.get_exchange_statusupdates(exchange_id=f"exchange-{index}"),
+    "get_exchange_volumechart": lambda api, index: api.get_exchange_volumechart(exchange_id=f"exchange-{index}", days=30),
+    "get_finance_platforms": lambda api, index: api.get_finance_platforms(),
+    "get_finance_products": lambda api, index: api.get_finance_products(page=index + 1),
+    "get_indexes": lambda api, index: api.get_indexes(page=index + 1),
+    "get_index_market": lambda api, index: api.get_index_market(market_id=f"market-{index}", index_id="BTC"),
+    "get_index_list": lambda api, index: api.get_index_list(),
+    "get_derivatives": lambda api, index: api.get_derivatives(),
+    "get_derivative_exchanges": lambda api, index: api.get_derivative_exchanges(page=index + 1),
+    "get_derivative_exchange": lambda api, index: api.get_derivative_exchange(exchange_id=f"exchange-{index}-futures"),
+    "get_derivative_exchange_list": lambda api, index: api.get_derivative_exchange_list(),
+    "get_status_update": lambda api, index: api.get_status_update(category="general", page=index + 1),
+    "get_exchange_rates": lambda api, index: api.get_exchange_rates(),
+    "get_search": lambda api, index: api.get_search(query=f"coin{index}"),
+    "get_search_trending": lambda api, index: api.get_search_trending(),
+    "get_global": lambda api, index: api.get_global(),
+    "get_global_defi": lambda api, index: api.get_global_defi(),
+    "get_companies_public_treasury": lambda api, index: api.get_companies_public_treasury(coin_id=f"coin-{index}")
+}
+
+
+def create_api(host: str) -> CoingeckoApi:
+    """Client against the mock server without rate limiting, retries, response caching or coalescing so every call reaches it"""
+
+    return CoingeckoApi(scheme="http", host=host, rate_limiter=RateLimiter(None), retry_policy=RetryPolicy.disabled(), response_cache=ResponseCache(ttls={}),
+                        single_flight=SingleFlight.disabled())
+
+
+def get_percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * percentile / 100), len(ordered) - 1)]
+
+
+def run_scenario(host: str, name: str, calls: int, concurrency: int) -> Dict:
+    """Time calls of a scenario spread over concurrency threads, then measure the peak memory of a single call"""
+
+    scenario = SCENARIOS[name]
+    with create_api(host) as api:
+        scenario(api, 0)
+        api.metrics.reset()
+
+        def timed_call(index: int):
+            start = time.perf_counter()
+            try:
+                scenario(api, index)
+                return time.perf_counter() - start, None
+            except Exception as error:
+                return time.perf_counter() - start, error
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(timed_call, range(calls)))
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+
+        endpoints = api.metrics.snapshot()
+        latencies = [latency for latency, _ in results]
+
+        tracemalloc.start()
+        scenario(api, calls)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "name": name,
+        "endpoints": sorted(endpoints),
+        "calls": calls,
+        "concurrency": concurrency,
+        "errors": sum(1 for _, error in results if error is not None),
+        "http_requests": sum(endpoint["requests"] for endpoint in endpoints.values()),
+        "response_bytes": sum(endpoint["bytes"] for endpoint in endpoints.values()),
+        "throughput": calls / wall,
+        "latency_p50_ms": get_percentile(latencies, 50) * 1000,
+        "latency_p99_ms": get_percentile(latencies, 99) * 1000,
+        "latency_mean_ms": statistics.mean(latencies) * 1000,
+        "cpu_seconds": cpu,
+        "cpu_per_call_ms": cpu / calls * 1000,
+        "peak_memory_per_call_bytes": peak_memory
+    }
+
+
+def run_benchmarks(names: List[str] = None, calls: int = 200, concurrency: int = 8, size: int = 100, latency: float = 0.0) -> Dict:
+    """Run the scenarios against a mock server in a child process and return a JSON-serializable report"""
+
+    with MockServer(size=size, latency=latency, process=True) as server:
+        results = [run_scenario(server.host, name, calls, concurrency) for name in (names or list(SCENARIOS))]
+
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"calls": calls, "concurrency": concurrency, "size": size, "latency": latency},
+        "results": results
+    }
+
+
+def compare(report: Dict, baseline: Dict) -> List[Dict]:
+    """Ratio of every shared scenario metric to the baseline report, above 1 is slower or heavier except for throughput"""
+
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+    comparisons = []
+    for result in report["results"]:
+        baseline_result = baseline_results.get(result["name"])
+        if baseline_result is None:
+            continue
+
+        comparisons.append({
+            "name": result["name"],
+            **{metric: result[metric] / baseline_result[metric] if baseline_result[metric] else None
+               for metric in ("throughput", "latency_p50_ms", "latency_p99_ms", "cpu_per_call_ms", "peak_memory_per_call_bytes")}
+        })
+
+    return comparisons
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CoingeckoApi against a local mock server")
+    parser.add_argument("scenarios", nargs="*", help=f"Scenarios to run, all by default: {', '.join(SCENARIOS)}")
+    parser.add_argument("--calls", type=int, default=200, help="Calls per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="Threads issuing calls")
+    parser.add_argument("--size", type=int, default=100, help="Items in list responses")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the server waits before answering")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON report of a previous run to compare against")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(unknown)}")
+
+    report = run_benchmarks(args.scenarios, calls=args.calls, concurrency=args.concurrency, size=args.size, latency=args.latency)
+    if args.baseline:
+        with open(args.baseline) as file:
+            report["comparison"] = compare(report, json.load(file))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
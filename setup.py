@@ -3,7 +3,7 @@ import setuptools
 setuptools.setup(
     name='cg_api',
     version='1.0.1',
-    packages=['src',],
+    packages=setuptools.find_packages(include=['src', 'src.*']),
     license='MIT',
     description = 'Python project for CoingeckoAPI',
     long_description=open('README.md').read(),
@@ -11,6 +11,10 @@ setuptools.setup(
     author = 'Emre Bekar',
     author_email = 'emre.bekar@hotmail.com.tr',
     install_requires=['requests'],
+    extras_require={
+        'async': ['aiohttp'],
+        'numpy': ['numpy'],
+    },
     url = 'https://github.com/emrebekar/cg_api',
     download_url = 'https://github.com/emrebekar/coingeckoapi/archive/cg_api-1.0.1.tar.gz',
     classifiers=[
@@ -1,5 +1,38 @@
-from .api.coingecko_api import CoingeckoApi
+from typing import TYPE_CHECKING
+
+from .util.import_util import ImportUtil
+
+if TYPE_CHECKING:
+    from .api.coingecko_api import CoingeckoApi
+    from .api.async_coingecko_api import AsyncCoingeckoApi
+    from .util.api_error import ApiError, ClientError, NotFoundError, RateLimitError, ServerError
+
+# The clients and their HTTP stack are imported on first attribute access (PEP 562) so importing the package stays cheap
+_EXPORTS = {
+    "CoingeckoApi": ".api.coingecko_api",
+    "AsyncCoingeckoApi": ".api.async_coingecko_api",
+    "ApiError": ".util.api_error",
+    "ClientError": ".util.api_error",
+    "NotFoundError": ".util.api_error",
+    "RateLimitError": ".util.api_error",
+    "ServerError": ".util.api_error"
+}
+
+
+def __getattr__(name: str):
+    return ImportUtil.get_lazy_attribute(__name__, _EXPORTS, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
-    "CoingeckoApi"
+    "CoingeckoApi",
+    "AsyncCoingeckoApi",
+    "ApiError",
+    "ClientError",
+    "NotFoundError",
+    "RateLimitError",
+    "ServerError"
 ]
\ No newline at end of file
@@ -1,18 +1,277 @@
-from telnetlib import AO
 from src.config import ApiConfig
-from src.util import ApiUtil
+from src.model import MarketChart, OhlcSeries, VolumeSeries
+from src.util import ApiUtil, BulkProgress, BulkResult, DiskCache, HttpSession, PriorityScheduler, RateLimiter, RequestMetrics, ResponseCache, RetryPolicy, SingleFlight, TimeRangeUtil, ValidatorCache
 from datetime import datetime, date
 
-from typing import List, Dict
+import math
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from typing import Callable, Iterable, Iterator, List, Dict, Tuple
 
 
 class CoingeckoApi:
 
-    def __init__(self, scheme: str = ApiConfig.Default.SCHEME, host: str = ApiConfig.Default.HOST, base_path: str = ApiConfig.Default.BASE_PATH, api_key: str = None):
+    def __init__(self, scheme: str = ApiConfig.Default.SCHEME, host: str = ApiConfig.Default.HOST, base_path: str = ApiConfig.Default.BASE_PATH, api_key: str = None,
+                 pool_connections: int = ApiConfig.Pool.CONNECTIONS, pool_maxsize: int = ApiConfig.Pool.MAX_SIZE, keep_alive: float = ApiConfig.Pool.KEEP_ALIVE,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None, response_cache: ResponseCache = None,
+                 disk_cache: DiskCache = None, single_flight: SingleFlight = None, validator_cache: ValidatorCache = None,
+                 metrics: RequestMetrics = None, transport=None, scheduler: PriorityScheduler = None):
+        if scheduler is not None:
+            if rate_limiter is not None and rate_limiter is not scheduler.rate_limiter:
+                raise ValueError("rate_limiter must be the rate_limiter of scheduler, requests take their tokens from the scheduler")
+            if not scheduler.is_sized_for(api_key):
+                raise ValueError("scheduler was sized for another plan than api_key, create it with PriorityScheduler(api_key=api_key) or pass it a rate_limiter")
+
         self._scheme = scheme
         self._host = host
         self._base_path = base_path
         self._api_key = api_key
+        self._scheduler = scheduler
+        self._rate_limiter = rate_limiter if rate_limiter is not None else scheduler.rate_limiter if scheduler is not None else RateLimiter.for_plan(api_key)
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._response_cache = response_cache if response_cache is not None else ResponseCache(ttls={})
+        self._disk_cache = disk_cache
+        self._single_flight = single_flight if single_flight is not None else SingleFlight()
+        self._validator_cache = validator_cache
+        self._metrics = metrics if metrics is not None else RequestMetrics()
+        self._session = transport if transport is not None else HttpSession(pool_connections=pool_connections, pool_maxsize=pool_maxsize, keep_alive=keep_alive)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the pooled connections owned by this client"""
+
+        self._session.close()
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        return self._response_cache
+
+    @property
+    def disk_cache(self) -> DiskCache:
+        return self._disk_cache
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        return self._single_flight
+
+    @property
+    def validator_cache(self) -> ValidatorCache:
+        return self._validator_cache
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        return self._metrics
+
+    @property
+    def scheduler(self) -> PriorityScheduler:
+        return self._scheduler
+
+    def _send_request(self, method: str, path: str, path_vars: Dict, query_params: Dict) -> Tuple:
+        key = ApiUtil.build_request_key(method, path, path_vars, query_params)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._metrics.record_cache_hit(path, "memory")
+            return cached
+
+        return self._single_flight.do(key, lambda: self._send_uncached_request(key=key, method=method, path=path, path_vars=path_vars, query_params=query_params))
+
+    def _send_uncached_request(self, key: Tuple, method: str, path: str, path_vars: Dict, query_params: Dict) -> Tuple:
+        result = self._disk_cache.get(key) if self._disk_cache is not None else None
+        size = None
+        if result is not None:
+            self._metrics.record_cache_hit(path, "disk")
+        else:
+            headers = self._validator_cache.get_headers(key) if self._validator_cache is not None else None
+            timings = {}
+            result = self._send_request_with_retry(method=method, path=path, path_vars=path_vars, query_params=query_params, headers=headers, timings=timings)
+            size = timings.get("bytes")
+            if self._validator_cache is not None:
+                if result[1] is ApiUtil.NOT_MODIFIED:
+                    self._metrics.record_cache_hit(path, "not_modified")
+                    size = self._validator_cache.get_size(key)
+
+                result = self._validator_cache.revalidate(key, result, size)
+                if result is None:
+                    # The stored response was evicted while revalidating, fetch it again unconditionally
+                    result = self._send_request_with_retry(method=method, path=path, path_vars=path_vars, query_params=query_params, timings=timings)
+                    size = timings.get("bytes")
+                    result = self._validator_cache.revalidate(key, result, size)
+            if self._disk_cache is not None:
+                self._disk_cache.set(key, result)
+
+        self._response_cache.set(key, result, size)
+        return result
+
+    def _send_request_with_retry(self, method: str, path: str, path_vars: Dict, query_params: Dict, headers: Dict = None, timings: Dict = None) -> Tuple:
+        attempt = 1
+        while True:
+            if self._scheduler is not None:
+                ticket = self._scheduler.acquire(self._rate_limiter.get_weight(path))
+            else:
+                ticket = None
+                self._rate_limiter.acquire(self._rate_limiter.get_weight(path))
+
+            attempt_timings = {}
+            try:
+                result = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
+                                              method=method, path=path, path_vars=path_vars, query_params=query_params, session=self._session, headers=headers, timings=attempt_timings)
+                self._metrics.record_request(path, attempt_timings, retry=attempt > 1)
+                if timings is not None:
+                    timings.update(attempt_timings)
+                return result
+            except Exception as error:
+                self._metrics.record_request(path, attempt_timings, retry=attempt > 1, error=error)
+                if not self._retry_policy.should_retry(method, error, attempt):
+                    raise
+                delay = self._retry_policy.get_delay(attempt, error)
+            finally:
+                if ticket is not None:
+                    self._scheduler.release(ticket)
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _get_batch_chunks(self, path: str, path_vars: Dict, ids_param: str, ids: List[str], vs_currencies: List[str], max_url_length: int) -> List[List[str]]:
+        query_params = {
+            ids_param: "",
+            "vs_currencies": ",".join(vs_currencies),
+            "include_market_cap": "false",
+            "include_24hr_vol": "false",
+            "include_24hr_change": "false",
+            "include_last_updated_at": "false",
+            "x_cg_pro_api_key": self._api_key
+        }
+
+        url_length = ApiUtil.get_url_length(scheme=self._scheme, host=self._host, base_path=self._base_path, path=path, path_vars=path_vars, query_params=query_params)
+        return ApiUtil.chunk_values(ids, max(1, max_url_length - url_length))
+
+    def _get_batch(self, get_chunk, path: str, path_vars: Dict, ids_param: str, ids: List[str], vs_currencies: List[str], max_url_length: int, max_workers: int) -> Dict:
+        chunks = self._get_batch_chunks(path, path_vars, ids_param, ids, vs_currencies, max_url_length)
+
+        created_response = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for response in executor.map(ApiUtil.bind_context(get_chunk), chunks):
+                created_response.update(response)
+
+        return created_response
+
+    def fetch_many(self, method, kwargs_list: Iterable[Dict], concurrency: int = ApiConfig.Batch.MAX_WORKERS,
+                   on_progress: Callable[[BulkProgress], None] = None) -> Iterator[BulkResult]:
+        """Call an endpoint method once per kwargs on a bounded thread pool and yield results as they complete. Failures are captured per item instead of aborting the batch.
+
+        @method: Endpoint method or its name, eg. "get_coin" or api.get_coin_ohlc
+        @kwargs_list: Keyword arguments of each call, consumed lazily
+        @concurrency: Maximum number of calls in flight Default: ApiConfig.Batch.MAX_WORKERS
+        @on_progress: Called with the running BulkProgress after every completed call
+        """
+
+        method = getattr(self, method) if isinstance(method, str) else method
+        progress = BulkProgress()
+
+        def call(index: int, kwargs: Dict) -> BulkResult:
+            started_at = time.monotonic()
+            try:
+                return BulkResult(index, kwargs, result=method(**kwargs), elapsed=time.monotonic() - started_at)
+            except Exception as error:
+                return BulkResult(index, kwargs, error=error, elapsed=time.monotonic() - started_at)
+
+        call = ApiUtil.bind_context(call)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = set()
+            for index, kwargs in enumerate(kwargs_list):
+                pending.add(executor.submit(call, index, kwargs))
+                if len(pending) < concurrency:
+                    continue
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from self._complete_bulk_results(done, progress, on_progress)
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from self._complete_bulk_results(done, progress, on_progress)
+
+    @staticmethod
+    def _complete_bulk_results(done, progress: BulkProgress, on_progress: Callable[[BulkProgress], None]) -> Iterator[BulkResult]:
+        for future in done:
+            bulk_result = future.result()
+            progress.add(bulk_result)
+            if on_progress is not None:
+                on_progress(progress)
+            yield bulk_result
+
+    def _iter_pages(self, get_page: Callable[[int], Tuple], start_page: int, prefetch: int) -> Iterator:
+        """Stream the items of consecutive pages. get_page(page) returns (items, total, per_page), total is None when the endpoint does not report it
+
+        With prefetch the first page is fetched alone, then up to prefetch following pages are fetched ahead. Pages are
+        never scheduled past the total, and on endpoints without a total no new page is scheduled once a short or empty
+        page has been received.
+        """
+
+        executor = ThreadPoolExecutor(max_workers=prefetch) if prefetch > 0 else None
+        pending = deque()
+        page = start_page
+        next_page = start_page
+        last_page = None
+
+        try:
+            while last_page is None or page <= last_page:
+                if executor is None:
+                    items, total, per_page = get_page(page)
+                else:
+                    if page > start_page:
+                        last_page = CoingeckoApi._get_prefetched_last_page(pending, last_page)
+                        while len(pending) <= prefetch and (last_page is None or next_page <= last_page):
+                            pending.append((next_page, executor.submit(ApiUtil.bind_context(get_page), next_page)))
+                            next_page += 1
+                    else:
+                        pending.append((next_page, executor.submit(ApiUtil.bind_context(get_page), next_page)))
+                        next_page += 1
+
+                    items, total, per_page = pending.popleft()[1].result()
+
+                if not items:
+                    return
+
+                yield from items
+
+                if total is not None:
+                    last_page = math.ceil(total / per_page)
+                elif len(items) < per_page:
+                    return
+
+                page += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _get_prefetched_last_page(pending: deque, last_page: int) -> int:
+        """Lower last_page to the first short or empty page among the prefetched pages that already completed"""
+
+        for page, future in pending:
+            if not future.done() or future.exception() is not None:
+                continue
+
+            items, total, per_page = future.result()
+            if total is not None:
+                page_count = math.ceil(total / per_page)
+            elif len(items) < per_page:
+                page_count = page if items else page - 1
+            else:
+                continue
+            last_page = page_count if last_page is None else min(last_page, page_count)
+        return last_page
 
     def get_ping(self) -> Dict:
         """Check API server status"""
@@ -22,8 +281,7 @@ class CoingeckoApi:
         query_params = {
             "x_cg_pro_api_key": self._api_key
         }
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-                                           method="GET", path=ApiConfig.Url.PING, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.PING, path_vars=path_vars, query_params=query_params)
         return response
         
     def get_simple_price(self,
@@ -55,8 +313,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.SIMPLE_PRICE, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.SIMPLE_PRICE, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -93,11 +350,70 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.SIMPLE_TOKEN_PRICE, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.SIMPLE_TOKEN_PRICE, path_vars=path_vars, query_params=query_params)
 
         return response
 
+    def get_simple_price_batch(self,
+                               coin_ids: List[str],
+                               vs_currencies: List[str],
+                               include_market_cap: bool = False,
+                               include_24hr_vol: bool = False,
+                               include_24hr_change: bool = False,
+                               include_last_updated_at: bool = False,
+                               max_url_length: int = ApiConfig.Batch.MAX_URL_LENGTH,
+                               max_workers: int = ApiConfig.Batch.MAX_WORKERS) -> Dict:
+        """Get the current price of any number of coins. Ids are split into chunks that fit within the URL length limit, fetched in parallel under the rate limiter and merged.
+
+        @coin_ids: Id of coins, any number. Refers to get_coin_list
+        @vs_currencies: vs_currency of coins. Refers to get_supported_vs_currencies
+        @include_market_cap: True/False to include market_cap. Default: False
+        @include_24hr_vol: True/False to include 24hr_vol. Default: False
+        @include_24hr_change: True/False to include 24hr_change. Default: False
+        @include_last_updated_at: True/False to include last_updated_at. Default: False
+        @max_url_length: Maximum length of a single request URL. Default: ApiConfig.Batch.MAX_URL_LENGTH
+        @max_workers: Maximum number of chunks fetched concurrently. Default: ApiConfig.Batch.MAX_WORKERS
+        """
+
+        def get_chunk(chunk: List[str]) -> Dict:
+            return self.get_simple_price(coin_ids=chunk, vs_currencies=vs_currencies, include_market_cap=include_market_cap, include_24hr_vol=include_24hr_vol,
+                                         include_24hr_change=include_24hr_change, include_last_updated_at=include_last_updated_at)
+
+        return self._get_batch(get_chunk, ApiConfig.Url.SIMPLE_PRICE, {}, "ids", coin_ids, vs_currencies, max_url_length, max_workers)
+
+    def get_simple_token_price_batch(self,
+                                     asset_platform_id: str,
+                                     contract_addresses: List[str],
+                                     vs_currencies: List[str],
+                                     include_market_cap: bool = False,
+                                     include_24hr_vol: bool = False,
+                                     include_24hr_change: bool = False,
+                                     include_last_updated_at: bool = False,
+                                     max_url_length: int = ApiConfig.Batch.MAX_URL_LENGTH,
+                                     max_workers: int = ApiConfig.Batch.MAX_WORKERS) -> Dict:
+        """Get current price of any number of tokens for a given platform. Addresses are split into chunks that fit within the URL length limit, fetched in parallel under the rate limiter and merged.
+
+        @asset_platform_id: The id of the platform issuing tokens (See asset_platforms endpoint for list of options)
+        @contract_addresses: The contract address of tokens, any number
+        @vs_currencies: vs_currency of coins. Refers to get_simple_supported_vs_currencies
+        @include_market_cap: True/False to include market_cap. Default: False
+        @include_24hr_vol: True/False to include 24hr_vol. Default: False
+        @include_24hr_change: True/False to include 24hr_change. Default: False
+        @include_last_updated_at: True/False to include last_updated_at. Default: False
+        @max_url_length: Maximum length of a single request URL. Default: ApiConfig.Batch.MAX_URL_LENGTH
+        @max_workers: Maximum number of chunks fetched concurrently. Default: ApiConfig.Batch.MAX_WORKERS
+        """
+
+        def get_chunk(chunk: List[str]) -> Dict:
+            return self.get_simple_token_price(asset_platform_id=asset_platform_id, contract_addresses=chunk, vs_currencies=vs_currencies, include_market_cap=include_market_cap,
+                                               include_24hr_vol=include_24hr_vol, include_24hr_change=include_24hr_change, include_last_updated_at=include_last_updated_at)
+
+        path_vars = {
+            "asset_platform_id": asset_platform_id
+        }
+
+        return self._get_batch(get_chunk, ApiConfig.Url.SIMPLE_TOKEN_PRICE, path_vars, "contract_addresses", contract_addresses, vs_currencies, max_url_length, max_workers)
+
     def get_simple_supported_vs_currencies(self) -> List[str]:
         """Get list of supported_vs_currencies. """
 
@@ -107,8 +423,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.SIMPLE_SUPPORTED_VS_CURRENCIES, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.SIMPLE_SUPPORTED_VS_CURRENCIES, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -125,8 +440,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_LIST, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_LIST, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -155,7 +469,7 @@ class CoingeckoApi:
 
         query_params = {
             "vs_currency": vs_currency,
-            "ids": ",".join(coin_ids),
+            "ids": None if not coin_ids else ",".join(coin_ids),
             "category": category,
             "order": order,
             "per_page": per_page,
@@ -165,11 +479,34 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_MARKETS, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_MARKETS, path_vars=path_vars, query_params=query_params)
 
         return response
 
+    def iter_coin_markets(self,
+                          vs_currency: str,
+                          coin_ids: List[str] = None,
+                          category: str = None,
+                          order: str = None,
+                          per_page: int = 250,
+                          sparkline: bool = False,
+                          price_change_percentage: str = None,
+                          start_page: int = 1,
+                          prefetch: int = 0) -> Iterator[Dict]:
+        """Stream coin markets page by page, see get_coin_markets
+
+        @per_page: Valid values: 1..250 Total results per page Default: 250
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_coin_markets(vs_currency=vs_currency, coin_ids=coin_ids, category=category, order=order, per_page=per_page, page=page,
+                                             sparkline=sparkline, price_change_percentage=price_change_percentage)
+            return response, None, per_page
+
+        return self._iter_pages(get_page, start_page, prefetch)
+
     def get_coin(self,
                  coin_id: str,
                  localization: bool = True,
@@ -203,8 +540,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -239,10 +575,29 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_TICKERS, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_TICKERS, path_vars=path_vars, query_params=query_params)
         return response
 
+    def iter_coin_tickers(self,
+                          coin_id: str,
+                          exchange_ids: List[str],
+                          order: str = "trust_score_desc",
+                          include_exchange_logo: bool = False,
+                          depth: bool = False,
+                          start_page: int = 1,
+                          prefetch: int = 0) -> Iterator[Dict]:
+        """Stream coin tickers page by page, see get_coin_tickers
+
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_coin_tickers(coin_id=coin_id, exchange_ids=exchange_ids, page=page, order=order, include_exchange_logo=include_exchange_logo, depth=depth)
+            return response["tickers"], None, ApiConfig.Pagination.TICKERS_PER_PAGE
+
+        return self._iter_pages(get_page, start_page, prefetch)
+
     def get_coin_history(self,
                          coin_id: str,
                          start_date: date,
@@ -264,8 +619,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_HISTORY, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_HISTORY, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -273,13 +627,15 @@ class CoingeckoApi:
                              coin_id: str,
                              vs_currency: str,
                              days: int,
-                             interval: str = None) -> Dict:
+                             interval: str = None,
+                             columnar: bool = False) -> Dict:
         """Get historical market data include price, market cap, and 24h volume (granularity auto) Minutely data will be used for duration within 1 day, Hourly data will be used for duration between 1 day and 90 days, Daily data will be used for duration above 90 days.
 
         @coin_id: pass the coin id (can be obtained from get_coin_list) eg. bitcoin
         @vs_currency: The target currency of market data (usd, eur, jpy, etc.)
         @days: Data up to number of days ago (eg. 1,14,30,max)
         @interval: Data interval. Possible value: daily    
+        @columnar: Return a MarketChart of NumPy arrays instead of nested lists Default: False
         """
         path_vars = {
             "coin_id": coin_id
@@ -292,22 +648,23 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_MARKETCHART, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_MARKETCHART, path_vars=path_vars, query_params=query_params)
 
-        return response
+        return MarketChart.from_response(response) if columnar else response
 
     def get_coin_marketchart_range(self,
                                    coin_id: str,
                                    vs_currency: str,
                                    from_date: datetime,
-                                   to_date: datetime) -> Dict:
+                                   to_date: datetime,
+                                   columnar: bool = False) -> Dict:
         """Get historical market data include price, market cap, and 24h volume within a range of timestamp (granularity auto)Minutely data will be used for duration within 1 day, Hourly data will be used for duration between 1 day and 90 days, Daily data will be used for duration above 90 days.
 
         @coin_id: pass the coin id (can be obtained from get_coin_list) eg. bitcoin
         @vs_currency: The target currency of market data (usd, eur, jpy, etc.)
         @from: From date
         @to: To date   
+        @columnar: Return a MarketChart of NumPy arrays instead of nested lists Default: False
         """
 
         path_vars = {
@@ -321,10 +678,38 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_MARKETCHART_RANGE, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_MARKETCHART_RANGE, path_vars=path_vars, query_params=query_params)
 
-        return response
+        return MarketChart.from_response(response) if columnar else response
+
+    def get_coin_marketchart_range_by_granularity(self,
+                                                  coin_id: str,
+                                                  vs_currency: str,
+                                                  from_date: datetime,
+                                                  to_date: datetime,
+                                                  granularity: str = ApiConfig.Granularity.HOURLY,
+                                                  max_workers: int = ApiConfig.Batch.MAX_WORKERS,
+                                                  columnar: bool = False) -> Dict:
+        """Get historical market data within a range of timestamp at a target granularity. The range is split into equal sub-windows served at that granularity (ranges too short for it are widened backwards and trimmed), fetched in parallel under the rate limiter, then stitched, sorted and de-duplicated.
+
+        @coin_id: pass the coin id (can be obtained from get_coin_list) eg. bitcoin
+        @vs_currency: The target currency of market data (usd, eur, jpy, etc.)
+        @from_date: From date
+        @to_date: To date
+        @granularity: minutely, hourly or daily Default: hourly
+        @max_workers: Maximum number of sub-windows fetched concurrently Default: ApiConfig.Batch.MAX_WORKERS
+        @columnar: Return a MarketChart of NumPy arrays instead of nested lists Default: False
+        """
+
+        windows = TimeRangeUtil.split(from_date, to_date, TimeRangeUtil.get_granularity_window(granularity), TimeRangeUtil.get_granularity_min_window(granularity))
+
+        def get_window(window: Tuple[datetime, datetime]) -> Dict:
+            return self.get_coin_marketchart_range(coin_id=coin_id, vs_currency=vs_currency, from_date=window[0], to_date=window[1])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            response = TimeRangeUtil.merge_market_charts(list(executor.map(ApiUtil.bind_context(get_window), windows)), from_date, to_date)
+
+        return MarketChart.from_response(response) if columnar else response
 
     def get_coin_status_updates(self,
                                 coin_id: str,
@@ -347,24 +732,45 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        header, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_STATUS_UPDATES, path_vars=path_vars, query_params=query_params)
+        header, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_STATUS_UPDATES, path_vars=path_vars, query_params=query_params)
 
-        response["page"] = page
-        response["per_page"] = int(header["Per-Page"])
-        response["total"] = int(header["Total"])
+        created_response = {
+            **response,
+            "page": page,
+            "per_page": int(header["Per-Page"]),
+            "total": int(header["Total"])
+        }
 
-        return response
+        return created_response
+
+    def iter_coin_status_updates(self,
+                                 coin_id: str,
+                                 per_page: int = 100,
+                                 start_page: int = 1,
+                                 prefetch: int = 0) -> Iterator[Dict]:
+        """Stream status updates for a given coin page by page, see get_coin_status_updates
+
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_coin_status_updates(coin_id=coin_id, per_page=per_page, page=page)
+            return response["status_updates"], response["total"], response["per_page"]
+
+        return self._iter_pages(get_page, start_page, prefetch)
 
     def get_coin_ohlc(self,
                       coin_id: str,
                       vs_currency: str,
-                      days: int) -> List[Dict]:
+                      days: int,
+                      compact: bool = False) -> List[Dict]:
         """Candle's body:1-2 days: 30 minutes 3-30 days: 4 hours 31 and before: 4 days
 
         @coin_id: Pass the coin id (can be obtained from get_coin_list) eg. bitcoin
         @vs_currency: The target currency of market data (usd, eur, jpy, etc.)
         @days:  Data up to number of days ago (1/7/14/30/90/180/365)
+        @compact: Return an array-backed OhlcSeries instead of a list of dicts Default: False
         """
         path_vars = {
             "coin_id": coin_id
@@ -376,8 +782,10 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_OHLC, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_OHLC, path_vars=path_vars, query_params=query_params)
+
+        if compact:
+            return OhlcSeries.from_response(response)
 
         created_response = []
         for response_item in response:
@@ -411,8 +819,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_CONTRACT, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_CONTRACT, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -420,13 +827,15 @@ class CoingeckoApi:
                                        asset_platform_id: str,
                                        contract_address: str,
                                        vs_currency: str,
-                                       days: int) -> Dict:
+                                       days: int,
+                                       columnar: bool = False) -> Dict:
         """Get historical market data include price, market cap, and 24h volume (granularity auto)
 
         @asset_platform_id: The id of the platform issuing tokens (Only `ethereum` is supported for now)
         @contract_address: Token's contract address
         @vs_currency: The target currency of market data (usd, eur, jpy, etc.)
         @days: Data up to number of days ago (eg. 1,14,30,max)
+        @columnar: Return a MarketChart of NumPy arrays instead of nested lists Default: False
         """
         path_vars = {
             "asset_platform_id": asset_platform_id,
@@ -439,17 +848,17 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_CONTRACT_MARKET_CHART, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_CONTRACT_MARKET_CHART, path_vars=path_vars, query_params=query_params)
 
-        return response
+        return MarketChart.from_response(response) if columnar else response
 
     def get_coin_contract_market_chart_range(self,
                                              asset_platform_id: str,
                                              contract_address: str,
                                              vs_currency: str,
                                              from_date: datetime,
-                                             to_date: datetime) -> Dict:
+                                             to_date: datetime,
+                                             columnar: bool = False) -> Dict:
         """Get historical market data include price, market cap, and 24h volume within a range of timestamp (granularity auto)
 
         @asset_platform_id: The id of the platform issuing tokens (Only `ethereum` is supported for now)
@@ -457,6 +866,7 @@ class CoingeckoApi:
         @vs_currency: The target currency of market data (usd, eur, jpy, etc.)
         @from_date: From date
         @to_date: To date
+        @columnar: Return a MarketChart of NumPy arrays instead of nested lists Default: False
         """
 
         path_vars = {
@@ -471,10 +881,9 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_CONTRACT_MARKET_CHART_RANGE, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_CONTRACT_MARKET_CHART_RANGE, path_vars=path_vars, query_params=query_params)
 
-        return response
+        return MarketChart.from_response(response) if columnar else response
 
     def get_asset_platforms(self) -> List[Dict]:
         """List all asset platforms (Blockchain networks)"""
@@ -485,8 +894,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.ASSET_PLATFORMS, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.ASSET_PLATFORMS, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -499,8 +907,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_CATEGORY_LIST, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_CATEGORY_LIST, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -516,8 +923,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COIN_CATEGORIES, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COIN_CATEGORIES, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -537,8 +943,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        header, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.EXCHANGES, path_vars=path_vars, query_params=query_params)
+        header, response = self._send_request(method="GET", path=ApiConfig.Url.EXCHANGES, path_vars=path_vars, query_params=query_params)
 
         created_response = {
             "exchanges": response,
@@ -549,6 +954,22 @@ class CoingeckoApi:
 
         return created_response
 
+    def iter_exchanges(self,
+                       per_page: int = 100,
+                       start_page: int = 1,
+                       prefetch: int = 0) -> Iterator[Dict]:
+        """Stream all exchanges page by page, see get_exchanges
+
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_exchanges(page=page, per_page=per_page)
+            return response["exchanges"], response["total"], response["per_page"]
+
+        return self._iter_pages(get_page, start_page, prefetch)
+
     def get_exchange_list(self) -> List[Dict]:
         """List all supported markets id and name (no pagination required). Use this to obtain all the markets' id in order to make API calls"""
 
@@ -558,8 +979,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.EXCHANGE_LIST, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.EXCHANGE_LIST, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -578,8 +998,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.EXCHANGE, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.EXCHANGE, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -614,8 +1033,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        header, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.EXCHANGE_TICKERS, path_vars=path_vars, query_params=query_params)
+        header, response = self._send_request(method="GET", path=ApiConfig.Url.EXCHANGE_TICKERS, path_vars=path_vars, query_params=query_params)
 
         created_response = {
             "exchange_tickers": response,
@@ -625,6 +1043,26 @@ class CoingeckoApi:
         }
         return created_response
 
+    def iter_exchange_tickers(self,
+                              exchange_id: str,
+                              coin_ids: List[str] = None,
+                              include_exchange_logo: bool = False,
+                              depth: str = None,
+                              order: str = "trust_score_desc",
+                              start_page: int = 1,
+                              prefetch: int = 0) -> Iterator[Dict]:
+        """Stream exchange tickers page by page, see get_exchange_tickers
+
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_exchange_tickers(exchange_id=exchange_id, coin_ids=coin_ids, page=page, include_exchange_logo=include_exchange_logo, depth=depth, order=order)
+            return response["exchange_tickers"]["tickers"], response["total"], response["per_page"]
+
+        return self._iter_pages(get_page, start_page, prefetch)
+
     def get_exchange_statusupdates(self,
                                    exchange_id: str,
                                    per_page: int = 100,
@@ -645,8 +1083,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        header, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.EXCHANGE_STATUSUPDATES, path_vars=path_vars, query_params=query_params)
+        header, response = self._send_request(method="GET", path=ApiConfig.Url.EXCHANGE_STATUSUPDATES, path_vars=path_vars, query_params=query_params)
 
         created_response = {
             "exchange_tickers": response,
@@ -658,11 +1095,29 @@ class CoingeckoApi:
 
         return created_response
 
-    def get_exchange_volumechart(self, exchange_id: str, days: int) -> List[List]:
+    def iter_exchange_statusupdates(self,
+                                    exchange_id: str,
+                                    per_page: int = 100,
+                                    start_page: int = 1,
+                                    prefetch: int = 0) -> Iterator[Dict]:
+        """Stream status updates for a given exchange page by page, see get_exchange_statusupdates
+
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_exchange_statusupdates(exchange_id=exchange_id, per_page=per_page, page=page)
+            return response["exchange_tickers"]["status_updates"], response["total"], response["per_page"]
+
+        return self._iter_pages(get_page, start_page, prefetch)
+
+    def get_exchange_volumechart(self, exchange_id: str, days: int, compact: bool = False) -> List[List]:
         """Get volume_chart data for a given exchange
 
         @exchange_id: Pass the exchange id (can be obtained from get_exchange_list) eg. binance
         @days: Data up to number of days ago (eg. 1,14,30)
+        @compact: Return an array-backed VolumeSeries instead of a list of dicts Default: False
         """
 
         path_vars = {
@@ -674,8 +1129,10 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.EXCHANGE_VOLUMECHART, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.EXCHANGE_VOLUMECHART, path_vars=path_vars, query_params=query_params)
+
+        if compact:
+            return VolumeSeries.from_response(response)
 
         created_response = []
         for response_item in response:
@@ -695,8 +1152,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.FINANCE_PLATFORMS, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.FINANCE_PLATFORMS, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -723,8 +1179,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        header, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.FINANCE_PRODUCTS, path_vars=path_vars, query_params=query_params)
+        header, response = self._send_request(method="GET", path=ApiConfig.Url.FINANCE_PRODUCTS, path_vars=path_vars, query_params=query_params)
 
         created_response = {
             "finance_products": response,
@@ -734,6 +1189,24 @@ class CoingeckoApi:
         }
         return created_response
 
+    def iter_finance_products(self,
+                              start_at: datetime = None,
+                              end_at: datetime = None,
+                              per_page: int = 100,
+                              start_page: int = 1,
+                              prefetch: int = 0) -> Iterator[Dict]:
+        """Stream all finance products page by page, see get_finance_products
+
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_finance_products(start_at=start_at, end_at=end_at, per_page=per_page, page=page)
+            return response["finance_products"], response["total"], response["per_page"]
+
+        return self._iter_pages(get_page, start_page, prefetch)
+
     def get_indexes(self,
                     per_page: int = 100,
                     page: int = 1) -> Dict:
@@ -751,9 +1224,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        header, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-
-            method="GET", path=ApiConfig.Url.INDEXES, path_vars=path_vars, query_params=query_params)
+        header, response = self._send_request(method="GET", path=ApiConfig.Url.INDEXES, path_vars=path_vars, query_params=query_params)
 
         created_response = {
             "finance_products": response,
@@ -764,6 +1235,22 @@ class CoingeckoApi:
 
         return created_response
 
+    def iter_indexes(self,
+                     per_page: int = 100,
+                     start_page: int = 1,
+                     prefetch: int = 0) -> Iterator[Dict]:
+        """Stream all market indexes page by page, see get_indexes
+
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_indexes(per_page=per_page, page=page)
+            return response["finance_products"], response["total"], response["per_page"]
+
+        return self._iter_pages(get_page, start_page, prefetch)
+
     def get_index_market(self, market_id: str, index_id: str) -> Dict:
         """Get market index by market id and index id 
 
@@ -780,8 +1267,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.INDEX_MARKET, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.INDEX_MARKET, path_vars=path_vars, query_params=query_params)
         return response
 
     def get_index_list(self) -> List[Dict]:
@@ -793,8 +1279,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.INDEX_LIST, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.INDEX_LIST, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -811,8 +1296,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.DERIVATIVES, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.DERIVATIVES, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -836,11 +1320,27 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.DERIVATIVE_EXCHANGES, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.DERIVATIVE_EXCHANGES, path_vars=path_vars, query_params=query_params)
 
         return response
 
+    def iter_derivative_exchanges(self,
+                                  order: str = None,
+                                  per_page: int = 100,
+                                  start_page: int = 1,
+                                  prefetch: int = 0) -> Iterator[Dict]:
+        """Stream all derivative exchanges page by page, see get_derivative_exchanges
+
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_derivative_exchanges(order=order, per_page=per_page, page=page)
+            return response, None, per_page
+
+        return self._iter_pages(get_page, start_page, prefetch)
+
     def get_derivative_exchange(self, exchange_id: str, include_tickers: List[str] = None) -> Dict:
         """Show derivative exchange data
 
@@ -857,8 +1357,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.DERIVATIVE_EXCHANGE, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.DERIVATIVE_EXCHANGE, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -871,8 +1370,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.DERIVATIVE_EXCHANGE_LIST, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.DERIVATIVE_EXCHANGE_LIST, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -899,14 +1397,34 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        header, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.STATUS_UPDATE, path_vars=path_vars, query_params=query_params)
+        header, response = self._send_request(method="GET", path=ApiConfig.Url.STATUS_UPDATE, path_vars=path_vars, query_params=query_params)
         
-        response["page"] = page
-        response["per_page"] = int(header["per-page"])
-        response["total"] = int(header["total"])
+        created_response = {
+            **response,
+            "page": page,
+            "per_page": int(header["per-page"]),
+            "total": int(header["total"])
+        }
 
-        return response
+        return created_response
+
+    def iter_status_updates(self,
+                            category: str,
+                            project_type: str = None,
+                            per_page: int = 100,
+                            start_page: int = 1,
+                            prefetch: int = 0) -> Iterator[Dict]:
+        """Stream all status updates page by page, see get_status_update
+
+        @start_page: Page to start (or resume) from Default: 1
+        @prefetch: Number of following pages fetched concurrently while the current one is consumed Default: 0
+        """
+
+        def get_page(page: int) -> Tuple:
+            response = self.get_status_update(category=category, project_type=project_type, per_page=per_page, page=page)
+            return response["status_updates"], response["total"], response["per_page"]
+
+        return self._iter_pages(get_page, start_page, prefetch)
 
     def get_exchange_rates(self) -> Dict:
         """Get BTC-to-Currency exchange rates"""
@@ -917,8 +1435,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.EXCHANGE_RATES, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.EXCHANGE_RATES, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -935,8 +1452,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.SEARCH, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.SEARCH, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -949,8 +1465,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.SEARCH_TRENDING, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.SEARCH_TRENDING, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -963,8 +1478,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.GLOBAL, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.GLOBAL, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -977,8 +1491,7 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.GLOBAL_DEFI, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.GLOBAL_DEFI, path_vars=path_vars, query_params=query_params)
 
         return response
 
@@ -996,7 +1509,6 @@ class CoingeckoApi:
             "x_cg_pro_api_key": self._api_key
         }
 
-        _, response = ApiUtil.send_request(scheme=self._scheme, host=self._host, base_path=self._base_path,
-            method="GET", path=ApiConfig.Url.COMPANIES_PUBLIC_TREASURY, path_vars=path_vars, query_params=query_params)
+        _, response = self._send_request(method="GET", path=ApiConfig.Url.COMPANIES_PUBLIC_TREASURY, path_vars=path_vars, query_params=query_params)
 
         return response
\ No newline at end of file
@@ -46,3 +46,91 @@ class ApiConfig:
         SCHEME = "https"
         HOST = "api.coingecko.com"
         BASE_PATH = "/api/v3"
+
+    class Pool:
+        CONNECTIONS = 10
+        MAX_SIZE = 10
+        KEEP_ALIVE = 60
+        MAX_CONCURRENCY = 100
+
+    class RateLimit:
+        FREE_CALLS_PER_MINUTE = 30
+        PRO_CALLS_PER_MINUTE = 500
+        BURST = 5
+
+    class Retry:
+        MAX_ATTEMPTS = 3
+        BACKOFF_FACTOR = 0.5
+        MAX_BACKOFF = 30
+        STATUS_CODES = (429, 500, 502, 503, 504)
+        METHODS = ("GET",)
+
+    class Cache:
+        MAX_ENTRIES = 1024
+        MAX_BYTES = 64 * 1024 * 1024
+
+    class Batch:
+        MAX_URL_LENGTH = 2000
+        MAX_WORKERS = 4
+
+    class Granularity:
+        MINUTELY = "minutely"
+        HOURLY = "hourly"
+        DAILY = "daily"
+        MINUTELY_WINDOW = 23 * 60 * 60
+        HOURLY_WINDOW = 89 * 24 * 60 * 60
+        HOURLY_MIN_WINDOW = 2 * 24 * 60 * 60
+        DAILY_MIN_WINDOW = 91 * 24 * 60 * 60
+
+    class Pagination:
+        TICKERS_PER_PAGE = 100
+
+    class Sync:
+        INITIAL_DAYS = 90
+
+    class DiskCache:
+        SAFETY_MARGIN = 2 * 60 * 60
+
+    class Conditional:
+        MAX_ENTRIES = 256
+        MAX_BYTES = 16 * 1024 * 1024
+
+    class Metrics:
+        BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    class Search:
+        TTL = 60 * 60
+        LIMIT = 25
+        SCAN_FACTOR = 4
+        FUZZY_THRESHOLD = 0.6
+        FUZZY_MIN_LENGTH = 3
+
+    class Conversion:
+        TTL = 60
+
+    class Polling:
+        UPSTREAM_INTERVAL = 60
+        MIN_INTERVAL = 1
+        COALESCE_FACTOR = 0.5
+        RETRY_DELAY = 5
+
+    class Priority:
+        INTERACTIVE = "interactive"
+        NORMAL = "normal"
+        BULK = "bulk"
+        CLASSES = (INTERACTIVE, NORMAL, BULK)
+        SHARES = {INTERACTIVE: 0.6, NORMAL: 0.3, BULK: 0.1}
+        CONCURRENCY = {INTERACTIVE: None, NORMAL: None, BULK: 4}
+        RESERVES = {INTERACTIVE: 0, NORMAL: 1, BULK: 2}
+
+
+ApiConfig.Cache.TTLS = {
+    ApiConfig.Url.SIMPLE_PRICE: 60,
+    ApiConfig.Url.SIMPLE_SUPPORTED_VS_CURRENCIES: 3600,
+    ApiConfig.Url.COIN_LIST: 3600,
+    ApiConfig.Url.ASSET_PLATFORMS: 3600,
+    ApiConfig.Url.COIN_CATEGORY_LIST: 3600,
+    ApiConfig.Url.EXCHANGE_LIST: 3600,
+    ApiConfig.Url.INDEX_LIST: 3600,
+    ApiConfig.Url.DERIVATIVE_EXCHANGE_LIST: 3600
+}
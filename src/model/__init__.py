@@ -0,0 +1,11 @@
+from .market_chart import MarketChart
+from .ohlc_series import Ohlc, OhlcSeries
+from .volume_series import Volume, VolumeSeries
+
+__all__ = [
+    "MarketChart",
+    "Ohlc",
+    "OhlcSeries",
+    "Volume",
+    "VolumeSeries"
+]
\ No newline at end of file
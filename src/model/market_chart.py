@@ -0,0 +1,68 @@
+from typing import Dict
+
+from src.util.import_util import ImportUtil
+
+np = ImportUtil.import_lazy("numpy")
+
+
+class MarketChart:
+    """Columnar market chart: one int64 millisecond timestamp array and one float64 array per series, aligned on the timestamps
+
+    Points missing from a series are NaN. Slicing returns views sharing memory with the original arrays.
+    """
+
+    SERIES = ("prices", "market_caps", "total_volumes")
+
+    def __init__(self, timestamps, prices, market_caps, total_volumes):
+        self.timestamps = timestamps
+        self.prices = prices
+        self.market_caps = market_caps
+        self.total_volumes = total_volumes
+
+    @staticmethod
+    def from_response(response: Dict) -> "MarketChart":
+        """Decode a market chart response of [ms_timestamp, value] pairs in bulk"""
+
+        if np is None:
+            raise ImportError("MarketChart requires numpy, install it with `pip install cg_api[numpy]`")
+
+        pairs = [np.asarray(response.get(name) or [], dtype=np.float64).reshape(-1, 2) for name in MarketChart.SERIES]
+        series_timestamps = [series[:, 0].astype(np.int64) for series in pairs]
+
+        timestamps = series_timestamps[0]
+        if all(np.array_equal(timestamps, other) for other in series_timestamps[1:]):
+            return MarketChart(timestamps, *[series[:, 1].copy() for series in pairs])
+
+        timestamps = np.unique(np.concatenate(series_timestamps))
+        values = []
+        for series, series_timestamp in zip(pairs, series_timestamps):
+            aligned = np.full(len(timestamps), np.nan)
+            aligned[np.searchsorted(timestamps, series_timestamp)] = series[:, 1]
+            values.append(aligned)
+
+        return MarketChart(timestamps, *values)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MarketChart(self.timestamps[index], self.prices[index], self.market_caps[index], self.total_volumes[index])
+
+        return int(self.timestamps[index]), float(self.prices[index]), float(self.market_caps[index]), float(self.total_volumes[index])
+
+    def __repr__(self) -> str:
+        return f"MarketChart(points={len(self)})"
+
+    def between(self, start: int = None, end: int = None) -> "MarketChart":
+        """Points with start <= timestamp < end (milliseconds), found by binary search"""
+
+        start_index = 0 if start is None else int(np.searchsorted(self.timestamps, start, side="left"))
+        end_index = len(self) if end is None else int(np.searchsorted(self.timestamps, end, side="left"))
+        return self[start_index:end_index]
+
+    def to_dict(self) -> Dict:
+        """Convert back to the response shape of nested [ms_timestamp, value] lists"""
+
+        timestamps = self.timestamps.tolist()
+        return {name: [[timestamp, value] for timestamp, value in zip(timestamps, getattr(self, name).tolist())] for name in MarketChart.SERIES}
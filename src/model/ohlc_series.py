@@ -0,0 +1,78 @@
+from array import array
+from typing import Dict, Iterator, List
+
+from src.util.import_util import ImportUtil
+
+np = ImportUtil.import_lazy("numpy")
+
+
+class Ohlc:
+    """Single candle with the same fields as the get_coin_ohlc dicts"""
+
+    __slots__ = ("date_time", "open", "close", "low", "high")
+
+    def __init__(self, date_time: int, open: float, close: float, low: float, high: float):
+        self.date_time = date_time
+        self.open = open
+        self.close = close
+        self.low = low
+        self.high = high
+
+    def to_dict(self) -> Dict:
+        return {field: getattr(self, field) for field in Ohlc.__slots__}
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Ohlc) and all(getattr(self, field) == getattr(other, field) for field in Ohlc.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Ohlc(date_time={self.date_time}, open={self.open}, close={self.close}, low={self.low}, high={self.high})"
+
+
+class OhlcSeries:
+    """Struct-of-arrays candles: one int64 array of millisecond timestamps and one float64 array per price field"""
+
+    def __init__(self, date_time: array, open: array, close: array, low: array, high: array):
+        self.date_time = date_time
+        self.open = open
+        self.close = close
+        self.low = low
+        self.high = high
+
+    @staticmethod
+    def from_response(response: List[List]) -> "OhlcSeries":
+        """Build the series from raw get_coin_ohlc rows, field order matches get_coin_ohlc"""
+
+        if not response:
+            return OhlcSeries(array("q"), array("d"), array("d"), array("d"), array("d"))
+
+        date_time, open, close, low, high = zip(*response)
+        return OhlcSeries(array("q", map(int, date_time)), array("d", open), array("d", close), array("d", low), array("d", high))
+
+    def __len__(self) -> int:
+        return len(self.date_time)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OhlcSeries(*[getattr(self, field)[index] for field in Ohlc.__slots__])
+
+        return Ohlc(*[getattr(self, field)[index] for field in Ohlc.__slots__])
+
+    def __iter__(self) -> Iterator[Ohlc]:
+        for row in zip(self.date_time, self.open, self.close, self.low, self.high):
+            yield Ohlc(*row)
+
+    def __repr__(self) -> str:
+        return f"OhlcSeries(candles={len(self)})"
+
+    def to_dicts(self) -> List[Dict]:
+        """Convert to the list of dicts returned by get_coin_ohlc"""
+
+        return [dict(zip(Ohlc.__slots__, row)) for row in zip(self.date_time, self.open, self.close, self.low, self.high)]
+
+    def to_numpy(self) -> Dict:
+        """Zero-copy NumPy views of every field"""
+
+        if np is None:
+            raise ImportError("OhlcSeries.to_numpy requires numpy, install it with `pip install cg_api[numpy]`")
+
+        return {field: np.frombuffer(getattr(self, field), dtype=np.int64 if field == "date_time" else np.float64) for field in Ohlc.__slots__}
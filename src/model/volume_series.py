@@ -0,0 +1,72 @@
+from array import array
+from typing import Dict, Iterator, List
+
+from src.util.import_util import ImportUtil
+
+np = ImportUtil.import_lazy("numpy")
+
+
+class Volume:
+    """Single volume chart point with the same fields as the get_exchange_volumechart dicts"""
+
+    __slots__ = ("date_time", "volume_chart")
+
+    def __init__(self, date_time: float, volume_chart: float):
+        self.date_time = date_time
+        self.volume_chart = volume_chart
+
+    def to_dict(self) -> Dict:
+        return {"date_time": self.date_time, "volume_chart": self.volume_chart}
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Volume) and self.date_time == other.date_time and self.volume_chart == other.volume_chart
+
+    def __repr__(self) -> str:
+        return f"Volume(date_time={self.date_time}, volume_chart={self.volume_chart})"
+
+
+class VolumeSeries:
+    """Struct-of-arrays volume chart: one float64 array of millisecond timestamps and one float64 array of volumes"""
+
+    def __init__(self, date_time: array, volume_chart: array):
+        self.date_time = date_time
+        self.volume_chart = volume_chart
+
+    @staticmethod
+    def from_response(response: List[List]) -> "VolumeSeries":
+        """Build the series from raw get_exchange_volumechart rows, volumes are parsed from their string form"""
+
+        if not response:
+            return VolumeSeries(array("d"), array("d"))
+
+        date_time, volume_chart = zip(*response)
+        return VolumeSeries(array("d", date_time), array("d", map(float, volume_chart)))
+
+    def __len__(self) -> int:
+        return len(self.date_time)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VolumeSeries(self.date_time[index], self.volume_chart[index])
+
+        return Volume(self.date_time[index], self.volume_chart[index])
+
+    def __iter__(self) -> Iterator[Volume]:
+        for date_time, volume_chart in zip(self.date_time, self.volume_chart):
+            yield Volume(date_time, volume_chart)
+
+    def __repr__(self) -> str:
+        return f"VolumeSeries(points={len(self)})"
+
+    def to_dicts(self) -> List[Dict]:
+        """Convert to the list of dicts returned by get_exchange_volumechart"""
+
+        return [{"date_time": date_time, "volume_chart": volume_chart} for date_time, volume_chart in zip(self.date_time, self.volume_chart)]
+
+    def to_numpy(self) -> Dict:
+        """Zero-copy NumPy views of every field"""
+
+        if np is None:
+            raise ImportError("VolumeSeries.to_numpy requires numpy, install it with `pip install cg_api[numpy]`")
+
+        return {"date_time": np.frombuffer(self.date_time, dtype=np.float64), "volume_chart": np.frombuffer(self.volume_chart, dtype=np.float64)}
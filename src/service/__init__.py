@@ -0,0 +1,14 @@
+from .contract_resolver import ContractResolver
+from .currency_converter import CurrencyConverter
+from .market_data_sync import MarketDataSync
+from .price_poller import PricePoller, PriceSubscription
+from .search_index import SearchIndex
+
+__all__ = [
+    "ContractResolver",
+    "CurrencyConverter",
+    "MarketDataSync",
+    "PricePoller",
+    "PriceSubscription",
+    "SearchIndex"
+]
\ No newline at end of file
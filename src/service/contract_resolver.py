@@ -0,0 +1,116 @@
+import json
+import threading
+import time
+from typing import Dict, List
+
+from src.api.coingecko_api import CoingeckoApi
+from src.util import ResponseCache
+
+
+class ContractResolver:
+    """Resolves token contract addresses to coin ids locally from a single get_coin_list(include_platform=True) call
+
+    Keeps a hash index from (asset platform id, lowercase contract address) to coin id and the reverse mapping from
+    coin id to its contract address per platform. The index is built on first use, rebuilt by refresh and can be
+    persisted with save and restored with load to skip the download on startup.
+
+    @api: Client used to fetch the coin list and prices
+    """
+
+    VERSION = 1
+
+    def __init__(self, api: CoingeckoApi):
+        self._api = api
+        self._lock = threading.Lock()
+        self._coin_ids = None
+        self._platforms = None
+        self._refreshed_at = None
+
+    @property
+    def refreshed_at(self) -> float:
+        """Unix time the index was built from the coin list, None before the first build"""
+
+        return self._refreshed_at
+
+    def refresh(self):
+        """Fetch the coin list with platforms and replace the index"""
+
+        with ResponseCache.bypass():
+            coins = self._api.get_coin_list(include_platform=True)
+
+        self._set_platforms({coin["id"]: {platform: address for platform, address in (coin.get("platforms") or {}).items() if platform and address}
+                             for coin in coins}, time.time())
+
+    def resolve(self, asset_platform_id: str, contract_address: str) -> str:
+        """Coin id of a contract address on a platform, None when it is unknown
+
+        @asset_platform_id: The id of the platform issuing tokens (See get_asset_platforms for list of options) eg. ethereum
+        @contract_address: Token's contract address, matched case-insensitively
+        """
+
+        return self._get_coin_ids().get((asset_platform_id, contract_address.strip().lower()))
+
+    def resolve_many(self, asset_platform_id: str, contract_addresses: List[str]) -> Dict[str, str]:
+        """Coin id of every known contract address on a platform, keyed by the address as passed"""
+
+        coin_ids = self._get_coin_ids()
+        resolved = {}
+        for contract_address in contract_addresses:
+            coin_id = coin_ids.get((asset_platform_id, contract_address.strip().lower()))
+            if coin_id is not None:
+                resolved[contract_address] = coin_id
+        return resolved
+
+    def get_contract_addresses(self, coin_id: str) -> Dict[str, str]:
+        """Contract address of a coin per asset platform id, empty for native coins"""
+
+        self._get_coin_ids()
+        return dict(self._platforms.get(coin_id, {}))
+
+    def get_token_prices(self, asset_platform_id: str, contract_addresses: List[str], vs_currencies: List[str], **kwargs) -> Dict[str, Dict]:
+        """Prices of contract addresses through get_simple_price_batch, keyed by the address as passed
+
+        Unknown addresses are left out. Extra keyword arguments (include_market_cap, ...) are passed to get_simple_price_batch.
+        """
+
+        resolved = self.resolve_many(asset_platform_id, contract_addresses)
+        prices = self._api.get_simple_price_batch(coin_ids=list(dict.fromkeys(resolved.values())), vs_currencies=vs_currencies, **kwargs)
+        return {contract_address: prices[coin_id] for contract_address, coin_id in resolved.items() if coin_id in prices}
+
+    def save(self, path: str):
+        """Write the index to a JSON file"""
+
+        self._get_coin_ids()
+        with self._lock:
+            snapshot = {"version": ContractResolver.VERSION, "refreshed_at": self._refreshed_at, "platforms": self._platforms}
+
+        with open(path, "w") as file:
+            json.dump(snapshot, file, separators=(",", ":"))
+
+    def load(self, path: str):
+        """Replace the index with one written by save"""
+
+        with open(path) as file:
+            snapshot = json.load(file)
+
+        if snapshot.get("version") != ContractResolver.VERSION:
+            raise ValueError(f"{path} is not a contract resolver index")
+
+        self._set_platforms(snapshot["platforms"], snapshot["refreshed_at"])
+
+    def _set_platforms(self, platforms: Dict[str, Dict[str, str]], refreshed_at: float):
+        coin_ids = {(platform, address.strip().lower()): coin_id for coin_id, addresses in platforms.items() for platform, address in addresses.items()}
+        with self._lock:
+            self._coin_ids = coin_ids
+            self._platforms = platforms
+            self._refreshed_at = refreshed_at
+
+    def _get_coin_ids(self) -> Dict:
+        with self._lock:
+            coin_ids = self._coin_ids
+
+        if coin_ids is None:
+            self.refresh()
+            coin_ids = self._coin_ids
+
+        return coin_ids
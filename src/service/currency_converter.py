@@ -0,0 +1,161 @@
+import threading
+import time
+from typing import Dict, List
+
+from src.api.coingecko_api import CoingeckoApi
+from src.config import ApiConfig
+from src.util import ResponseCache
+from src.util.import_util import ImportUtil
+
+np = ImportUtil.import_lazy("numpy")
+
+
+class CurrencyConverter:
+    """Converts amounts between every unit of get_exchange_rates locally with vectorized numpy operations
+
+    get_exchange_rates returns how many units of each fiat and crypto currency one BTC is worth, so one unit of a is
+    worth value[b] / value[a] units of b. The rate vector is cached for ttl seconds and the N×N cross rate matrix is
+    built from it on demand. Prices fetched in a single currency can be expanded to many others with convert_prices,
+    or fetched and expanded in one step with get_prices.
+
+    @api: Client used to fetch the exchange rates and prices
+    @ttl: Seconds before the exchange rates are fetched again. Default: ApiConfig.Conversion.TTL
+    """
+
+    PRICE_FIELDS = ("", "_market_cap", "_24h_vol")
+
+    def __init__(self, api: CoingeckoApi, ttl: float = ApiConfig.Conversion.TTL):
+        if np is None:
+            raise ImportError("CurrencyConverter requires numpy, install it with `pip install cg_api[numpy]`")
+
+        self._api = api
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._indices = None
+        self._values = None
+        self._cross_rates = None
+        self._refreshed_at = None
+
+    @property
+    def currencies(self) -> List[str]:
+        """Currencies known to the converter, in exchange rate order"""
+
+        indices, _ = self._get_rates()
+        return list(indices)
+
+    def refresh(self):
+        """Fetch the exchange rates and replace the rate vector"""
+
+        with ResponseCache.bypass():
+            rates = self._api.get_exchange_rates()["rates"]
+
+        indices = {currency: index for index, currency in enumerate(rates)}
+        values = np.fromiter((rate["value"] for rate in rates.values()), dtype=np.float64, count=len(rates))
+
+        with self._lock:
+            self._indices = indices
+            self._values = values
+            self._cross_rates = None
+            self._refreshed_at = time.monotonic()
+
+    def get_rate(self, from_currency: str, to_currency: str) -> float:
+        """Units of to_currency one unit of from_currency is worth"""
+
+        indices, values = self._get_rates()
+        from_index, to_index = CurrencyConverter._get_indices(indices, [from_currency, to_currency])
+        return float(values[to_index] / values[from_index])
+
+    def convert(self, amounts, from_currency: str, to_currencies: List[str]):
+        """Convert amounts to every currency of to_currencies in one operation
+
+        @amounts: Number or array like of amounts in from_currency
+        @from_currency: Currency of amounts eg. usd
+        @to_currencies: Target currencies eg. ["eur", "btc"]
+
+        Returns an array of shape amounts.shape + (len(to_currencies),) with one column per target currency
+        """
+
+        indices, values = self._get_rates()
+        from_index, *to_indices = CurrencyConverter._get_indices(indices, [from_currency] + list(to_currencies))
+        return np.multiply.outer(np.asarray(amounts, dtype=np.float64), values[to_indices] / values[from_index])
+
+    def get_cross_rates(self, currencies: List[str] = None):
+        """N×N matrix whose [i, j] entry is the units of currencies[j] one unit of currencies[i] is worth
+
+        @currencies: Rows and columns of the matrix. Default: every currency, in the order of the currencies property
+        """
+
+        indices, values = self._get_rates()
+        if currencies is not None:
+            selected = values[CurrencyConverter._get_indices(indices, currencies)]
+            return selected[np.newaxis, :] / selected[:, np.newaxis]
+
+        with self._lock:
+            cross_rates = self._cross_rates if self._values is values else None
+
+        if cross_rates is None:
+            cross_rates = values[np.newaxis, :] / values[:, np.newaxis]
+            with self._lock:
+                if self._values is values:
+                    self._cross_rates = cross_rates
+
+        return cross_rates
+
+    def convert_prices(self, prices: Dict, vs_currencies: List[str], from_currency: str = "usd") -> Dict:
+        """Expand a get_simple_price response in from_currency to vs_currencies
+
+        Prices, market caps and 24h volumes are converted, last_updated_at is kept. 24h changes are only kept for
+        from_currency since they depend on the exchange rate 24 hours ago.
+
+        @prices: Response of get_simple_price or get_simple_price_batch for from_currency
+        @vs_currencies: Currencies of the expanded response
+        @from_currency: Currency prices were fetched in. Default: usd
+        """
+
+        result = {coin_id: {} for coin_id in prices}
+        for field in CurrencyConverter.PRICE_FIELDS:
+            coin_ids = [coin_id for coin_id, price in prices.items() if price.get(from_currency + field) is not None]
+            if not coin_ids:
+                continue
+
+            converted = self.convert([prices[coin_id][from_currency + field] for coin_id in coin_ids], from_currency, vs_currencies).tolist()
+            for coin_id, amounts in zip(coin_ids, converted):
+                result[coin_id].update((vs_currency + field, amount) for vs_currency, amount in zip(vs_currencies, amounts))
+
+        for coin_id, price in prices.items():
+            if from_currency in vs_currencies:
+                result[coin_id].update((name, value) for name, value in price.items() if name.startswith(from_currency + "_") or name == from_currency)
+            if "last_updated_at" in price:
+                result[coin_id]["last_updated_at"] = price["last_updated_at"]
+
+        return result
+
+    def get_prices(self, coin_ids: List[str], vs_currencies: List[str], from_currency: str = "usd", **kwargs) -> Dict:
+        """get_simple_price_batch fetching only from_currency and converting it to vs_currencies locally
+
+        Extra keyword arguments (include_market_cap, ...) are passed to get_simple_price_batch.
+        """
+
+        prices = self._api.get_simple_price_batch(coin_ids=coin_ids, vs_currencies=[from_currency], **kwargs)
+        return self.convert_prices(prices, vs_currencies, from_currency=from_currency)
+
+    def _get_rates(self):
+        with self._lock:
+            indices, values, refreshed_at = self._indices, self._values, self._refreshed_at
+
+        if refreshed_at is None or time.monotonic() - refreshed_at > self._ttl:
+            with self._build_lock:
+                if self._refreshed_at == refreshed_at:
+                    self.refresh()
+            with self._lock:
+                indices, values = self._indices, self._values
+
+        return indices, values
+
+    @staticmethod
+    def _get_indices(indices: Dict[str, int], currencies: List[str]) -> List[int]:
+        try:
+            return [indices[currency.lower()] for currency in currencies]
+        except KeyError as error:
+            raise ValueError(f"Unsupported currency: {error.args[0]}, valid values: {', '.join(indices)}") from None
@@ -0,0 +1,142 @@
+import sqlite3
+import statistics
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from src.api.coingecko_api import CoingeckoApi
+from src.config import ApiConfig
+from src.model import MarketChart
+from src.util import ApiUtil, TimeRangeUtil
+
+
+class MarketDataSync:
+    """Keeps a local SQLite copy of market chart series per (coin_id, vs_currency) and fetches only the missing tail
+
+    Every run requests the range from the last stored timestamp onward and upserts the points, so re-running is
+    idempotent. The API picks the granularity from the window length, so the tails are fetched with
+    get_coin_marketchart_range_by_granularity at the granularity of the stored series and a series keeps one resolution.
+
+    @api: Client used to fetch market data
+    @path: SQLite database file, created if missing
+    @initial_days: Days of history fetched the first time a series is synced. Default: ApiConfig.Sync.INITIAL_DAYS
+    @granularity: Granularity of the series (minutely, hourly, daily), None keeps the one the API chooses for the first backfill
+    """
+
+    SERIES = ("prices", "market_caps", "total_volumes")
+
+    def __init__(self, api: CoingeckoApi, path: str, initial_days: int = ApiConfig.Sync.INITIAL_DAYS, granularity: str = None):
+        self._api = api
+        self._initial_days = initial_days
+        self._granularity = granularity
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""CREATE TABLE IF NOT EXISTS market_data (
+                                        coin_id TEXT NOT NULL,
+                                        vs_currency TEXT NOT NULL,
+                                        timestamp INTEGER NOT NULL,
+                                        price REAL,
+                                        market_cap REAL,
+                                        total_volume REAL,
+                                        PRIMARY KEY (coin_id, vs_currency, timestamp)
+                                    ) WITHOUT ROWID""")
+        self._connection.commit()
+
+    def get_last_timestamp(self, coin_id: str, vs_currency: str) -> int:
+        """Millisecond timestamp of the newest stored point, None if the series was never synced"""
+
+        with self._lock:
+            row = self._connection.execute("SELECT MAX(timestamp) FROM market_data WHERE coin_id = ? AND vs_currency = ?", (coin_id, vs_currency)).fetchone()
+        return row[0]
+
+    def get_granularity(self, coin_id: str, vs_currency: str) -> str:
+        """Granularity of a series: the configured one, else the one of the spacing of its newest stored points"""
+
+        if self._granularity is not None:
+            return self._granularity
+
+        with self._lock:
+            rows = self._connection.execute("SELECT timestamp FROM market_data WHERE coin_id = ? AND vs_currency = ? ORDER BY timestamp DESC LIMIT 11", (coin_id, vs_currency)).fetchall()
+
+        if len(rows) < 2:
+            return TimeRangeUtil.get_range_granularity(timedelta(days=self._initial_days))
+
+        # The newest point is the live price at an arbitrary time, the median spacing ignores it
+        spacing = statistics.median(newer[0] - older[0] for newer, older in zip(rows, rows[1:])) / 1000
+        if spacing >= 12 * 60 * 60:
+            return ApiConfig.Granularity.DAILY
+        if spacing >= 30 * 60:
+            return ApiConfig.Granularity.HOURLY
+        return ApiConfig.Granularity.MINUTELY
+
+    def sync(self, coin_id: str, vs_currency: str, now: datetime = None) -> int:
+        """Fetch and store the points newer than the last stored one, returns the number of new points
+
+        @coin_id: pass the coin id (can be obtained from get_coin_list) eg. bitcoin
+        @vs_currency: The target currency of market data (usd, eur, jpy, etc.)
+        @now: End of the fetched window Default: current time
+        """
+
+        to_date = now or datetime.now()
+        last_timestamp = self.get_last_timestamp(coin_id, vs_currency)
+
+        if last_timestamp is None:
+            from_date = to_date - timedelta(days=self._initial_days)
+            if self._granularity is not None:
+                response = self._api.get_coin_marketchart_range_by_granularity(coin_id=coin_id, vs_currency=vs_currency, from_date=from_date, to_date=to_date, granularity=self._granularity)
+            else:
+                response = self._api.get_coin_marketchart_range(coin_id=coin_id, vs_currency=vs_currency, from_date=from_date, to_date=to_date)
+        else:
+            from_date = datetime.fromtimestamp(last_timestamp / 1000)
+            response = self._api.get_coin_marketchart_range_by_granularity(coin_id=coin_id, vs_currency=vs_currency, from_date=from_date, to_date=to_date,
+                                                                           granularity=self.get_granularity(coin_id, vs_currency))
+
+        rows = MarketDataSync._to_rows(coin_id, vs_currency, response)
+        with self._lock:
+            self._connection.executemany("INSERT OR REPLACE INTO market_data (coin_id, vs_currency, timestamp, price, market_cap, total_volume) VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._connection.commit()
+
+        return sum(1 for row in rows if last_timestamp is None or row[2] > last_timestamp)
+
+    def sync_many(self, pairs: List[Tuple[str, str]], max_workers: int = ApiConfig.Batch.MAX_WORKERS, now: datetime = None) -> Dict[Tuple[str, str], int]:
+        """Sync several (coin_id, vs_currency) series concurrently, returns the number of new points per series"""
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = executor.map(ApiUtil.bind_context(lambda pair: self.sync(pair[0], pair[1], now=now)), pairs)
+            return dict(zip(pairs, counts))
+
+    def get_series(self, coin_id: str, vs_currency: str, start: int = None, end: int = None, columnar: bool = False) -> Dict:
+        """Stored points with start <= timestamp < end (milliseconds) in the market chart response shape
+
+        @columnar: Return a MarketChart of NumPy arrays instead of nested lists Default: False
+        """
+
+        query = "SELECT timestamp, price, market_cap, total_volume FROM market_data WHERE coin_id = ? AND vs_currency = ?"
+        args = [coin_id, vs_currency]
+        if start is not None:
+            query += " AND timestamp >= ?"
+            args.append(start)
+        if end is not None:
+            query += " AND timestamp < ?"
+            args.append(end)
+
+        with self._lock:
+            rows = self._connection.execute(query + " ORDER BY timestamp", args).fetchall()
+
+        response = {name: [[row[0], row[index + 1]] for row in rows if row[index + 1] is not None] for index, name in enumerate(MarketDataSync.SERIES)}
+        return MarketChart.from_response(response) if columnar else response
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _to_rows(coin_id: str, vs_currency: str, response: Dict) -> List[Tuple]:
+        points = {}
+        for index, name in enumerate(MarketDataSync.SERIES):
+            for timestamp, value in response.get(name) or []:
+                points.setdefault(int(timestamp), [None, None, None])[index] = value
+
+        return [(coin_id, vs_currency, timestamp, *values) for timestamp, values in points.items()]
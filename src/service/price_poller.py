@@ -0,0 +1,201 @@
+import threading
+import time
+from typing import Callable, Dict, List
+
+from src.api.coingecko_api import CoingeckoApi
+from src.config import ApiConfig
+from src.util import ResponseCache
+
+
+class PriceSubscription:
+    """Interest of one consumer in the prices of coin_ids in vs_currencies, returned by PricePoller.subscribe"""
+
+    def __init__(self, poller: "PricePoller", coin_ids: List[str], vs_currencies: List[str], max_staleness: float, callback: Callable[[Dict], None]):
+        self.coin_ids = list(dict.fromkeys(coin_ids))
+        self.vs_currencies = list(dict.fromkeys(vs_currency.lower() for vs_currency in vs_currencies))
+        self.max_staleness = max_staleness
+        self._poller = poller
+        self._callback = callback
+        self._delivered = {}
+
+    def cancel(self):
+        """Stop receiving prices"""
+
+        self._poller.unsubscribe(self)
+
+    def _get_changes(self, prices: Dict[str, Dict]) -> Dict[str, Dict]:
+        changes = {}
+        for coin_id in self.coin_ids:
+            price = prices.get(coin_id)
+            if not price:
+                continue
+
+            changed = {vs_currency: price[vs_currency] for vs_currency in self.vs_currencies
+                       if vs_currency in price and self._delivered.get((coin_id, vs_currency)) != price[vs_currency]}
+            if changed:
+                self._delivered.update(((coin_id, vs_currency), value) for vs_currency, value in changed.items())
+                if "last_updated_at" in price:
+                    changed["last_updated_at"] = price["last_updated_at"]
+                changes[coin_id] = changed
+        return changes
+
+
+class PricePoller:
+    """Keeps the prices of many subscriptions fresh with the fewest get_simple_price_batch calls
+
+    Subscriptions are merged per coin: a coin is polled once its tightest max_staleness has elapsed, but not before
+    upstream_interval seconds after its last_updated_at since CoinGecko would return the same price. Coins falling
+    due within COALESCE_FACTOR of their staleness ride along with a poll instead of triggering their own. Each
+    subscriber only receives the values that changed since its previous delivery, as {coin_id: {vs_currency: price,
+    "last_updated_at": ...}}.
+
+    Polls run on a background thread between start and stop, or synchronously through poll.
+
+    @api: Client used to fetch prices
+    @upstream_interval: Seconds between upstream price updates. Default: ApiConfig.Polling.UPSTREAM_INTERVAL
+    @min_interval: Minimum seconds between two polls of the same coin. Default: ApiConfig.Polling.MIN_INTERVAL
+    """
+
+    def __init__(self, api: CoingeckoApi, upstream_interval: float = ApiConfig.Polling.UPSTREAM_INTERVAL, min_interval: float = ApiConfig.Polling.MIN_INTERVAL):
+        self._api = api
+        self._upstream_interval = upstream_interval
+        self._min_interval = min_interval
+        self._condition = threading.Condition()
+        self._subscriptions = []
+        self._prices = {}
+        self._polled_at = {}
+        self._polled_currencies = {}
+        self._thread = None
+        self._stopped = False
+
+    def __enter__(self) -> "PricePoller":
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def subscribe(self, coin_ids: List[str], vs_currencies: List[str], max_staleness: float, callback: Callable[[Dict], None] = None, queue=None) -> PriceSubscription:
+        """Receive the prices of coin_ids in vs_currencies whenever they change
+
+        @coin_ids: Id of coins. Refers to get_coin_list
+        @vs_currencies: vs_currency of coins. Refers to get_supported_vs_currencies
+        @max_staleness: Maximum age in seconds of the delivered prices, bounded below by the upstream update interval
+        @callback: Called with the changed prices, on the polling thread
+        @queue: Queue the changed prices are put on, instead of callback
+        """
+
+        if (callback is None) == (queue is None):
+            raise ValueError("Exactly one of callback and queue must be given")
+
+        subscription = PriceSubscription(self, coin_ids, vs_currencies, max_staleness, callback or queue.put)
+        with self._condition:
+            self._subscriptions.append(subscription)
+            self._condition.notify()
+        return subscription
+
+    def unsubscribe(self, subscription: PriceSubscription):
+        with self._condition:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            self._condition.notify()
+
+    def get_price(self, coin_id: str) -> Dict:
+        """Last polled price of a coin, None before its first poll"""
+
+        with self._condition:
+            price = self._prices.get(coin_id)
+        return dict(price) if price is not None else None
+
+    def poll(self, now: float = None) -> float:
+        """Poll the coins that are due, deliver the changes and return the seconds until the next coin is due, None without subscriptions
+
+        @now: Unix time of the poll. Default: current time
+        """
+
+        now = time.time() if now is None else now
+        plan = self._get_plan(now)
+
+        due = [coin_id for coin_id, (due_at, _, _) in plan.items() if due_at <= now]
+        if due:
+            coin_ids = [coin_id for coin_id, (due_at, max_staleness, _) in plan.items()
+                        if due_at <= now + max_staleness * ApiConfig.Polling.COALESCE_FACTOR]
+            vs_currencies = sorted(set().union(*(plan[coin_id][2] for coin_id in coin_ids)))
+
+            with ResponseCache.bypass():
+                prices = self._api.get_simple_price_batch(coin_ids=coin_ids, vs_currencies=vs_currencies, include_last_updated_at=True)
+
+            with self._condition:
+                for coin_id in coin_ids:
+                    self._prices[coin_id] = prices.get(coin_id, {})
+                    self._polled_at[coin_id] = now
+                    self._polled_currencies[coin_id] = set(vs_currencies)
+                plan = self._get_plan(now)
+
+        self._deliver()
+        return max(min(due_at for due_at, _, _ in plan.values()) - now, 0.0) if plan else None
+
+    def start(self):
+        """Poll on a background thread until stop"""
+
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            thread = self._thread
+            self._stopped = True
+            self._condition.notify()
+
+        if thread is not None:
+            thread.join()
+            self._thread = None
+
+    def _get_plan(self, now: float) -> Dict:
+        """Due time, tightest max_staleness and subscribed currencies of every subscribed coin"""
+
+        with self._condition:
+            plan = {}
+            for subscription in self._subscriptions:
+                for coin_id in subscription.coin_ids:
+                    _, max_staleness, vs_currencies = plan.get(coin_id, (None, subscription.max_staleness, set()))
+                    plan[coin_id] = (None, min(max_staleness, subscription.max_staleness), vs_currencies | set(subscription.vs_currencies))
+
+            for coin_id, (_, max_staleness, vs_currencies) in plan.items():
+                polled_at = self._polled_at.get(coin_id)
+                if polled_at is None or not vs_currencies <= self._polled_currencies[coin_id]:
+                    due_at = now
+                else:
+                    last_updated_at = self._prices[coin_id].get("last_updated_at")
+                    due_at = max(polled_at + max_staleness, polled_at + self._min_interval,
+                                 last_updated_at + self._upstream_interval if last_updated_at is not None else polled_at)
+                plan[coin_id] = (due_at, max_staleness, vs_currencies)
+            return plan
+
+    def _deliver(self):
+        with self._condition:
+            subscriptions = list(self._subscriptions)
+            prices = dict(self._prices)
+
+        for subscription in subscriptions:
+            changes = subscription._get_changes(prices)
+            if changes:
+                subscription._callback(changes)
+
+    def _run(self):
+        while True:
+            try:
+                delay = self.poll()
+            except Exception:
+                # Keep the previous prices and try again, subscribers only ever see successful polls
+                delay = ApiConfig.Polling.RETRY_DELAY
+
+            with self._condition:
+                if not self._stopped:
+                    self._condition.wait(delay)
+                if self._stopped:
+                    return
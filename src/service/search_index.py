@@ -0,0 +1,197 @@
+import math
+import re
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from src.api.coingecko_api import CoingeckoApi
+from src.config import ApiConfig
+from src.util import ApiUtil, ResponseCache
+
+
+class _KindIndex:
+    """Sorted term array for prefix lookup and a trigram index for fuzzy lookup over one kind of search result"""
+
+    def __init__(self, entries: List[Dict], terms: List[List[str]]):
+        self.entries = entries
+
+        pairs = sorted({(term, index) for index, entry_terms in enumerate(terms) for term in entry_terms})
+        self.keys = [term for term, _ in pairs]
+        self.indices = [index for _, index in pairs]
+
+        self.trigrams = {}
+        self.entry_trigrams = []
+        for index, entry_terms in enumerate(terms):
+            trigrams = _get_trigrams(entry_terms[0])
+            self.entry_trigrams.append(trigrams)
+            for trigram in trigrams:
+                self.trigrams.setdefault(trigram, []).append(index)
+
+    def find_prefix(self, query: str, limit: int) -> List[int]:
+        """Entries with a term starting with query, exact term matches first"""
+
+        exact = []
+        prefixed = []
+        seen = set()
+        position = bisect_left(self.keys, query)
+        while position < len(self.keys) and self.keys[position].startswith(query) and len(exact) + len(prefixed) < limit * ApiConfig.Search.SCAN_FACTOR:
+            index = self.indices[position]
+            if index not in seen:
+                seen.add(index)
+                (exact if self.keys[position] == query else prefixed).append(index)
+            position += 1
+
+        prefixed.sort(key=lambda index: len(self.entries[index]["name"]))
+        return (exact + prefixed)[:limit]
+
+    def find_fuzzy(self, query: str, limit: int) -> List[int]:
+        """Entries whose first term shares enough trigrams with query (Dice coefficient), best first"""
+
+        threshold = ApiConfig.Search.FUZZY_THRESHOLD
+        query_trigrams = _get_trigrams(query)
+
+        # A match shares at least min_shared trigrams, so it contains one of the len - min_shared + 1 rarest ones
+        min_shared = math.ceil(threshold * len(query_trigrams) / (2 - threshold))
+        rarest = sorted(query_trigrams, key=lambda trigram: len(self.trigrams.get(trigram, ())))[:len(query_trigrams) - min_shared + 1]
+        candidates = {index for trigram in rarest for index in self.trigrams.get(trigram, ())}
+
+        scored = []
+        for index in candidates:
+            score = 2 * len(query_trigrams & self.entry_trigrams[index]) / (len(query_trigrams) + len(self.entry_trigrams[index]))
+            if score >= threshold:
+                scored.append((-score, index))
+
+        return [index for _, index in sorted(scored)[:limit]]
+
+
+def _get_trigrams(term: str) -> set:
+    padded = f"  {term} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+def _get_terms(*values: str) -> List[str]:
+    """Lowercase search terms of an entry: the values themselves followed by the words of multi-word values"""
+
+    terms = [value.lower() for value in values if value]
+    for value in list(terms):
+        words = re.split(r"[\s\-_()]+", value)
+        if len(words) > 1:
+            terms.extend(word for word in words if word)
+    return terms
+
+
+class SearchIndex:
+    """Local coin, exchange and category index answering get_search style queries without a network call
+
+    Built from get_coin_list, get_exchange_list, get_derivative_exchange_list and get_coin_category_list. Queries match
+    ids, symbols and names by case-insensitive prefix, fall back to trigram fuzzy matching when nothing matches, and
+    return the get_search response shape. The first query builds the index; once it is older than ttl, queries keep
+    answering from it while a background thread rebuilds it.
+
+    @api: Client used to fetch the lists
+    @ttl: Seconds before the index is rebuilt in the background. Default: ApiConfig.Search.TTL
+    """
+
+    def __init__(self, api: CoingeckoApi, ttl: float = ApiConfig.Search.TTL):
+        self._api = api
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._indexes = None
+        self._symbols = None
+        self._refreshed_at = None
+        self._refreshing = False
+
+    def refresh(self):
+        """Fetch the lists and replace the index"""
+
+        with ResponseCache.bypass(), ThreadPoolExecutor(max_workers=4) as executor:
+            coins = executor.submit(ApiUtil.bind_context(self._api.get_coin_list))
+            exchanges = executor.submit(ApiUtil.bind_context(self._api.get_exchange_list))
+            derivative_exchanges = executor.submit(ApiUtil.bind_context(self._api.get_derivative_exchange_list))
+            categories = executor.submit(ApiUtil.bind_context(self._api.get_coin_category_list))
+            indexes, symbols = SearchIndex._build(coins.result(), exchanges.result(), derivative_exchanges.result(), categories.result())
+
+        with self._lock:
+            self._indexes = indexes
+            self._symbols = symbols
+            self._refreshed_at = time.monotonic()
+
+    def search(self, query: str, limit: int = ApiConfig.Search.LIMIT) -> Dict:
+        """Search for coins, exchanges and categories like get_search
+
+        @query: Search string, matched case-insensitively against ids, symbols and names
+        @limit: Maximum number of results per kind Default: ApiConfig.Search.LIMIT
+        """
+
+        indexes, symbols = self._get_index()
+        query = query.strip().lower()
+        response = {"coins": [], "exchanges": [], "icos": [], "categories": [], "nfts": []}
+        if not query:
+            return response
+
+        for kind, index in indexes.items():
+            found = symbols.get(query, [])[:limit] if kind == "coins" else []
+            found += [position for position in index.find_prefix(query, limit) if position not in found]
+            if not found and len(query) >= ApiConfig.Search.FUZZY_MIN_LENGTH:
+                found = index.find_fuzzy(query, limit)
+            response[kind] = [index.entries[position] for position in found[:limit]]
+
+        return response
+
+    def search_symbol(self, symbol: str) -> List[Dict]:
+        """Coins whose symbol equals symbol, case-insensitively"""
+
+        indexes, symbols = self._get_index()
+        coins = indexes["coins"]
+        return [coins.entries[position] for position in symbols.get(symbol.strip().lower(), [])]
+
+    def _get_index(self) -> Tuple[Dict, Dict]:
+        with self._lock:
+            indexes, symbols, refreshed_at = self._indexes, self._symbols, self._refreshed_at
+            stale = refreshed_at is not None and time.monotonic() - refreshed_at > self._ttl and not self._refreshing
+            if stale:
+                self._refreshing = True
+
+        if indexes is None:
+            with self._build_lock:
+                if self._indexes is None:
+                    self.refresh()
+            return self._indexes, self._symbols
+
+        if stale:
+            threading.Thread(target=self._refresh_in_background, daemon=True).start()
+
+        return indexes, symbols
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        except Exception:
+            # Keep answering from the previous index and retry once the ttl elapses again
+            with self._lock:
+                self._refreshed_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    @staticmethod
+    def _build(coins: List[Dict], exchanges: List[Dict], derivative_exchanges: List[Dict], categories: List[Dict]) -> Tuple[Dict, Dict]:
+        coin_entries = [{"id": coin["id"], "name": coin["name"], "api_symbol": coin["id"], "symbol": coin["symbol"].upper(),
+                         "market_cap_rank": None, "thumb": None, "large": None} for coin in coins]
+        exchange_entries = [{"id": exchange["id"], "name": exchange["name"], "market_type": "spot", "thumb": None, "large": None} for exchange in exchanges]
+        exchange_entries += [{"id": exchange["id"], "name": exchange["name"], "market_type": "futures", "thumb": None, "large": None} for exchange in derivative_exchanges]
+        category_entries = [{"id": category["category_id"], "name": category["name"]} for category in categories]
+
+        symbols = {}
+        for position, coin in enumerate(coins):
+            symbols.setdefault(coin["symbol"].lower(), []).append(position)
+
+        indexes = {
+            "coins": _KindIndex(coin_entries, [_get_terms(coin["name"], coin["id"], coin["symbol"]) for coin in coins]),
+            "exchanges": _KindIndex(exchange_entries, [_get_terms(exchange["name"], exchange["id"]) for exchange in exchange_entries]),
+            "categories": _KindIndex(category_entries, [_get_terms(category["name"], category["id"]) for category in category_entries])
+        }
+        return indexes, symbols
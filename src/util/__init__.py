@@ -1,5 +1,84 @@
-from .api_util import ApiUtil
+from typing import TYPE_CHECKING
+
+from .import_util import ImportUtil
+
+if TYPE_CHECKING:
+    from .api_error import ApiError, ClientError, NotFoundError, RateLimitError, ServerError
+    from .api_util import ApiUtil
+    from .async_api_util import AsyncApiUtil
+    from .bulk_result import BulkProgress, BulkResult
+    from .cassette import Cassette, CassetteResponse
+    from .disk_cache import DiskCache
+    from .http_session import HttpSession
+    from .priority_scheduler import DeadlineExceeded, PriorityScheduler
+    from .rate_limiter import RateLimiter
+    from .request_metrics import RequestMetrics
+    from .response_cache import ResponseCache
+    from .retry_policy import RetryPolicy
+    from .single_flight import SingleFlight
+    from .time_range_util import TimeRangeUtil
+    from .time_series_store import TimeSeriesStore
+    from .validator_cache import ValidatorCache
+
+# Submodules are imported on first attribute access (PEP 562) so importing the package stays cheap
+_EXPORTS = {
+    "ApiError": ".api_error",
+    "ApiUtil": ".api_util",
+    "AsyncApiUtil": ".async_api_util",
+    "BulkProgress": ".bulk_result",
+    "BulkResult": ".bulk_result",
+    "Cassette": ".cassette",
+    "CassetteResponse": ".cassette",
+    "ClientError": ".api_error",
+    "DeadlineExceeded": ".priority_scheduler",
+    "DiskCache": ".disk_cache",
+    "HttpSession": ".http_session",
+    "NotFoundError": ".api_error",
+    "PriorityScheduler": ".priority_scheduler",
+    "RateLimitError": ".api_error",
+    "RateLimiter": ".rate_limiter",
+    "RequestMetrics": ".request_metrics",
+    "ResponseCache": ".response_cache",
+    "RetryPolicy": ".retry_policy",
+    "ServerError": ".api_error",
+    "SingleFlight": ".single_flight",
+    "TimeRangeUtil": ".time_range_util",
+    "TimeSeriesStore": ".time_series_store",
+    "ValidatorCache": ".validator_cache"
+}
+
+
+def __getattr__(name: str):
+    return ImportUtil.get_lazy_attribute(__name__, _EXPORTS, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
-    "ApiUtil"
+    "ApiError",
+    "ApiUtil",
+    "AsyncApiUtil",
+    "BulkProgress",
+    "BulkResult",
+    "Cassette",
+    "CassetteResponse",
+    "ClientError",
+    "DeadlineExceeded",
+    "DiskCache",
+    "HttpSession",
+    "ImportUtil",
+    "NotFoundError",
+    "PriorityScheduler",
+    "RateLimitError",
+    "RateLimiter",
+    "RequestMetrics",
+    "ResponseCache",
+    "RetryPolicy",
+    "ServerError",
+    "SingleFlight",
+    "TimeRangeUtil",
+    "TimeSeriesStore",
+    "ValidatorCache"
 ]
\ No newline at end of file
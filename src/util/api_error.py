@@ -0,0 +1,78 @@
+import json
+from datetime import datetime, timezone
+from typing import Dict
+
+from src.util.import_util import ImportUtil
+
+email_utils = ImportUtil.import_lazy("email.utils")
+
+
+class ApiError(Exception):
+    """Raised for a non-2xx response, carrying the status code, raw content, parsed body and headers"""
+
+    def __init__(self, status_code: int, content: bytes, headers: Dict = None):
+        super().__init__(content)
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.body = ApiError._parse_body(content)
+        self.retry_after = ApiError._parse_retry_after(self.headers.get("Retry-After"))
+
+    @staticmethod
+    def from_response(status_code: int, content: bytes, headers: Dict = None) -> "ApiError":
+        """Build the most specific ApiError subclass for a status code"""
+
+        if status_code == 429:
+            error_class = RateLimitError
+        elif status_code == 404:
+            error_class = NotFoundError
+        elif 400 <= status_code < 500:
+            error_class = ClientError
+        elif status_code >= 500:
+            error_class = ServerError
+        else:
+            error_class = ApiError
+
+        return error_class(status_code, content, headers)
+
+    @staticmethod
+    def _parse_body(content: bytes):
+        try:
+            return json.loads(content)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> float:
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = email_utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class ClientError(ApiError):
+    """4xx response, the request itself is invalid"""
+
+
+class NotFoundError(ClientError):
+    """404 response, the requested resource does not exist"""
+
+
+class RateLimitError(ClientError):
+    """429 response, the plan's call budget is exhausted"""
+
+
+class ServerError(ApiError):
+    """5xx response, the API failed to serve a valid request"""
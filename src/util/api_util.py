@@ -1,13 +1,28 @@
-from typing import Dict, Tuple 
-import requests
+from typing import Callable, Dict, List, Tuple 
+from urllib.parse import quote_plus, urlencode
+import contextvars
+import time
+
+from src.util.api_error import ApiError
+from src.util.import_util import ImportUtil
+
+requests = ImportUtil.import_lazy("requests")
 
 class ApiUtil:
 
+    # Returned in place of the response body when a conditional request answers 304 Not Modified
+    NOT_MODIFIED = object()
+
     @staticmethod
-    def send_request(scheme: str, host:str, base_path:str,  method: str, path: str, path_vars: Dict, query_params: Dict) -> Tuple:
+    def send_request(scheme: str, host:str, base_path:str,  method: str, path: str, path_vars: Dict, query_params: Dict, session=None, headers: Dict = None, timings: Dict = None) -> Tuple:
+        """Send a request and return (headers, parsed body)
+
+        @timings: Optional dict filled with the connect, ttfb, download and decode phase durations in seconds, the response bytes and status
+        """
 
         header = {
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            **(headers or {})
         }
 
         formatted_path = path.format(**path_vars)
@@ -19,8 +34,76 @@ class ApiUtil:
             "params": {k: v for k, v in query_params.items() if v is not None}
         }
 
-        response = requests.request(**args)
+        timings = timings if timings is not None else {}
+        requester = session.request if session is not None else requests.request
+
+        start = time.perf_counter()
+        response = requester(**args, stream=True)
+        headers_received = time.perf_counter()
+        content = response.content
+        downloaded = time.perf_counter()
+
+        timings["connect"] = session.get_connect_time() if hasattr(session, "get_connect_time") else 0.0
+        timings["ttfb"] = headers_received - start - timings["connect"]
+        timings["download"] = downloaded - headers_received
+        timings["bytes"] = len(content)
+        timings["status"] = response.status_code
+
+        if response.status_code == 304:
+            return response.headers, ApiUtil.NOT_MODIFIED
         if response.ok:
-            return response.headers, response.json()
+            body = response.json()
+            timings["decode"] = time.perf_counter() - downloaded
+            return response.headers, body
+
+        raise ApiError.from_response(response.status_code, content, response.headers)
+
+    @staticmethod
+    def build_request_key(method: str, path: str, path_vars: Dict, query_params: Dict) -> Tuple:
+        """Hashable identity of a request, ignoring None params and the api key"""
+
+        params = []
+        for key, value in query_params.items():
+            if value is None or key == "x_cg_pro_api_key":
+                continue
+            params.append((key, tuple(value) if isinstance(value, (list, tuple)) else value))
+
+        return method, path, tuple(sorted(path_vars.items())), tuple(sorted(params))
+
+    @staticmethod
+    def get_url_length(scheme: str, host: str, base_path: str, path: str, path_vars: Dict, query_params: Dict) -> int:
+        """Length of the URL requests would build for a request"""
+
+        formatted_path = path.format(**path_vars)
+        params = {k: v for k, v in query_params.items() if v is not None}
+        return len(f"{scheme}://{host}{base_path}{formatted_path}?") + len(urlencode(params, doseq=True))
+
+    @staticmethod
+    def chunk_values(values: List[str], max_length: int) -> List[List[str]]:
+        """Split values into chunks whose comma-joined, URL-encoded length stays within max_length"""
+
+        chunks = []
+        chunk = []
+        chunk_length = 0
+        for value in dict.fromkeys(values):
+            value_length = len(quote_plus(value)) + (len(quote_plus(",")) if chunk else 0)
+            if chunk and chunk_length + value_length > max_length:
+                chunks.append(chunk)
+                chunk = []
+                value_length = len(quote_plus(value))
+                chunk_length = 0
+
+            chunk.append(value)
+            chunk_length += value_length
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    @staticmethod
+    def bind_context(function: Callable) -> Callable:
+        """Wrap function to run in a copy of the caller's context variables, so thread pool workers inherit ResponseCache.bypass and PriorityScheduler.priority"""
 
-        raise Exception(response.content)
\ No newline at end of file
+        context = contextvars.copy_context()
+        return lambda *args, **kwargs: context.copy().run(function, *args, **kwargs)
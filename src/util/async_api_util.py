@@ -0,0 +1,93 @@
+import time
+from typing import Dict, List, Tuple
+
+from src.util.api_error import ApiError
+from src.util.api_util import ApiUtil
+from src.util.import_util import ImportUtil
+
+aiohttp = ImportUtil.import_lazy("aiohttp")
+
+
+class AsyncApiUtil:
+
+    @staticmethod
+    def create_session(pool_connections: int, pool_maxsize: int, keep_alive: float):
+        """Create an aiohttp.ClientSession with a shared, bounded keep-alive connection pool"""
+
+        if aiohttp is None:
+            raise ImportError("AsyncCoingeckoApi requires aiohttp, install it with `pip install cg_api[async]`")
+
+        connector = aiohttp.TCPConnector(limit=pool_connections * pool_maxsize, limit_per_host=pool_maxsize, keepalive_timeout=keep_alive)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(AsyncApiUtil._on_connection_create_start)
+        trace_config.on_connection_create_end.append(AsyncApiUtil._on_connection_create_end)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+    @staticmethod
+    async def _on_connection_create_start(session, context, params):
+        context.connect_start = time.perf_counter()
+
+    @staticmethod
+    async def _on_connection_create_end(session, context, params):
+        if isinstance(context.trace_request_ctx, dict):
+            context.trace_request_ctx["connect"] += time.perf_counter() - context.connect_start
+
+    @staticmethod
+    def format_params(query_params: Dict) -> List[Tuple]:
+        """Encode query params for aiohttp: None values are dropped, lists are repeated and booleans are sent lowercase as the API documents them"""
+
+        params = []
+        for key, value in query_params.items():
+            if value is None:
+                continue
+
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                params.append((key, str(item).lower() if isinstance(item, bool) else str(item)))
+
+        return params
+
+    @staticmethod
+    async def send_request(scheme: str, host: str, base_path: str, method: str, path: str, path_vars: Dict, query_params: Dict, session, headers: Dict = None, timings: Dict = None) -> Tuple:
+        """Send a request and return (headers, parsed body)
+
+        @timings: Optional dict filled with the connect, ttfb, download and decode phase durations in seconds, the response bytes and status
+        """
+
+        header = {
+            "Content-Type": "application/json",
+            **(headers or {})
+        }
+
+        formatted_path = path.format(**path_vars)
+        timings = timings if timings is not None else {}
+        timings["connect"] = 0.0
+
+        args = {
+            "method": method,
+            "url": f"{scheme}://{host}{base_path}{formatted_path}",
+            "headers": header,
+            "params": AsyncApiUtil.format_params(query_params),
+            "trace_request_ctx": timings
+        }
+
+        start = time.perf_counter()
+        async with session.request(**args) as response:
+            headers_received = time.perf_counter()
+            content = await response.read()
+            downloaded = time.perf_counter()
+
+            timings["ttfb"] = headers_received - start - timings["connect"]
+            timings["download"] = downloaded - headers_received
+            timings["bytes"] = len(content)
+            timings["status"] = response.status
+
+            if response.status == 304:
+                return response.headers, ApiUtil.NOT_MODIFIED
+            if response.ok:
+                body = await response.json(content_type=None)
+                timings["decode"] = time.perf_counter() - downloaded
+                return response.headers, body
+
+        raise ApiError.from_response(response.status, content, response.headers)
@@ -0,0 +1,48 @@
+import time
+from typing import Dict
+
+
+class BulkResult:
+    """Outcome of one call of a bulk fetch, tied to its position and kwargs in the input"""
+
+    def __init__(self, index: int, kwargs: Dict, result=None, error: Exception = None, elapsed: float = 0.0):
+        self.index = index
+        self.kwargs = kwargs
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f"BulkResult(index={self.index}, kwargs={self.kwargs}, ok={self.ok})"
+
+
+class BulkProgress:
+    """Running totals of a bulk fetch, passed to the progress callback after every completed call"""
+
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.started_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Completed calls per second"""
+
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def add(self, bulk_result: BulkResult):
+        self.completed += 1
+        if not bulk_result.ok:
+            self.failed += 1
+
+    def __repr__(self) -> str:
+        return f"BulkProgress(completed={self.completed}, failed={self.failed}, throughput={self.throughput:.2f}/s)"
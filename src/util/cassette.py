@@ -0,0 +1,119 @@
+import gzip
+import json
+import os
+import threading
+from typing import Dict
+from urllib.parse import urlencode, urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+from src.util.http_session import HttpSession
+
+
+class CassetteResponse:
+    """Recorded response exposing the parts of requests.Response that ApiUtil.send_request reads"""
+
+    def __init__(self, status_code: int, headers: Dict, content: bytes):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class Cassette:
+    """Record/replay transport for CoingeckoApi(transport=...), storing request/response pairs in a JSON lines file
+
+    Requests are matched by method, URL path and query params, ignoring None params, the api key and headers.
+    A path ending with .gz is gzip compressed.
+
+    @path: Cassette file
+    @mode: record sends every request through session and stores the responses, replay only serves recorded
+           responses and raises LookupError for unknown requests, auto replays when recorded and records otherwise. Default: auto
+    @session: Transport used to record. Default: HttpSession()
+    """
+
+    MODES = ("record", "replay", "auto")
+
+    def __init__(self, path: str, mode: str = "auto", session=None):
+        if mode not in Cassette.MODES:
+            raise ValueError(f"Unsupported cassette mode: {mode}, valid values: {', '.join(Cassette.MODES)}")
+
+        self._path = path
+        self._mode = mode
+        self._session = session
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+
+        if mode != "record" and os.path.exists(path):
+            self._load()
+
+    @staticmethod
+    def get_key(method: str, url: str, params: Dict = None) -> str:
+        """Normalized identity of a request: method, URL path and sorted query params"""
+
+        params = sorted((name, value) for name, value in (params or {}).items() if value is not None and name != "x_cg_pro_api_key")
+        return f"{method.upper()} {urlsplit(url).path}?{urlencode(params, doseq=True)}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def request(self, method: str, url: str, params: Dict = None, **kwargs):
+        key = Cassette.get_key(method, url, params)
+        if self._mode != "record":
+            entry = self._entries.get(key)
+            if entry is not None:
+                return CassetteResponse(entry["status"], entry["headers"], entry["body"].encode())
+            if self._mode == "replay":
+                raise LookupError(f"No recorded response for {key} in {self._path}")
+
+        with self._lock:
+            if self._session is None:
+                self._session = HttpSession()
+
+        response = self._session.request(method=method, url=url, params=params, **kwargs)
+        if response.status_code == 304:
+            # Replaying a bare 304 would leave a client without a stored body, keep the full response recorded before
+            return response
+
+        with self._lock:
+            self._entries[key] = {"key": key, "status": response.status_code, "headers": dict(response.headers), "body": response.content.decode()}
+            self._dirty = True
+        return response
+
+    def get_connect_time(self) -> float:
+        return self._session.get_connect_time() if hasattr(self._session, "get_connect_time") else 0.0
+
+    def save(self):
+        """Write the recorded responses to the cassette file"""
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            opener = gzip.open if self._path.endswith(".gz") else open
+            with opener(self._path, "wt", encoding="utf-8") as file:
+                for entry in self._entries.values():
+                    file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._dirty = False
+
+    def close(self):
+        """Save the recorded responses and close the recording transport"""
+
+        self.save()
+        if self._session is not None:
+            self._session.close()
+
+    def _load(self):
+        opener = gzip.open if self._path.endswith(".gz") else open
+        with opener(self._path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[entry["key"]] = entry
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Tuple
+
+from src.config import ApiConfig
+from src.util.import_util import ImportUtil
+
+requests = ImportUtil.import_lazy("requests")
+
+
+class DiskCache:
+    """SQLite-backed cache that keeps responses of closed historical windows across process restarts
+
+    Only requests whose data can no longer change are stored: get_coin_history for a past day, and the
+    market chart range endpoints for windows ending before now minus the safety margin.
+
+    @path: SQLite database file, created if missing
+    @safety_margin: Seconds a window must be closed for before its response is considered immutable. Default: ApiConfig.DiskCache.SAFETY_MARGIN
+    """
+
+    RANGE_PATHS = (ApiConfig.Url.COIN_MARKETCHART_RANGE, ApiConfig.Url.COIN_CONTRACT_MARKET_CHART_RANGE)
+
+    def __init__(self, path: str, safety_margin: float = ApiConfig.DiskCache.SAFETY_MARGIN):
+        self._safety_margin = safety_margin
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, headers TEXT NOT NULL, body TEXT NOT NULL, created_at REAL NOT NULL)")
+        self._connection.commit()
+
+        self._hits = 0
+        self._misses = 0
+
+    def is_immutable(self, key: Tuple, now: float = None) -> bool:
+        """Return True if the request identified by key covers a window that closed before now minus the safety margin"""
+
+        _, path, _, params = key
+        params = dict(params)
+        cutoff = (time.time() if now is None else now) - self._safety_margin
+
+        if path == ApiConfig.Url.COIN_HISTORY and "date" in params:
+            day = datetime.strptime(params["date"], "%d-%m-%Y").replace(tzinfo=timezone.utc)
+            return (day + timedelta(days=1)).timestamp() <= cutoff
+
+        if path in DiskCache.RANGE_PATHS and "to" in params:
+            return float(params["to"]) <= cutoff
+
+        return False
+
+    def get(self, key: Tuple) -> Tuple:
+        """Return the stored (headers, response) for key, or None"""
+
+        if not self.is_immutable(key):
+            return None
+
+        with self._lock:
+            row = self._connection.execute("SELECT headers, body FROM responses WHERE key = ?", (DiskCache._hash_key(key),)).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        headers, body = row
+        return requests.structures.CaseInsensitiveDict(json.loads(headers)), json.loads(body)
+
+    def set(self, key: Tuple, value: Tuple):
+        """Persist (headers, response) for key if its window is closed"""
+
+        if not self.is_immutable(key):
+            return
+
+        headers, response = value
+        body = json.dumps(response)
+        # Content-Length sizes the entry when a hit is stored in ResponseCache, match it to the stored body
+        row = (DiskCache._hash_key(key), json.dumps({**headers, "Content-Length": str(len(body))}), body, time.time())
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO responses (key, headers, body, created_at) VALUES (?, ?, ?, ?)", row)
+            self._connection.commit()
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            entries = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": entries
+            }
+
+    @staticmethod
+    def _hash_key(key: Tuple) -> str:
+        return hashlib.sha256(json.dumps(key, default=str).encode()).hexdigest()
@@ -0,0 +1,81 @@
+import threading
+import time
+from functools import lru_cache
+from typing import Dict
+
+from src.config import ApiConfig
+from src.util.import_util import ImportUtil
+
+requests = ImportUtil.import_lazy("requests")
+
+# Seconds the current thread spent opening connections during its last request
+_connect_time = threading.local()
+
+
+@lru_cache(maxsize=None)
+def _get_timed_pool_classes() -> Dict:
+    """urllib3 connection pools that time connect() into _connect_time, built on first use to keep the import cheap"""
+
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    def timed_connect(connection_class):
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                connection_class.connect(self)
+            finally:
+                _connect_time.value = getattr(_connect_time, "value", 0.0) + time.perf_counter() - start
+        return connect
+
+    timed_http_connection = type("_TimedHTTPConnection", (HTTPConnection,), {"connect": timed_connect(HTTPConnection)})
+    timed_https_connection = type("_TimedHTTPSConnection", (HTTPSConnection,), {"connect": timed_connect(HTTPSConnection)})
+    return {
+        "http": type("_TimedHTTPConnectionPool", (HTTPConnectionPool,), {"ConnectionCls": timed_http_connection}),
+        "https": type("_TimedHTTPSConnectionPool", (HTTPSConnectionPool,), {"ConnectionCls": timed_https_connection})
+    }
+
+
+class HttpSession:
+    """Persistent, keep-alive HTTP session backed by a pooled requests.Session
+
+    @pool_connections: Number of per-host connection pools to keep. Default: ApiConfig.Pool.CONNECTIONS
+    @pool_maxsize: Maximum number of connections kept per host. Default: ApiConfig.Pool.MAX_SIZE
+    @keep_alive: Seconds an idle pool is kept before its connections are dropped. Default: ApiConfig.Pool.KEEP_ALIVE
+    """
+
+    def __init__(self,
+                 pool_connections: int = ApiConfig.Pool.CONNECTIONS,
+                 pool_maxsize: int = ApiConfig.Pool.MAX_SIZE,
+                 keep_alive: float = ApiConfig.Pool.KEEP_ALIVE):
+        self._keep_alive = keep_alive
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()
+
+        self._adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._adapter.poolmanager.pool_classes_by_scheme = _get_timed_pool_classes()
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+    def request(self, **kwargs) -> "requests.Response":
+        """Send a request over a pooled connection, dropping connections that outlived the keep-alive timeout"""
+
+        with self._lock:
+            now = time.monotonic()
+            if self._keep_alive is not None and now - self._last_used > self._keep_alive:
+                self._adapter.poolmanager.clear()
+            self._last_used = now
+
+        _connect_time.value = 0.0
+        return self._session.request(**kwargs)
+
+    def get_connect_time(self) -> float:
+        """Seconds the calling thread spent opening new connections during its last request, 0 when a pooled one was reused"""
+
+        return getattr(_connect_time, "value", 0.0)
+
+    def close(self):
+        """Close every pooled connection"""
+
+        self._session.close()
@@ -0,0 +1,49 @@
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+
+
+class _LazyModule(ModuleType):
+    """Stand-in for a module that imports it through the regular import system on first attribute access
+
+    Unlike importlib.util.LazyLoader nothing is registered in sys.modules, so other importers and threads only ever see
+    the real, fully executed module.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        with self.__lock:
+            module = importlib.import_module(self.__name__)
+            self.__dict__.update(module.__dict__)
+        return getattr(module, name)
+
+
+class ImportUtil:
+
+    @staticmethod
+    def import_lazy(name: str) -> ModuleType:
+        """Module that is only imported on its first attribute access, None when it is not installed"""
+
+        if name in sys.modules:
+            return sys.modules[name]
+
+        if importlib.util.find_spec(name) is None:
+            return None
+
+        return _LazyModule(name)
+
+    @staticmethod
+    def get_lazy_attribute(package: str, exports: dict, name: str):
+        """Resolve a name of a package __getattr__ (PEP 562) from its exports, a name -> submodule mapping"""
+
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(exports[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
@@ -0,0 +1,196 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict
+
+from src.config import ApiConfig
+from src.util.rate_limiter import RateLimiter
+
+_priority = ContextVar("priority_scheduler_priority", default=(ApiConfig.Priority.NORMAL, None))
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised instead of sending a request that can no longer start before the deadline of its PriorityScheduler.priority block"""
+
+
+class _Ticket:
+
+    def __init__(self, priority_class: str, weight: float, deadline: float):
+        self.priority_class = priority_class
+        self.weight = weight
+        self.deadline = deadline
+        self.queued_at = time.monotonic()
+        self.granted = False
+
+
+class PriorityScheduler:
+    """Hands out the tokens of a RateLimiter by priority class instead of arrival order
+
+    Every request belongs to the class of the enclosing priority block, normal by default. While several classes are
+    waiting, tokens are shared in proportion to their shares (weighted fair queuing), a class never takes tokens that
+    would leave fewer than its reserve in the bucket, and a class never has more than its concurrency requests in
+    flight. With the defaults a bulk backfill runs at the full rate while alone but leaves a reserve for interactive
+    calls, which then go first. Requests whose deadline cannot be met any more are dropped with DeadlineExceeded.
+
+    Share one scheduler between all clients using one api key: CoingeckoApi(api_key=..., scheduler=...)
+
+    @rate_limiter: Token bucket the tokens are taken from. Default: RateLimiter.for_plan(api_key)
+    @shares: Relative share of the rate of each class while classes compete. Default: ApiConfig.Priority.SHARES
+    @concurrency: Maximum requests in flight per class, None for no limit. Default: ApiConfig.Priority.CONCURRENCY
+    @reserves: Tokens each class leaves in the bucket for the classes above it. Default: ApiConfig.Priority.RESERVES
+    @api_key: Api key of the clients sharing the scheduler, sizes the default rate_limiter for the pro plan. Default: None
+    """
+
+    def __init__(self, rate_limiter: RateLimiter = None, shares: Dict[str, float] = None, concurrency: Dict[str, int] = None, reserves: Dict[str, float] = None,
+                 api_key: str = None):
+        self._rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter.for_plan(api_key)
+        # Plan the default limiter was sized for, None when the caller passed its own limiter
+        self._pro_plan = None if rate_limiter is not None else bool(api_key)
+        self._shares = {**ApiConfig.Priority.SHARES, **(shares or {})}
+        self._concurrency = {**ApiConfig.Priority.CONCURRENCY, **(concurrency or {})}
+        self._reserves = {**ApiConfig.Priority.RESERVES, **(reserves or {})}
+        self._condition = threading.Condition()
+        self._queues = {priority_class: deque() for priority_class in ApiConfig.Priority.CLASSES}
+        self._in_flight = dict.fromkeys(ApiConfig.Priority.CLASSES, 0)
+        self._finish_times = dict.fromkeys(ApiConfig.Priority.CLASSES, 0.0)
+        self._virtual_time = 0.0
+        self._wake_at = None
+
+        self._granted = dict.fromkeys(ApiConfig.Priority.CLASSES, 0)
+        self._dropped = dict.fromkeys(ApiConfig.Priority.CLASSES, 0)
+        self._total_wait = dict.fromkeys(ApiConfig.Priority.CLASSES, 0.0)
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
+
+    def is_sized_for(self, api_key: str) -> bool:
+        """False when the default rate_limiter was sized for another plan than the one of api_key"""
+
+        return self._pro_plan is None or self._pro_plan == bool(api_key)
+
+    @staticmethod
+    @contextmanager
+    def priority(priority_class: str, timeout: float = None):
+        """Run the requests made inside the block with priority_class
+
+        @priority_class: interactive, normal or bulk
+        @timeout: Seconds from entering the block after which requests that have not started are dropped with DeadlineExceeded
+        """
+
+        if priority_class not in ApiConfig.Priority.CLASSES:
+            raise ValueError(f"Unsupported priority class: {priority_class}, valid values: {', '.join(ApiConfig.Priority.CLASSES)}")
+
+        token = _priority.set((priority_class, None if timeout is None else time.monotonic() + timeout))
+        try:
+            yield
+        finally:
+            _priority.reset(token)
+
+    def acquire(self, weight: float = 1) -> _Ticket:
+        """Block until the request may be sent and return the ticket to release once it completed"""
+
+        priority_class, deadline = _priority.get()
+        ticket = _Ticket(priority_class, weight, deadline)
+        with self._condition:
+            queue = self._queues[priority_class]
+            if not queue:
+                # An idle class restarts at the current virtual time instead of spending the credit it saved while idle
+                self._finish_times[priority_class] = max(self._finish_times[priority_class], self._virtual_time)
+            queue.append(ticket)
+
+            try:
+                while True:
+                    self._dispatch()
+                    if ticket.granted:
+                        break
+
+                    now = time.monotonic()
+                    if deadline is not None and now + self._get_queue_wait(ticket) > deadline:
+                        raise DeadlineExceeded(f"A {priority_class} request cannot start within its deadline")
+
+                    timeouts = [timeout for timeout in (self._wake_at and self._wake_at - now, deadline and deadline - now) if timeout is not None]
+                    self._condition.wait(max(min(timeouts), 0.001) if timeouts else None)
+            except BaseException:
+                queue.remove(ticket)
+                self._dropped[priority_class] += 1
+                self._condition.notify_all()
+                raise
+
+            self._total_wait[priority_class] += time.monotonic() - ticket.queued_at
+        return ticket
+
+    def release(self, ticket: _Ticket):
+        """Mark the request of ticket as completed"""
+
+        with self._condition:
+            self._in_flight[ticket.priority_class] -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def schedule(self, weight: float = 1):
+        """Hold a slot for the duration of the block"""
+
+        ticket = self.acquire(weight)
+        try:
+            yield
+        finally:
+            self.release(ticket)
+
+    def get_metrics(self) -> Dict:
+        with self._condition:
+            return {
+                priority_class: {
+                    "queued": len(self._queues[priority_class]),
+                    "in_flight": self._in_flight[priority_class],
+                    "granted": self._granted[priority_class],
+                    "dropped": self._dropped[priority_class],
+                    "total_wait": self._total_wait[priority_class]
+                }
+                for priority_class in ApiConfig.Priority.CLASSES
+            }
+
+    def _dispatch(self):
+        """Grant tokens to queued tickets in fair order while the bucket allows, caller holds the lock"""
+
+        while True:
+            ready = [priority_class for priority_class in ApiConfig.Priority.CLASSES if self._queues[priority_class] and
+                     (self._concurrency[priority_class] is None or self._in_flight[priority_class] < self._concurrency[priority_class])]
+            ready.sort(key=lambda priority_class: self._finish_times[priority_class] + self._queues[priority_class][0].weight / self._shares[priority_class])
+
+            self._wake_at = None
+            for priority_class in ready:
+                ticket = self._queues[priority_class][0]
+                wait = self._rate_limiter.try_acquire(ticket.weight, self._reserves[priority_class])
+                if wait == 0:
+                    self._grant(ticket)
+                    break
+                self._wake_at = min(self._wake_at or float("inf"), time.monotonic() + wait)
+            else:
+                return
+
+    def _grant(self, ticket: _Ticket):
+        priority_class = ticket.priority_class
+        self._queues[priority_class].popleft()
+        self._virtual_time = self._finish_times[priority_class]
+        self._finish_times[priority_class] += ticket.weight / self._shares[priority_class]
+        self._in_flight[priority_class] += 1
+        self._granted[priority_class] += 1
+        ticket.granted = True
+        self._condition.notify_all()
+
+    def _get_queue_wait(self, ticket: _Ticket) -> float:
+        """Lower bound of the seconds before ticket can start: the tokens of itself, of the tickets ahead of it in its class and of its reserve"""
+
+        calls_per_minute = self._rate_limiter.calls_per_minute
+        if calls_per_minute is None:
+            return 0.0
+
+        tokens = self._reserves[ticket.priority_class]
+        for queued in self._queues[ticket.priority_class]:
+            tokens += queued.weight
+            if queued is ticket:
+                break
+        return max(0.0, tokens - self._rate_limiter.available) * 60.0 / calls_per_minute
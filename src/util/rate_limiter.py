@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import Dict
+
+from src.config import ApiConfig
+from src.util.import_util import ImportUtil
+
+asyncio = ImportUtil.import_lazy("asyncio")
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request of one or more clients
+
+    @calls_per_minute: Sustained budget refilled every minute. None disables limiting
+    @burst: Tokens that can be spent at once on top of the sustained rate. Default: ApiConfig.RateLimit.BURST
+    @weights: Cost of each ApiConfig.Url path, paths missing from it cost 1 token
+    """
+
+    def __init__(self, calls_per_minute: float = ApiConfig.RateLimit.FREE_CALLS_PER_MINUTE, burst: int = ApiConfig.RateLimit.BURST, weights: Dict[str, float] = None):
+        self._rate = None if calls_per_minute is None else calls_per_minute / 60.0
+        self._calls_per_minute = calls_per_minute
+        self._capacity = float(burst)
+        self._weights = dict(weights or {})
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+
+    @classmethod
+    def for_plan(cls, api_key: str = None, weights: Dict[str, float] = None) -> "RateLimiter":
+        """Create a limiter sized for the free plan, or for the pro plan when an api_key is given"""
+
+        calls_per_minute = ApiConfig.RateLimit.PRO_CALLS_PER_MINUTE if api_key else ApiConfig.RateLimit.FREE_CALLS_PER_MINUTE
+        return cls(calls_per_minute=calls_per_minute, weights=weights)
+
+    @property
+    def calls_per_minute(self) -> float:
+        return self._calls_per_minute
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    @property
+    def available(self) -> float:
+        """Tokens that can be spent right now, negative while callers are queued"""
+
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def get_weight(self, path: str) -> float:
+        return self._weights.get(path, 1)
+
+    def wait_time(self, weight: float = 1) -> float:
+        """Seconds a call costing weight tokens would currently wait"""
+
+        if self._rate is None:
+            return 0.0
+
+        with self._lock:
+            self._refill()
+            return max(0.0, (min(weight, self._capacity) - self._tokens) / self._rate)
+
+    def acquire(self, weight: float = 1) -> float:
+        """Block until weight tokens are available and return the seconds waited"""
+
+        wait = self._reserve(weight)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, weight: float = 1) -> float:
+        """Await until weight tokens are available and return the seconds waited"""
+
+        wait = self._reserve(weight)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def try_acquire(self, weight: float = 1, reserve: float = 0) -> float:
+        """Take weight tokens only if reserve tokens remain afterwards, without queueing
+
+        Returns 0 when the tokens were taken, otherwise the seconds until they would be available.
+        """
+
+        with self._lock:
+            if self._rate is None:
+                self._acquired += 1
+                return 0.0
+
+            self._refill()
+            weight = min(weight, self._capacity)
+            needed = weight + min(reserve, self._capacity - weight)
+            if self._tokens < needed:
+                return (needed - self._tokens) / self._rate
+
+            self._tokens -= weight
+            self._acquired += 1
+            return 0.0
+
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            self._refill()
+            return {
+                "calls_per_minute": self._calls_per_minute,
+                "capacity": self._capacity,
+                "available": self._tokens,
+                "acquired": self._acquired,
+                "delayed": self._delayed,
+                "total_wait": self._total_wait
+            }
+
+    def _reserve(self, weight: float) -> float:
+        # Tokens are reserved up front and may go negative, so queued callers are served in arrival order
+        with self._lock:
+            self._acquired += 1
+            if self._rate is None:
+                return 0.0
+
+            self._refill()
+            self._tokens -= min(weight, self._capacity)
+            wait = max(0.0, -self._tokens / self._rate)
+            if wait > 0:
+                self._delayed += 1
+                self._total_wait += wait
+            return wait
+
+    def _refill(self):
+        now = time.monotonic()
+        if self._rate is not None:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
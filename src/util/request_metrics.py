@@ -0,0 +1,155 @@
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence
+
+from src.config import ApiConfig
+
+
+class RequestMetrics:
+    """Per-endpoint request instrumentation keyed by the ApiConfig.Url path template
+
+    Records latency histograms for the connect, time-to-first-byte, download and JSON decode phases, response bytes,
+    status codes, retries, errors and cache hits. Hooks receive every recorded event as a dict.
+
+    @buckets: Upper bounds in seconds of the latency histogram buckets. Default: ApiConfig.Metrics.BUCKETS
+    """
+
+    PHASES = ("connect", "ttfb", "download", "decode")
+    CACHE_SOURCES = ("memory", "disk", "not_modified")
+
+    def __init__(self, buckets: Sequence[float] = ApiConfig.Metrics.BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._hooks = []
+
+    def add_hook(self, hook: Callable[[Dict], None]):
+        """Call hook with a dict for every recorded request or cache hit"""
+
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[Dict], None]):
+        self._hooks.remove(hook)
+
+    def record_request(self, path: str, timings: Dict, retry: bool = False, error: Exception = None):
+        """Record one HTTP attempt from the timings filled by ApiUtil.send_request
+
+        @path: ApiConfig.Url path template of the endpoint
+        @timings: Phase durations in seconds, response bytes and status, missing keys are skipped
+        @retry: Whether the attempt retried a failed one
+        @error: Exception raised by the attempt, if any
+        """
+
+        status = timings.get("status", getattr(error, "status_code", None))
+        with self._lock:
+            endpoint = self._get_endpoint(path)
+            endpoint["requests"] += 1
+            endpoint["bytes"] += timings.get("bytes", 0)
+            if retry:
+                endpoint["retries"] += 1
+            if error is not None:
+                endpoint["errors"] += 1
+            if status is not None:
+                endpoint["status"][status] = endpoint["status"].get(status, 0) + 1
+
+            for phase in RequestMetrics.PHASES:
+                if phase in timings:
+                    histogram = endpoint["phases"][phase]
+                    histogram["buckets"][bisect_left(self._buckets, timings[phase])] += 1
+                    histogram["count"] += 1
+                    histogram["sum"] += timings[phase]
+
+        self._call_hooks({"event": "request", "path": path, **timings, "status": status, "retry": retry, "error": error})
+
+    def record_cache_hit(self, path: str, source: str):
+        """Record a response served without a full download, source is one of RequestMetrics.CACHE_SOURCES"""
+
+        with self._lock:
+            cache_hits = self._get_endpoint(path)["cache_hits"]
+            cache_hits[source] = cache_hits.get(source, 0) + 1
+
+        self._call_hooks({"event": "cache_hit", "path": path, "source": source})
+
+    def snapshot(self) -> Dict:
+        """Copy of the counters per endpoint path, histogram buckets are per bound (not cumulative) with overflow last"""
+
+        with self._lock:
+            return {
+                path: {
+                    **endpoint,
+                    "status": dict(endpoint["status"]),
+                    "cache_hits": dict(endpoint["cache_hits"]),
+                    "phases": {phase: {**histogram, "buckets": list(histogram["buckets"])} for phase, histogram in endpoint["phases"].items()}
+                }
+                for path, endpoint in self._endpoints.items()
+            }
+
+    def get_buckets(self) -> List[float]:
+        return list(self._buckets)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "cg_api") -> str:
+        """Render the current counters in the Prometheus text exposition format"""
+
+        snapshot = self.snapshot()
+        lines = []
+
+        def add_counter(name: str, description: str, samples: List):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{RequestMetrics._format_labels(labels)} {value}")
+
+        add_counter("requests_total", "HTTP requests sent per endpoint", [({"endpoint": path}, endpoint["requests"]) for path, endpoint in snapshot.items()])
+        add_counter("retries_total", "Retried HTTP requests per endpoint", [({"endpoint": path}, endpoint["retries"]) for path, endpoint in snapshot.items()])
+        add_counter("errors_total", "Failed HTTP requests per endpoint", [({"endpoint": path}, endpoint["errors"]) for path, endpoint in snapshot.items()])
+        add_counter("response_bytes_total", "Response body bytes received per endpoint", [({"endpoint": path}, endpoint["bytes"]) for path, endpoint in snapshot.items()])
+        add_counter("responses_total", "HTTP responses per endpoint and status code",
+                    [({"endpoint": path, "status": status}, count) for path, endpoint in snapshot.items() for status, count in sorted(endpoint["status"].items())])
+        add_counter("cache_hits_total", "Responses served from a cache per endpoint and source",
+                    [({"endpoint": path, "source": source}, count) for path, endpoint in snapshot.items() for source, count in sorted(endpoint["cache_hits"].items())])
+
+        lines.append(f"# HELP {prefix}_phase_seconds Request latency per endpoint and phase")
+        lines.append(f"# TYPE {prefix}_phase_seconds histogram")
+        for path, endpoint in snapshot.items():
+            for phase, histogram in endpoint["phases"].items():
+                if not histogram["count"]:
+                    continue
+
+                cumulative = 0
+                for bound, count in zip(list(self._buckets) + ["+Inf"], histogram["buckets"]):
+                    cumulative += count
+                    lines.append(f"{prefix}_phase_seconds_bucket{RequestMetrics._format_labels({'endpoint': path, 'phase': phase, 'le': bound})} {cumulative}")
+                lines.append(f"{prefix}_phase_seconds_sum{RequestMetrics._format_labels({'endpoint': path, 'phase': phase})} {histogram['sum']}")
+                lines.append(f"{prefix}_phase_seconds_count{RequestMetrics._format_labels({'endpoint': path, 'phase': phase})} {histogram['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def _get_endpoint(self, path: str) -> Dict:
+        endpoint = self._endpoints.get(path)
+        if endpoint is None:
+            endpoint = self._endpoints[path] = {
+                "requests": 0,
+                "retries": 0,
+                "errors": 0,
+                "bytes": 0,
+                "status": {},
+                "cache_hits": {},
+                "phases": {phase: {"count": 0, "sum": 0.0, "buckets": [0] * (len(self._buckets) + 1)} for phase in RequestMetrics.PHASES}
+            }
+        return endpoint
+
+    def _call_hooks(self, event: Dict):
+        for hook in list(self._hooks):
+            hook(event)
+
+    @staticmethod
+    def _format_labels(labels: Dict) -> str:
+        formatted = []
+        for name, value in labels.items():
+            value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            formatted.append(f'{name}="{value}"')
+        return "{" + ",".join(formatted) + "}"
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Tuple
+
+from src.config import ApiConfig
+
+_bypass = ContextVar("response_cache_bypass", default=False)
+
+
+class ResponseCache:
+    """Thread-safe in-process cache of (headers, response) pairs with per-path TTLs and LRU eviction
+
+    Cached responses are shared between callers and must be treated as read-only.
+
+    @max_entries: Maximum number of cached responses. Default: ApiConfig.Cache.MAX_ENTRIES
+    @max_bytes: Maximum raw body size of all cached responses. Default: ApiConfig.Cache.MAX_BYTES
+    @ttls: Seconds each ApiConfig.Url path stays fresh, paths missing from it are not cached. Default: ApiConfig.Cache.TTLS
+    """
+
+    def __init__(self, max_entries: int = ApiConfig.Cache.MAX_ENTRIES, max_bytes: int = ApiConfig.Cache.MAX_BYTES, ttls: Dict[str, float] = None):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttls = dict(ApiConfig.Cache.TTLS if ttls is None else ttls)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    @contextmanager
+    def bypass():
+        """Skip cache lookups for calls made inside the block, fresh responses are still stored"""
+
+        token = _bypass.set(True)
+        try:
+            yield
+        finally:
+            _bypass.reset(token)
+
+    def get_ttl(self, path: str) -> float:
+        return self._ttls.get(path, 0)
+
+    def get(self, key: Tuple) -> Tuple:
+        """Return the fresh (headers, response) stored for key, or None"""
+
+        if _bypass.get() or not self.get_ttl(key[1]):
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, size, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Tuple, value: Tuple, size: int = None):
+        """Store (headers, response) for key if its path has a TTL
+
+        @size: Bytes of the raw response body. Default: the Content-Length header, 0 when it is missing
+        """
+
+        ttl = self.get_ttl(key[1])
+        if not ttl:
+            return
+
+        if size is None:
+            size = int(value[0].get("Content-Length") or 0)
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self._bytes += size
+
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, path: str = None, key: Tuple = None):
+        """Drop the entry stored for key, every entry of path, or everything when neither is given"""
+
+        with self._lock:
+            if key is not None:
+                if key in self._entries:
+                    self._remove(key)
+                return
+
+            for entry_key in [entry_key for entry_key in self._entries if path is None or entry_key[1] == path]:
+                self._remove(entry_key)
+
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes
+            }
+
+    def _remove(self, key: Tuple):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
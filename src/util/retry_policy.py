@@ -0,0 +1,70 @@
+import random
+from typing import Iterable, Tuple
+
+from src.config import ApiConfig
+from src.util.api_error import ApiError
+
+
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to back off before the next attempt
+
+    @max_attempts: Total attempts including the first one. Default: ApiConfig.Retry.MAX_ATTEMPTS
+    @backoff_factor: Base delay in seconds, doubled on every attempt. Default: ApiConfig.Retry.BACKOFF_FACTOR
+    @max_backoff: Upper bound of a single delay in seconds. Default: ApiConfig.Retry.MAX_BACKOFF
+    @jitter: Randomize delays so concurrent clients do not retry in lockstep. Default: True
+    @respect_retry_after: Wait for the Retry-After header when the response carries one, errors asking for more than max_backoff are raised instead of retried. Default: True
+    @status_codes: Status codes that are retried. Default: ApiConfig.Retry.STATUS_CODES
+    @methods: Idempotent methods that are retried. Default: ApiConfig.Retry.METHODS
+    @exceptions: Transport exceptions that are retried. Default: OSError, which covers connection errors and timeouts
+    """
+
+    def __init__(self,
+                 max_attempts: int = ApiConfig.Retry.MAX_ATTEMPTS,
+                 backoff_factor: float = ApiConfig.Retry.BACKOFF_FACTOR,
+                 max_backoff: float = ApiConfig.Retry.MAX_BACKOFF,
+                 jitter: bool = True,
+                 respect_retry_after: bool = True,
+                 status_codes: Iterable[int] = ApiConfig.Retry.STATUS_CODES,
+                 methods: Iterable[str] = ApiConfig.Retry.METHODS,
+                 exceptions: Tuple = (OSError,)):
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.exceptions = exceptions
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        return cls(max_attempts=1)
+
+    def should_retry(self, method: str, error: Exception, attempt: int) -> bool:
+        """Return True if the attempt-th call of method failed with a transient error and attempts are left"""
+
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return False
+
+        if isinstance(error, ApiError):
+            if self.respect_retry_after and error.retry_after is not None and error.retry_after > self.max_backoff:
+                return False
+            return error.status_code in self.status_codes
+
+        # A malformed body does not get better on retry, and requests' JSONDecodeError also subclasses OSError
+        if isinstance(error, ValueError):
+            return False
+
+        return isinstance(error, self.exceptions)
+
+    def get_delay(self, attempt: int, error: Exception = None) -> float:
+        """Seconds to wait after the attempt-th call failed with error"""
+
+        retry_after = getattr(error, "retry_after", None)
+        if self.respect_retry_after and retry_after is not None:
+            return min(self.max_backoff, retry_after)
+
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = delay / 2 + random.uniform(0, delay / 2)
+        return delay
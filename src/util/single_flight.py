@@ -0,0 +1,109 @@
+import threading
+from typing import Awaitable, Callable, Dict, Hashable
+
+from src.util.import_util import ImportUtil
+
+asyncio = ImportUtil.import_lazy("asyncio")
+
+
+class _Call:
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls so only one of them runs and every caller receives its result or exception
+
+    @enabled: Coalesce calls, otherwise every call runs on its own. Default: True
+    """
+
+    def __init__(self, enabled: bool = True):
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_calls = {}
+
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable):
+        """Run fn unless a call for key is already in flight in another thread, in which case wait for its outcome"""
+
+        if not self._enabled:
+            with self._lock:
+                self._executed += 1
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable]):
+        """Await fn unless a call for key is already in flight on the event loop, in which case await its outcome
+
+        fn runs in its own task and every caller awaits it through asyncio.shield, so cancelling one caller never
+        cancels the call the others are waiting on.
+        """
+
+        if not self._enabled:
+            with self._lock:
+                self._executed += 1
+            return await fn()
+
+        task = self._async_calls.get(key)
+        if task is not None:
+            with self._lock:
+                self._coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._async_calls[key] = task
+            task.add_done_callback(lambda done: self._complete_async_call(key, done))
+            with self._lock:
+                self._executed += 1
+
+        return await asyncio.shield(task)
+
+    @classmethod
+    def disabled(cls) -> "SingleFlight":
+        return cls(enabled=False)
+
+    def _complete_async_call(self, key: Hashable, task):
+        if self._async_calls.get(key) is task:
+            del self._async_calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller was cancelled before it was raised
+            task.exception()
+
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls) + len(self._async_calls)
+            }
@@ -0,0 +1,85 @@
+import math
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from src.config import ApiConfig
+
+
+class TimeRangeUtil:
+
+    @staticmethod
+    def get_granularity_window(granularity: str) -> timedelta:
+        """Longest market chart range window that is still served at granularity, None when any window is"""
+
+        windows = {
+            ApiConfig.Granularity.MINUTELY: timedelta(seconds=ApiConfig.Granularity.MINUTELY_WINDOW),
+            ApiConfig.Granularity.HOURLY: timedelta(seconds=ApiConfig.Granularity.HOURLY_WINDOW),
+            ApiConfig.Granularity.DAILY: None
+        }
+
+        if granularity not in windows:
+            raise ValueError(f"Unsupported granularity: {granularity}, valid values: {', '.join(windows)}")
+
+        return windows[granularity]
+
+    @staticmethod
+    def get_granularity_min_window(granularity: str) -> timedelta:
+        """Shortest market chart range window that is served at granularity, None when any window is"""
+
+        min_windows = {
+            ApiConfig.Granularity.MINUTELY: None,
+            ApiConfig.Granularity.HOURLY: timedelta(seconds=ApiConfig.Granularity.HOURLY_MIN_WINDOW),
+            ApiConfig.Granularity.DAILY: timedelta(seconds=ApiConfig.Granularity.DAILY_MIN_WINDOW)
+        }
+
+        if granularity not in min_windows:
+            raise ValueError(f"Unsupported granularity: {granularity}, valid values: {', '.join(min_windows)}")
+
+        return min_windows[granularity]
+
+    @staticmethod
+    def get_range_granularity(length: timedelta) -> str:
+        """Granularity the API serves a market chart range of length at"""
+
+        if length <= timedelta(seconds=ApiConfig.Granularity.MINUTELY_WINDOW):
+            return ApiConfig.Granularity.MINUTELY
+        if length <= timedelta(seconds=ApiConfig.Granularity.HOURLY_WINDOW):
+            return ApiConfig.Granularity.HOURLY
+        return ApiConfig.Granularity.DAILY
+
+    @staticmethod
+    def split(from_date: datetime, to_date: datetime, max_window: timedelta, min_window: timedelta = None) -> List[Tuple[datetime, datetime]]:
+        """Partition [from_date, to_date] into contiguous windows of equal length no longer than max_window, None keeps a single window
+
+        A range shorter than min_window becomes a single window extended backwards to min_window, the points before
+        from_date are dropped by merge_market_charts.
+        """
+
+        if min_window is not None and to_date - from_date < min_window:
+            return [(to_date - min_window, to_date)]
+
+        if max_window is None or to_date - from_date <= max_window:
+            return [(from_date, to_date)]
+
+        # Equal windows instead of full ones plus a short remainder, which would be served at a finer granularity
+        count = math.ceil((to_date - from_date) / max_window)
+        window = (to_date - from_date) / count
+        bounds = [from_date + window * index for index in range(count)] + [to_date]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    @staticmethod
+    def merge_market_charts(responses: List[Dict], from_date: datetime = None, to_date: datetime = None) -> Dict:
+        """Stitch market chart responses into one, sorted by timestamp with duplicate boundary points and points outside [from_date, to_date] removed"""
+
+        start = -math.inf if from_date is None else datetime.timestamp(from_date) * 1000
+        end = math.inf if to_date is None else datetime.timestamp(to_date) * 1000
+
+        merged_response = {}
+        for response in responses:
+            for name, points in response.items():
+                series = merged_response.setdefault(name, {})
+                for point in points:
+                    if start <= point[0] <= end:
+                        series[point[0]] = point
+
+        return {name: [series[timestamp] for timestamp in sorted(series)] for name, series in merged_response.items()}
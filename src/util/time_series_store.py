@@ -0,0 +1,186 @@
+import mmap
+import os
+import re
+import struct
+import threading
+from typing import List, Sequence, Tuple
+
+from src.model import MarketChart
+from src.util.import_util import ImportUtil
+
+np = ImportUtil.import_lazy("numpy")
+
+
+class TimeSeriesStore:
+    """Append-only columnar store keeping one file per series of fixed-width (int64 timestamp, float64 values...) records
+
+    Records are kept sorted by timestamp: appends only accept points newer than the last stored one. Readers map the file
+    with mmap and locate a time range by binary search, so many processes can share the same history without loading it.
+    A single writer per series is expected.
+
+    @directory: Folder holding the series files, created if missing
+    """
+
+    MAGIC = b"CGTS"
+    VERSION = 1
+    FIELD_NAME_SIZE = 16
+    EXTENSION = ".cgts"
+    MARKET_CHART_FIELDS = ("prices", "market_caps", "total_volumes")
+    OHLC_FIELDS = ("open", "close", "low", "high")
+    VOLUME_FIELDS = ("volume_chart",)
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, name: str) -> str:
+        return os.path.join(self._directory, re.sub(r"[^A-Za-z0-9._-]", "_", name) + TimeSeriesStore.EXTENSION)
+
+    def exists(self, name: str) -> bool:
+        return os.path.exists(self.get_path(name))
+
+    def get_fields(self, name: str) -> List[str]:
+        with open(self.get_path(name), "rb") as file:
+            fields, _ = TimeSeriesStore._read_header(file)
+        return fields
+
+    def append(self, name: str, fields: Sequence[str], timestamps: Sequence[int], columns: Sequence[Sequence[float]]) -> int:
+        """Append points newer than the last stored one, returns the number of appended records
+
+        @name: Series name, eg. bitcoin-usd
+        @fields: Value field names, fixed when the series file is created
+        @timestamps: Millisecond timestamps in ascending order
+        @columns: One sequence of values per field, aligned with timestamps
+        """
+
+        path = self.get_path(name)
+        with self._lock:
+            if not os.path.exists(path):
+                with open(path, "wb") as file:
+                    file.write(TimeSeriesStore._build_header(fields))
+
+            with open(path, "r+b") as file:
+                stored_fields, header_size = TimeSeriesStore._read_header(file)
+                if list(stored_fields) != list(fields):
+                    raise ValueError(f"Series {name} stores fields {stored_fields}, got {list(fields)}")
+
+                record = struct.Struct("<q" + "d" * len(fields))
+                count = (os.fstat(file.fileno()).st_size - header_size) // record.size
+                last_timestamp = None
+                if count:
+                    file.seek(header_size + (count - 1) * record.size)
+                    last_timestamp = struct.unpack("<q", file.read(8))[0]
+
+                buffer = bytearray()
+                appended = 0
+                for timestamp, *values in zip(timestamps, *columns):
+                    timestamp = int(timestamp)
+                    if last_timestamp is not None and timestamp <= last_timestamp:
+                        continue
+                    buffer += record.pack(timestamp, *[float("nan") if value is None else float(value) for value in values])
+                    last_timestamp = timestamp
+                    appended += 1
+
+                # Drop a partially written trailing record before appending
+                file.truncate(header_size + count * record.size)
+                file.seek(0, os.SEEK_END)
+                file.write(buffer)
+
+        return appended
+
+    def write_market_chart(self, name: str, market_chart) -> int:
+        """Append a get_coin_marketchart* result, either the response dict or a MarketChart"""
+
+        if isinstance(market_chart, dict):
+            market_chart = MarketChart.from_response(market_chart)
+
+        fields = TimeSeriesStore.MARKET_CHART_FIELDS
+        return self.append(name, fields, market_chart.timestamps.tolist(), [getattr(market_chart, field).tolist() for field in fields])
+
+    def write_ohlc(self, name: str, ohlc) -> int:
+        """Append a get_coin_ohlc result, either the list of dicts or an OhlcSeries"""
+
+        if isinstance(ohlc, list):
+            return self.append(name, TimeSeriesStore.OHLC_FIELDS, [item["date_time"] for item in ohlc], [[item[field] for item in ohlc] for field in TimeSeriesStore.OHLC_FIELDS])
+
+        return self.append(name, TimeSeriesStore.OHLC_FIELDS, ohlc.date_time, [getattr(ohlc, field) for field in TimeSeriesStore.OHLC_FIELDS])
+
+    def write_volume_chart(self, name: str, volume_chart) -> int:
+        """Append a get_exchange_volumechart result, either the list of dicts or a VolumeSeries"""
+
+        if isinstance(volume_chart, list):
+            return self.append(name, TimeSeriesStore.VOLUME_FIELDS, [item["date_time"] for item in volume_chart], [[item["volume_chart"] for item in volume_chart]])
+
+        return self.append(name, TimeSeriesStore.VOLUME_FIELDS, volume_chart.date_time, [volume_chart.volume_chart])
+
+    def read(self, name: str, start: int = None, end: int = None):
+        """Zero-copy NumPy structured view of the records with start <= timestamp < end (milliseconds)"""
+
+        if np is None:
+            raise ImportError("TimeSeriesStore.read requires numpy, install it with `pip install cg_api[numpy]` or use read_records")
+
+        buffer, fields, header_size, count = self._map(name)
+        dtype = np.dtype([("timestamp", "<i8")] + [(field, "<f8") for field in fields])
+        records = np.frombuffer(buffer, dtype=dtype, count=count, offset=header_size) if count else np.empty(0, dtype=dtype)
+
+        start_index = 0 if start is None else int(np.searchsorted(records["timestamp"], start, side="left"))
+        end_index = count if end is None else int(np.searchsorted(records["timestamp"], end, side="left"))
+        return records[start_index:end_index]
+
+    def read_records(self, name: str, start: int = None, end: int = None) -> List[Tuple]:
+        """Records with start <= timestamp < end (milliseconds) as (timestamp, values...) tuples, without NumPy"""
+
+        buffer, fields, header_size, count = self._map(name)
+        record = struct.Struct("<q" + "d" * len(fields))
+
+        def get_timestamp(index: int) -> int:
+            return struct.unpack_from("<q", buffer, header_size + index * record.size)[0]
+
+        def search(timestamp: int) -> int:
+            low, high = 0, count
+            while low < high:
+                middle = (low + high) // 2
+                if get_timestamp(middle) < timestamp:
+                    low = middle + 1
+                else:
+                    high = middle
+            return low
+
+        try:
+            start_index = 0 if start is None else search(start)
+            end_index = count if end is None else search(end)
+            return [record.unpack_from(buffer, header_size + index * record.size) for index in range(start_index, end_index)]
+        finally:
+            # The records are copied out, release the mapping now instead of whenever it is collected
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+    def _map(self, name: str) -> Tuple:
+        with open(self.get_path(name), "rb") as file:
+            fields, header_size = TimeSeriesStore._read_header(file)
+            size = os.fstat(file.fileno()).st_size
+            if size == header_size:
+                return b"", fields, header_size, 0
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        count = (size - header_size) // (8 + 8 * len(fields))
+        return buffer, fields, header_size, count
+
+    @staticmethod
+    def _build_header(fields: Sequence[str]) -> bytes:
+        header = struct.pack("<4sII", TimeSeriesStore.MAGIC, TimeSeriesStore.VERSION, len(fields))
+        for field in fields:
+            header += field.encode().ljust(TimeSeriesStore.FIELD_NAME_SIZE, b"\0")[:TimeSeriesStore.FIELD_NAME_SIZE]
+        return header.ljust(-(-len(header) // 8) * 8, b"\0")
+
+    @staticmethod
+    def _read_header(file) -> Tuple[List[str], int]:
+        file.seek(0)
+        magic, version, field_count = struct.unpack("<4sII", file.read(12))
+        if magic != TimeSeriesStore.MAGIC or version != TimeSeriesStore.VERSION:
+            raise ValueError(f"{file.name} is not a time series file")
+
+        fields = [file.read(TimeSeriesStore.FIELD_NAME_SIZE).rstrip(b"\0").decode() for _ in range(field_count)]
+        header_size = -(-(12 + field_count * TimeSeriesStore.FIELD_NAME_SIZE) // 8) * 8
+        return fields, header_size
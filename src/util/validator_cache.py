@@ -0,0 +1,110 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from src.config import ApiConfig
+from src.util.api_util import ApiUtil
+
+
+class ValidatorCache:
+    """Remembers the ETag / Last-Modified validators and parsed response of recent requests to revalidate them conditionally
+
+    On a 304 Not Modified the stored parsed response is returned without downloading or decoding the body again. Stored
+    responses are shared between callers and must be treated as read-only. Clients only send conditional requests when
+    one is passed as validator_cache.
+
+    @max_entries: Maximum number of remembered responses, least recently used are dropped first. Default: ApiConfig.Conditional.MAX_ENTRIES
+    @max_bytes: Maximum raw body size of all remembered responses. Default: ApiConfig.Conditional.MAX_BYTES
+    """
+
+    def __init__(self, max_entries: int = ApiConfig.Conditional.MAX_ENTRIES, max_bytes: int = ApiConfig.Conditional.MAX_BYTES):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self._revalidations = 0
+        self._not_modified = 0
+        self._bytes_saved = 0
+
+    def get_headers(self, key: Tuple) -> Dict:
+        """Conditional request headers for key, None if nothing is stored"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self._revalidations += 1
+            etag, last_modified, _, _ = entry
+
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get_size(self, key: Tuple) -> int:
+        """Raw body size of the response stored for key, None if nothing is stored"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[3]
+
+    def revalidate(self, key: Tuple, result: Tuple, size: int = None) -> Tuple:
+        """Resolve a (headers, response) result: a 304 returns the stored result, anything else is remembered and returned as is
+
+        Returns None for a 304 whose stored result was evicted in the meantime.
+
+        @size: Bytes of the raw response body. Default: the Content-Length header, 0 when it is missing
+        """
+
+        headers, response = result
+        with self._lock:
+            if response is ApiUtil.NOT_MODIFIED:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return None
+
+                _, _, stored_result, stored_size = entry
+                self._entries.move_to_end(key)
+                self._not_modified += 1
+                self._bytes_saved += stored_size
+                return stored_result
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return result
+
+        if size is None:
+            size = int(headers.get("Content-Length") or 0)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self._max_bytes:
+                return result
+
+            self._entries[key] = (etag, last_modified, result, size)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+
+        return result
+
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "revalidations": self._revalidations,
+                "not_modified": self._not_modified,
+                "bytes_saved": self._bytes_saved
+            }
+
+    def _remove(self, key: Tuple):
+        _, _, _, size = self._entries.pop(key)
+        self._bytes -= size
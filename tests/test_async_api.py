@@ -0,0 +1,116 @@
+from benchmarks.mock_server import MockServer
+from src.api.async_coingecko_api import AsyncCoingeckoApi
+from src.config import ApiConfig
+from src.util import AsyncApiUtil, NotFoundError, RateLimitError, RateLimiter, ResponseCache, RetryPolicy
+import asyncio
+import unittest
+
+def create_api(host: str, **kwargs) -> AsyncCoingeckoApi:
+    options = {"rate_limiter": RateLimiter(None), "retry_policy": RetryPolicy(backoff_factor=0), "response_cache": ResponseCache(ttls={}), **kwargs}
+    return AsyncCoingeckoApi(scheme="http", host=host, **options)
+
+class Tests(unittest.TestCase):
+
+# Requests
+    def test_async_get(self):
+        async def run():
+            with MockServer(size=10) as server:
+                async with create_api(server.host) as api:
+                    return await api.get_ping(), await api.get_coin(coin_id="bitcoin"), server.get_request_count()
+
+        ping, coin, request_count = asyncio.run(run())
+        assert "gecko_says" in ping
+        assert coin["id"] == "bitcoin"
+        assert request_count == 2
+
+    def test_async_pagination_headers(self):
+        async def run():
+            with MockServer(size=250) as server:
+                async with create_api(server.host) as api:
+                    return await api.get_exchanges(per_page=100, page=3)
+
+        exchanges = asyncio.run(run())
+        assert exchanges["total"] == 250 and exchanges["per_page"] == 100 and exchanges["page"] == 3
+        assert len(exchanges["exchanges"]) == 50
+
+    def test_async_error_mapping(self):
+        async def run():
+            with MockServer() as server:
+                async with create_api(server.host, base_path="/missing") as api:
+                    with self.assertRaises(NotFoundError) as not_found:
+                        await api.get_ping()
+
+            with MockServer(rate_limit_every=1, retry_after=7) as server:
+                async with create_api(server.host, retry_policy=RetryPolicy.disabled()) as api:
+                    with self.assertRaises(RateLimitError) as rate_limited:
+                        await api.get_ping()
+
+            return not_found.exception, rate_limited.exception
+
+        not_found, rate_limited = asyncio.run(run())
+        assert not_found.status_code == 404 and not_found.body == {"error": "Not Found"}
+        assert rate_limited.status_code == 429 and rate_limited.retry_after == 7
+
+    def test_async_retry(self):
+        async def run():
+            with MockServer(rate_limit_every=2) as server:
+                async with create_api(server.host) as api:
+                    for _ in range(3):
+                        await api.get_ping()
+                    return server.get_request_count(), api.metrics.snapshot()[ApiConfig.Url.PING]
+
+        request_count, snapshot = asyncio.run(run())
+        assert request_count == 5
+        assert snapshot["status"] == {200: 3, 429: 2}
+        assert snapshot["retries"] == 2
+
+    def test_async_concurrency_limit(self):
+        async def run():
+            with MockServer(size=10, latency=0.05) as server:
+                async with create_api(server.host, max_concurrency=2) as api:
+                    coins = await asyncio.gather(*[api.get_coin(coin_id=f"coin-{index}") for index in range(8)])
+                    return coins, server.get_max_in_flight()
+
+        coins, max_in_flight = asyncio.run(run())
+        assert [coin["id"] for coin in coins] == [f"coin-{index}" for index in range(8)]
+        assert max_in_flight == 2
+
+# Bulk fetch
+    def test_async_fetch_many(self):
+        progress = []
+        kwargs_list = [{"coin_id": f"coin-{index}"} for index in range(12)] + [{"unknown": 1}]
+
+        async def run():
+            with MockServer(size=10, latency=0.05) as server:
+                async with create_api(server.host) as api:
+                    results = [result async for result in api.fetch_many("get_coin", iter(kwargs_list), concurrency=3,
+                                                                         on_progress=lambda bulk_progress: progress.append((bulk_progress.completed, bulk_progress.failed)))]
+                    return results, server.get_max_in_flight()
+
+        results, max_in_flight = asyncio.run(run())
+        assert max_in_flight == 3
+        assert sorted(result.index for result in results) == list(range(13))
+        assert all(result.kwargs is kwargs_list[result.index] for result in results)
+        assert all(result.result["id"] == result.kwargs["coin_id"] for result in results if result.ok)
+        assert [type(result.error) for result in results if not result.ok] == [TypeError]
+        assert [completed for completed, _ in progress] == list(range(1, 14))
+        assert progress[-1] == (13, 1)
+
+    def test_async_get_simple_price_batch(self):
+        coin_ids = [f"coin-{index:04d}" for index in range(40)]
+
+        async def run():
+            with MockServer(size=10, latency=0.05) as server:
+                async with create_api(server.host) as api:
+                    prices = await api.get_simple_price_batch(coin_ids=coin_ids, vs_currencies=["usd"], max_url_length=250, max_workers=2)
+                    return prices, server.get_request_count(), server.get_max_in_flight()
+
+        prices, request_count, max_in_flight = asyncio.run(run())
+        assert sorted(prices) == coin_ids
+        assert request_count > 2
+        assert max_in_flight == 2
+
+# Params
+    def test_async_format_params(self):
+        params = AsyncApiUtil.format_params({"ids": "bitcoin", "include_platform": True, "page": 2, "x_cg_pro_api_key": None, "tags": ["a", "b"]})
+        assert params == [("ids", "bitcoin"), ("include_platform", "true"), ("page", "2"), ("tags", "a"), ("tags", "b")]
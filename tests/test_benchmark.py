@@ -0,0 +1,136 @@
+from benchmarks.import_time import measure
+from benchmarks.mock_server import MockServer
+from benchmarks.run_benchmarks import SCENARIOS, create_api, run_scenario
+from src.api.coingecko_api import CoingeckoApi
+from src.config import ApiConfig
+from src.util import RateLimiter, ResponseCache, RetryPolicy
+import time
+import unittest
+
+class Tests(unittest.TestCase):
+
+# Mock server
+    def test_mock_server_routes(self):
+        with MockServer(size=10) as server, create_api(server.host) as api:
+            for scenario in SCENARIOS.values():
+                scenario(api, 1)
+
+            routes = {value for name, value in vars(ApiConfig.Url).items() if not name.startswith("_")}
+            assert set(api.metrics.snapshot()) == routes
+
+    def test_mock_server_pagination(self):
+        with MockServer(size=250) as server, create_api(server.host) as api:
+            exchanges = api.get_exchanges(per_page=100, page=3)
+            assert exchanges["total"] == 250 and exchanges["per_page"] == 100
+            assert len(exchanges["exchanges"]) == 50
+            assert len(list(api.iter_exchanges(per_page=100))) == 250
+
+    def test_mock_server_pagination_start_page(self):
+        with MockServer(size=250) as server, create_api(server.host) as api:
+            exchanges = list(api.iter_exchanges(per_page=100))
+            assert list(api.iter_exchanges(per_page=100, start_page=2)) == exchanges[100:]
+            assert server.get_request_count() == 5
+
+    def test_mock_server_pagination_prefetch(self):
+        with MockServer(size=250, latency=0.02) as server, create_api(server.host) as api:
+            assert len(list(api.iter_exchanges(per_page=100, prefetch=4))) == 250
+            assert server.get_request_count() == 3
+
+    def test_mock_server_pagination_prefetch_without_total(self):
+        with MockServer(size=250) as server, create_api(server.host) as api:
+            pages = []
+            get_coin_markets = api.get_coin_markets
+
+            def get_coin_markets_slowly(**kwargs):
+                pages.append(kwargs["page"])
+                if kwargs["page"] == 2:
+                    time.sleep(0.1)
+                return get_coin_markets(**kwargs)
+
+            api.get_coin_markets = get_coin_markets_slowly
+            coin_ids = []
+            for coin in api.iter_coin_markets(vs_currency="usd", per_page=100, prefetch=2):
+                coin_ids.append(coin["id"])
+                if len(coin_ids) == 201:
+                    time.sleep(0.1)
+            assert coin_ids == [f"coin-{index}" for index in range(250)]
+            assert sorted(pages) == [1, 2, 3, 4]
+
+    def test_mock_server_rate_limit(self):
+        with MockServer(rate_limit_every=2) as server:
+            with CoingeckoApi(scheme="http", host=server.host, rate_limiter=RateLimiter(None), retry_policy=RetryPolicy(backoff_factor=0)) as api:
+                for _ in range(3):
+                    api.get_ping()
+                assert server.get_request_count() == 5
+                assert api.metrics.snapshot()[ApiConfig.Url.PING]["status"] == {200: 3, 429: 2}
+
+    def test_mock_server_response_cache_opt_in(self):
+        with MockServer(size=10) as server:
+            with CoingeckoApi(scheme="http", host=server.host, rate_limiter=RateLimiter(None)) as api:
+                api.get_simple_price(coin_ids=["bitcoin"], vs_currencies=["usd"])
+                api.get_simple_price(coin_ids=["bitcoin"], vs_currencies=["usd"])
+                assert server.get_request_count() == 2
+
+            with CoingeckoApi(scheme="http", host=server.host, rate_limiter=RateLimiter(None), response_cache=ResponseCache()) as api:
+                api.get_simple_price(coin_ids=["bitcoin"], vs_currencies=["usd"])
+                api.get_simple_price(coin_ids=["bitcoin"], vs_currencies=["usd"])
+                assert server.get_request_count() == 3
+
+    def test_mock_server_cached_response_not_mutated(self):
+        response_cache = ResponseCache(ttls={ApiConfig.Url.COIN_STATUS_UPDATES: 60})
+        with MockServer(size=10) as server:
+            with CoingeckoApi(scheme="http", host=server.host, rate_limiter=RateLimiter(None), response_cache=response_cache) as api:
+                first = api.get_coin_status_updates(coin_id="bitcoin")
+                del first["status_updates"]
+                second = api.get_coin_status_updates(coin_id="bitcoin")
+                assert server.get_request_count() == 1
+                assert "status_updates" in second and second["page"] == 1
+                assert response_cache.get_metrics()["bytes"] > 0
+
+# Bulk fetch
+    def test_fetch_many(self):
+        progress = []
+        kwargs_list = [{"coin_id": f"coin-{index}"} for index in range(12)] + [{"unknown": 1}]
+        with MockServer(size=10, latency=0.05) as server, create_api(server.host) as api:
+            results = list(api.fetch_many("get_coin", iter(kwargs_list), concurrency=3, on_progress=lambda bulk_progress: progress.append((bulk_progress.completed, bulk_progress.failed))))
+            assert server.get_max_in_flight() == 3
+
+        assert sorted(result.index for result in results) == list(range(13))
+        assert all(result.kwargs is kwargs_list[result.index] for result in results)
+        assert all(result.result["id"] == result.kwargs["coin_id"] for result in results if result.ok)
+        assert [type(result.error) for result in results if not result.ok] == [TypeError]
+        assert [completed for completed, _ in progress] == list(range(1, 14))
+        assert progress[-1] == (13, 1)
+
+    def test_get_simple_price_batch(self):
+        coin_ids = [f"coin-{index:04d}" for index in range(40)]
+        with MockServer(size=10, latency=0.05) as server, create_api(server.host) as api:
+            prices = api.get_simple_price_batch(coin_ids=coin_ids, vs_currencies=["usd"], max_url_length=250, max_workers=2)
+            assert server.get_request_count() > 2
+            assert server.get_max_in_flight() == 2
+
+        assert sorted(prices) == coin_ids
+
+# Benchmarks
+    def test_run_scenario(self):
+        with MockServer(size=10) as server:
+            result = run_scenario(server.host, "get_coin", calls=20, concurrency=4)
+        assert result["errors"] == 0
+        assert result["http_requests"] == 20
+        assert result["endpoints"] == [ApiConfig.Url.COIN]
+        assert result["latency_p50_ms"] <= result["latency_p99_ms"]
+        assert result["peak_memory_per_call_bytes"] > 0
+
+    def test_run_scenario_not_coalesced(self):
+        with MockServer(size=10) as server:
+            for name in SCENARIOS:
+                result = run_scenario(server.host, name, calls=8, concurrency=8)
+                assert result["errors"] == 0, name
+                assert result["http_requests"] == result["calls"], name
+
+# Import time
+    def test_import_is_lazy(self):
+        assert measure("import src")["loaded"] == []
+        assert measure("from src import CoingeckoApi")["loaded"] == []
+        assert measure("import src.util.api_util, src.util.single_flight")["loaded"] == []
+        assert measure("from src import CoingeckoApi; CoingeckoApi()")["loaded"] == ["requests", "urllib3"]
@@ -0,0 +1,58 @@
+from src.model import MarketChart, Ohlc, OhlcSeries, VolumeSeries
+import math
+import unittest
+
+class Tests(unittest.TestCase):
+
+# Market chart
+    def test_market_chart_from_response(self):
+        response = {
+            "prices": [[1000, 1.5], [2000, 2.5], [3000, 3.5]],
+            "market_caps": [[1000, 10.0], [2000, 20.0], [3000, 30.0]],
+            "total_volumes": [[1000, 100.0], [2000, 200.0], [3000, None]]
+        }
+        market_chart = MarketChart.from_response(response)
+        assert len(market_chart) == 3
+        assert market_chart.timestamps.dtype.name == "int64"
+        assert market_chart.prices.tolist() == [1.5, 2.5, 3.5]
+        assert math.isnan(market_chart.total_volumes[2])
+        assert market_chart[0] == (1000, 1.5, 10.0, 100.0)
+
+    def test_market_chart_alignment(self):
+        response = {
+            "prices": [[1000, 1.0], [2000, 2.0]],
+            "market_caps": [[2000, 20.0], [3000, 30.0]],
+            "total_volumes": []
+        }
+        market_chart = MarketChart.from_response(response)
+        assert market_chart.timestamps.tolist() == [1000, 2000, 3000]
+        assert market_chart.market_caps[1:].tolist() == [20.0, 30.0]
+        assert math.isnan(market_chart.prices[2])
+
+    def test_market_chart_between(self):
+        response = {name: [[timestamp, float(timestamp)] for timestamp in range(0, 10000, 1000)] for name in MarketChart.SERIES}
+        market_chart = MarketChart.from_response(response)
+        window = market_chart.between(2000, 5000)
+        assert window.timestamps.tolist() == [2000, 3000, 4000]
+        assert window.prices.base is not None
+        assert market_chart.to_dict() == response
+
+# Ohlc
+    def test_ohlc_series(self):
+        response = [[1000, 1.0, 2.0, 0.5, 2.5], [2000, 2.0, 3.0, 1.5, 3.5]]
+        ohlc_series = OhlcSeries.from_response(response)
+        assert len(ohlc_series) == 2
+        assert ohlc_series[1] == Ohlc(2000, 2.0, 3.0, 1.5, 3.5)
+        assert [ohlc.date_time for ohlc in ohlc_series] == [1000, 2000]
+        assert ohlc_series.to_dicts() == [{"date_time": 1000, "open": 1.0, "close": 2.0, "low": 0.5, "high": 2.5},
+                                          {"date_time": 2000, "open": 2.0, "close": 3.0, "low": 1.5, "high": 3.5}]
+        assert ohlc_series.to_numpy()["high"].tolist() == [2.5, 3.5]
+        assert len(OhlcSeries.from_response([])) == 0
+
+# Volume
+    def test_volume_series(self):
+        response = [[1643850000000.0, "12.5"], [1643853600000.0, "13.25"]]
+        volume_series = VolumeSeries.from_response(response)
+        assert len(volume_series[1:]) == 1
+        assert volume_series.to_dicts() == [{"date_time": 1643850000000.0, "volume_chart": 12.5},
+                                            {"date_time": 1643853600000.0, "volume_chart": 13.25}]
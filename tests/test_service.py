@@ -0,0 +1,305 @@
+from benchmarks.mock_server import MockServer
+from src.api.coingecko_api import CoingeckoApi
+from src.config import ApiConfig
+from src.service import ContractResolver, CurrencyConverter, MarketDataSync, PricePoller, SearchIndex
+from src.util import RateLimiter, ResponseCache
+from datetime import datetime
+import os
+import queue
+import tempfile
+import time
+import unittest
+
+class MarketChartApi:
+
+    def __init__(self, points):
+        self.points = points
+        self.calls = []
+        self.granularities = []
+
+    def get_coin_marketchart_range(self, coin_id, vs_currency, from_date, to_date):
+        self.calls.append((from_date, to_date))
+        start = datetime.timestamp(from_date) * 1000
+        end = datetime.timestamp(to_date) * 1000
+        points = [point for point in self.points if start <= point[0] <= end]
+        return {
+            "prices": [[timestamp, price] for timestamp, price in points],
+            "market_caps": [[timestamp, price * 10] for timestamp, price in points],
+            "total_volumes": [[timestamp, price * 100] for timestamp, price in points]
+        }
+
+    def get_coin_marketchart_range_by_granularity(self, coin_id, vs_currency, from_date, to_date, granularity):
+        self.granularities.append(granularity)
+        return self.get_coin_marketchart_range(coin_id, vs_currency, from_date, to_date)
+
+class ListApi:
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_coin_list(self, include_platform=False):
+        self.calls += 1
+        coins = [{"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"},
+                 {"id": "bitcoin-cash", "symbol": "bch", "name": "Bitcoin Cash"},
+                 {"id": "wrapped-bitcoin", "symbol": "wbtc", "name": "Wrapped Bitcoin"},
+                 {"id": "ethereum", "symbol": "eth", "name": "Ethereum"},
+                 {"id": "batcat", "symbol": "btc", "name": "batcat"}]
+        if include_platform:
+            platforms = {"bitcoin": {}, "bitcoin-cash": {"": ""},
+                         "wrapped-bitcoin": {"ethereum": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599", "solana": "3NZ9JMVBmGAqocybic2c7LQCJScmgsAZ6vQqTDzcqmJh"},
+                         "ethereum": {}, "batcat": {"ethereum": "0x1234567890abcdef1234567890abcdef12345678"}}
+            for coin in coins:
+                coin["platforms"] = platforms[coin["id"]]
+        return coins
+
+    def get_simple_price_batch(self, coin_ids, vs_currencies, **kwargs):
+        self.price_calls = getattr(self, "price_calls", []) + [coin_ids]
+        return {coin_id: {currency: 1.0 for currency in vs_currencies} for coin_id in coin_ids}
+
+    def get_exchange_list(self):
+        return [{"id": "binance", "name": "Binance"}, {"id": "gdax", "name": "Coinbase Exchange"}]
+
+    def get_derivative_exchange_list(self):
+        return [{"id": "binance_futures", "name": "Binance (Futures)"}]
+
+    def get_coin_category_list(self):
+        return [{"category_id": "decentralized-finance-defi", "name": "Decentralized Finance (DeFi)"}]
+
+class ExchangeRateApi:
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_exchange_rates(self):
+        self.calls += 1
+        return {"rates": {"btc": {"name": "Bitcoin", "unit": "BTC", "value": 1.0, "type": "crypto"},
+                          "usd": {"name": "US Dollar", "unit": "$", "value": 20000.0, "type": "fiat"},
+                          "eur": {"name": "Euro", "unit": "€", "value": 16000.0, "type": "fiat"}}}
+
+    def get_simple_price_batch(self, coin_ids, vs_currencies, **kwargs):
+        assert vs_currencies == ["usd"]
+        return {"bitcoin": {"usd": 20000.0, "usd_market_cap": 4e11, "usd_24h_change": 1.5, "last_updated_at": 1660000000},
+                "ethereum": {"usd": 1000.0, "usd_market_cap": None, "usd_24h_change": -2.0, "last_updated_at": 1660000001}}
+
+class PriceApi:
+
+    def __init__(self):
+        self.calls = []
+        self.prices = {"bitcoin": 20000.0, "ethereum": 1000.0, "tether": 1.0}
+        self.last_updated_at = 1000
+
+    def get_simple_price_batch(self, coin_ids, vs_currencies, include_last_updated_at=False, **kwargs):
+        self.calls.append((coin_ids, vs_currencies))
+        return {coin_id: {**{vs_currency: self.prices[coin_id] for vs_currency in vs_currencies}, "last_updated_at": self.last_updated_at}
+                for coin_id in coin_ids if coin_id in self.prices}
+
+class Tests(unittest.TestCase):
+
+# Market data sync
+    def test_market_data_sync_tail(self):
+        hour = 3600 * 1000
+        start = int(datetime(year=2022, month=1, day=1).timestamp() * 1000)
+        api = MarketChartApi([[start + index * hour, float(index)] for index in range(48)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            market_data_sync = MarketDataSync(api, os.path.join(directory, "market_data.db"), initial_days=30)
+            assert market_data_sync.sync("bitcoin", "usd", now=datetime.fromtimestamp((start + 24 * hour) / 1000)) == 25
+            assert market_data_sync.sync("bitcoin", "usd", now=datetime.fromtimestamp((start + 47 * hour) / 1000)) == 23
+            assert market_data_sync.sync("bitcoin", "usd", now=datetime.fromtimestamp((start + 47 * hour) / 1000)) == 0
+            assert api.calls[1][0] == datetime.fromtimestamp((start + 24 * hour) / 1000)
+            assert api.granularities == [ApiConfig.Granularity.HOURLY, ApiConfig.Granularity.HOURLY]
+
+            series = market_data_sync.get_series("bitcoin", "usd")
+            assert [point[1] for point in series["prices"]] == [float(index) for index in range(48)]
+            assert series["market_caps"][1] == [start + hour, 10.0]
+            assert len(market_data_sync.get_series("bitcoin", "usd", start=start + 10 * hour, end=start + 20 * hour)["prices"]) == 10
+            market_data_sync.close()
+
+    def test_market_data_sync_tail_granularity(self):
+        day = 24 * 3600 * 1000
+        start = int(datetime(year=2022, month=1, day=1).timestamp() * 1000)
+        api = MarketChartApi([[start + index * day, float(index)] for index in range(400)] + [[start + 399 * day + 3600 * 1000, 399.5]])
+
+        with tempfile.TemporaryDirectory() as directory:
+            market_data_sync = MarketDataSync(api, os.path.join(directory, "market_data.db"), initial_days=365)
+            market_data_sync.sync("bitcoin", "usd", now=datetime.fromtimestamp((start + 365 * day) / 1000))
+            market_data_sync.sync("bitcoin", "usd", now=datetime.fromtimestamp((start + 399 * day + 3600 * 1000) / 1000))
+            assert api.granularities == [ApiConfig.Granularity.DAILY]
+            assert market_data_sync.get_granularity("bitcoin", "usd") == ApiConfig.Granularity.DAILY
+
+            hourly_sync = MarketDataSync(api, os.path.join(directory, "hourly.db"), granularity=ApiConfig.Granularity.HOURLY)
+            assert hourly_sync.get_granularity("bitcoin", "usd") == ApiConfig.Granularity.HOURLY
+            market_data_sync.close()
+            hourly_sync.close()
+
+# Search index
+    def test_search_index_prefix(self):
+        search_index = SearchIndex(ListApi())
+        response = search_index.search("BTC")
+        assert [coin["id"] for coin in response["coins"]] == ["bitcoin", "batcat"]
+        assert response["coins"][0] == {"id": "bitcoin", "name": "Bitcoin", "api_symbol": "bitcoin", "symbol": "BTC", "market_cap_rank": None, "thumb": None, "large": None}
+        assert set(response) == {"coins", "exchanges", "icos", "categories", "nfts"}
+
+        response = search_index.search("bitc", limit=2)
+        assert [coin["id"] for coin in response["coins"]] == ["bitcoin", "bitcoin-cash"]
+        assert [exchange["market_type"] for exchange in search_index.search("binance")["exchanges"]] == ["spot", "futures"]
+        assert [exchange["id"] for exchange in search_index.search("coinbase")["exchanges"]] == ["gdax"]
+        assert [category["id"] for category in search_index.search("defi")["categories"]] == ["decentralized-finance-defi"]
+        assert [coin["id"] for coin in search_index.search_symbol("Btc")] == ["bitcoin", "batcat"]
+
+    def test_search_index_fuzzy(self):
+        search_index = SearchIndex(ListApi())
+        assert [coin["id"] for coin in search_index.search("etherium")["coins"]] == ["ethereum"]
+        assert search_index.search("zzzz")["coins"] == []
+
+    def test_search_index_refresh(self):
+        api = ListApi()
+        search_index = SearchIndex(api, ttl=0)
+        search_index.search("bitcoin")
+        assert api.calls == 1
+
+        assert search_index.search("bitcoin")["coins"]
+        deadline = time.monotonic() + 5
+        while api.calls < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert api.calls == 2
+
+
+    def test_search_index_refresh_bypasses_cache(self):
+        with MockServer(size=10) as server, CoingeckoApi(scheme="http", host=server.host, rate_limiter=RateLimiter(None), response_cache=ResponseCache()) as api:
+            search_index = SearchIndex(api)
+            search_index.refresh()
+            api.get_coin_list()
+            assert server.get_request_count() == 4
+
+            search_index.refresh()
+            assert server.get_request_count() == 8
+
+# Contract resolver
+    def test_contract_resolver_resolve(self):
+        api = ListApi()
+        contract_resolver = ContractResolver(api)
+        assert contract_resolver.resolve("ethereum", "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599") == "wrapped-bitcoin"
+        assert contract_resolver.resolve("solana", "3NZ9JMVBmGAqocybic2c7LQCJScmgsAZ6vQqTDzcqmJh") == "wrapped-bitcoin"
+        assert contract_resolver.resolve("solana", "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599") is None
+        assert contract_resolver.get_contract_addresses("wrapped-bitcoin")["ethereum"] == "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599"
+        assert contract_resolver.get_contract_addresses("bitcoin-cash") == {}
+        assert api.calls == 1
+
+        addresses = ["0x1234567890ABCDEF1234567890ABCDEF12345678", "0xdead", "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599"]
+        assert contract_resolver.resolve_many("ethereum", addresses) == {addresses[0]: "batcat", addresses[2]: "wrapped-bitcoin"}
+        assert contract_resolver.get_token_prices("ethereum", addresses, ["usd"]) == {addresses[0]: {"usd": 1.0}, addresses[2]: {"usd": 1.0}}
+        assert api.price_calls == [["batcat", "wrapped-bitcoin"]]
+
+    def test_contract_resolver_persist(self):
+        api = ListApi()
+        contract_resolver = ContractResolver(api)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "contracts.json")
+            contract_resolver.save(path)
+
+            loaded = ContractResolver(api)
+            loaded.load(path)
+            assert loaded.resolve("ethereum", "0x2260FAC5E5542A773AA44FBCFEDF7C193BC2C599") == "wrapped-bitcoin"
+            assert loaded.refreshed_at == contract_resolver.refreshed_at
+            assert api.calls == 1
+
+            loaded.refresh()
+            assert api.calls == 2
+
+# Currency converter
+    def test_currency_converter_convert(self):
+        api = ExchangeRateApi()
+        currency_converter = CurrencyConverter(api)
+        assert currency_converter.currencies == ["btc", "usd", "eur"]
+        assert currency_converter.get_rate("usd", "eur") == 0.8
+        assert currency_converter.convert([100.0, 40000.0], "USD", ["eur", "btc"]).tolist() == [[80.0, 0.005], [32000.0, 2.0]]
+
+        cross_rates = currency_converter.get_cross_rates()
+        assert cross_rates.shape == (3, 3)
+        assert cross_rates[2, 1] == 1.25 and cross_rates[0, 2] == 16000.0
+        assert currency_converter.get_cross_rates() is cross_rates
+        assert currency_converter.get_cross_rates(["eur", "usd"]).tolist() == [[1.0, 1.25], [0.8, 1.0]]
+        assert api.calls == 1
+
+        with self.assertRaises(ValueError):
+            currency_converter.convert(1.0, "usd", ["xyz"])
+
+    def test_currency_converter_prices(self):
+        api = ExchangeRateApi()
+        prices = CurrencyConverter(api).get_prices(["bitcoin", "ethereum"], ["usd", "eur", "btc"], include_market_cap=True)
+        assert prices["bitcoin"] == {"usd": 20000.0, "eur": 16000.0, "btc": 1.0, "usd_market_cap": 4e11, "eur_market_cap": 3.2e11, "btc_market_cap": 2e7,
+                                     "usd_24h_change": 1.5, "last_updated_at": 1660000000}
+        assert prices["ethereum"] == {"usd": 1000.0, "eur": 800.0, "btc": 0.05, "usd_market_cap": None, "usd_24h_change": -2.0, "last_updated_at": 1660000001}
+
+    def test_currency_converter_ttl(self):
+        api = ExchangeRateApi()
+        currency_converter = CurrencyConverter(api, ttl=0)
+        currency_converter.get_rate("usd", "eur")
+        time.sleep(0.01)
+        currency_converter.get_rate("usd", "eur")
+        assert api.calls == 2
+
+# Price poller
+    def test_price_poller_merge(self):
+        api = PriceApi()
+        price_poller = PricePoller(api, upstream_interval=60)
+        deliveries = []
+        changes = queue.Queue()
+        price_poller.subscribe(["bitcoin", "ethereum"], ["usd"], max_staleness=30, callback=deliveries.append)
+        price_poller.subscribe(["ethereum", "tether"], ["eur"], max_staleness=120, queue=changes)
+
+        assert price_poller.poll(now=1000) == 60
+        assert api.calls == [(["bitcoin", "ethereum", "tether"], ["eur", "usd"])]
+        assert deliveries == [{"bitcoin": {"usd": 20000.0, "last_updated_at": 1000}, "ethereum": {"usd": 1000.0, "last_updated_at": 1000}}]
+        assert changes.get_nowait() == {"ethereum": {"eur": 1000.0, "last_updated_at": 1000}, "tether": {"eur": 1.0, "last_updated_at": 1000}}
+
+        # Upstream has not updated yet, nothing is polled
+        assert price_poller.poll(now=1030) == 30
+        assert len(api.calls) == 1
+
+        # Tether rides along since it is due within half of its staleness, only changed values are delivered
+        api.prices["bitcoin"] = 21000.0
+        api.last_updated_at = 1060
+        assert price_poller.poll(now=1060) == 60
+        assert api.calls[1] == (["bitcoin", "ethereum", "tether"], ["eur", "usd"])
+        assert deliveries[1] == {"bitcoin": {"usd": 21000.0, "last_updated_at": 1060}}
+        assert changes.empty()
+        assert price_poller.get_price("bitcoin") == {"usd": 21000.0, "eur": 21000.0, "last_updated_at": 1060}
+
+    def test_price_poller_subscription(self):
+        api = PriceApi()
+        price_poller = PricePoller(api)
+        deliveries = []
+        subscription = price_poller.subscribe(["bitcoin"], ["usd"], max_staleness=30, callback=deliveries.append)
+        price_poller.poll(now=1000)
+
+        # A new currency is polled right away, a cancelled subscription is no longer polled
+        price_poller.subscribe(["bitcoin"], ["eur"], max_staleness=30, callback=deliveries.append)
+        subscription.cancel()
+        price_poller.poll(now=1001)
+        assert api.calls[1] == (["bitcoin"], ["eur"])
+        assert deliveries[1] == {"bitcoin": {"eur": 20000.0, "last_updated_at": 1000}}
+
+        with self.assertRaises(ValueError):
+            price_poller.subscribe(["bitcoin"], ["usd"], max_staleness=30)
+
+    def test_price_poller_thread(self):
+        api = PriceApi()
+        changes = queue.Queue()
+        with PricePoller(api) as price_poller:
+            price_poller.subscribe(["bitcoin"], ["usd"], max_staleness=30, queue=changes)
+            assert changes.get(timeout=5)["bitcoin"]["usd"] == 20000.0
+        assert len(api.calls) == 1
+
+    def test_price_poller_bypasses_cache(self):
+        coin_ids = [f"coin-{index:04d}" for index in range(500)]
+        with MockServer(size=10) as server, CoingeckoApi(scheme="http", host=server.host, rate_limiter=RateLimiter(None), response_cache=ResponseCache()) as api:
+            price_poller = PricePoller(api, upstream_interval=60)
+            price_poller.subscribe(coin_ids, ["usd"], max_staleness=30, callback=lambda changes: None)
+            price_poller.poll(now=1704070000)
+            request_count = server.get_request_count()
+            assert request_count > 1
+
+            price_poller.poll(now=1704070100)
+            assert server.get_request_count() == 2 * request_count
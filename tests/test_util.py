@@ -0,0 +1,497 @@
+from benchmarks.mock_server import MockServer
+from src.api.coingecko_api import CoingeckoApi
+from src.config import ApiConfig
+from src.util import ApiError, ApiUtil, Cassette, CassetteResponse, DeadlineExceeded, DiskCache, HttpSession, NotFoundError, PriorityScheduler, RateLimitError, RateLimiter, RequestMetrics, ResponseCache, RetryPolicy, ServerError, SingleFlight, TimeRangeUtil, TimeSeriesStore, ValidatorCache
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import os
+import requests
+import tempfile
+import threading
+import time
+import unittest
+
+class Tests(unittest.TestCase):
+
+# Rate limiter
+    def test_rate_limiter_burst(self):
+        rate_limiter = RateLimiter(calls_per_minute=60, burst=3)
+        waits = [rate_limiter.acquire() for _ in range(3)]
+        assert all(wait == 0 for wait in waits)
+        assert rate_limiter.wait_time() > 0
+
+    def test_rate_limiter_weights(self):
+        rate_limiter = RateLimiter(calls_per_minute=6000, burst=2, weights={ApiConfig.Url.COIN: 2})
+        assert rate_limiter.get_weight(ApiConfig.Url.COIN) == 2
+        assert rate_limiter.get_weight(ApiConfig.Url.PING) == 1
+
+        start = time.monotonic()
+        rate_limiter.acquire(rate_limiter.get_weight(ApiConfig.Url.COIN))
+        waited = rate_limiter.acquire()
+        assert waited > 0
+        assert time.monotonic() - start >= waited
+
+    def test_rate_limiter_metrics(self):
+        rate_limiter = RateLimiter(calls_per_minute=None)
+        for _ in range(100):
+            assert rate_limiter.acquire() == 0
+        metrics = rate_limiter.get_metrics()
+        assert metrics["acquired"] == 100
+        assert metrics["delayed"] == 0
+
+    def test_rate_limiter_for_plan(self):
+        assert RateLimiter.for_plan().calls_per_minute == ApiConfig.RateLimit.FREE_CALLS_PER_MINUTE
+        assert RateLimiter.for_plan(api_key="key").calls_per_minute == ApiConfig.RateLimit.PRO_CALLS_PER_MINUTE
+
+# Priority scheduler
+    def test_priority_scheduler_preempts_bulk(self):
+        scheduler = PriorityScheduler(RateLimiter(calls_per_minute=600, burst=3))
+        stop = threading.Event()
+
+        def backfill():
+            with PriorityScheduler.priority(ApiConfig.Priority.BULK):
+                while not stop.is_set():
+                    with scheduler.schedule():
+                        time.sleep(0.01)
+
+        threads = [threading.Thread(target=backfill) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+
+        time.sleep(0.3)
+        waits = []
+        with PriorityScheduler.priority(ApiConfig.Priority.INTERACTIVE):
+            for _ in range(3):
+                start = time.monotonic()
+                with scheduler.schedule():
+                    waits.append(time.monotonic() - start)
+                time.sleep(0.25)
+
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        metrics = scheduler.get_metrics()
+        assert max(waits) < 0.1
+        assert metrics["interactive"]["granted"] == 3
+        assert metrics["bulk"]["granted"] > 5
+        assert scheduler.rate_limiter.available >= 0
+
+    def test_priority_scheduler_deadline(self):
+        scheduler = PriorityScheduler(RateLimiter(calls_per_minute=60, burst=1))
+        scheduler.release(scheduler.acquire())
+
+        start = time.monotonic()
+        with PriorityScheduler.priority(ApiConfig.Priority.INTERACTIVE, timeout=0.2):
+            with self.assertRaises(DeadlineExceeded):
+                scheduler.acquire()
+        assert time.monotonic() - start < 0.1
+        assert scheduler.get_metrics()["interactive"]["dropped"] == 1
+
+        with self.assertRaises(ValueError):
+            with PriorityScheduler.priority("urgent"):
+                pass
+
+    def test_priority_scheduler_concurrency(self):
+        scheduler = PriorityScheduler(RateLimiter(calls_per_minute=None), concurrency={ApiConfig.Priority.BULK: 1})
+        with PriorityScheduler.priority(ApiConfig.Priority.BULK):
+            ticket = scheduler.acquire()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(ApiUtil.bind_context(scheduler.acquire))
+                time.sleep(0.05)
+                assert not future.done()
+                assert scheduler.get_metrics()["bulk"]["queued"] == 1
+
+                scheduler.release(ticket)
+                scheduler.release(future.result(timeout=5))
+
+        assert scheduler.get_metrics()["bulk"]["granted"] == 2
+
+    def test_priority_scheduler_plan(self):
+        assert PriorityScheduler().rate_limiter.calls_per_minute == ApiConfig.RateLimit.FREE_CALLS_PER_MINUTE
+        assert PriorityScheduler(api_key="key").rate_limiter.calls_per_minute == ApiConfig.RateLimit.PRO_CALLS_PER_MINUTE
+
+        scheduler = PriorityScheduler(api_key="key")
+        with CoingeckoApi(api_key="key", scheduler=scheduler) as api:
+            assert api.rate_limiter is scheduler.rate_limiter
+        with self.assertRaises(ValueError):
+            CoingeckoApi(api_key="key", scheduler=PriorityScheduler())
+        with self.assertRaises(ValueError):
+            CoingeckoApi(scheduler=scheduler)
+        with self.assertRaises(ValueError):
+            CoingeckoApi(scheduler=scheduler, rate_limiter=RateLimiter())
+
+        scheduler = PriorityScheduler(RateLimiter(calls_per_minute=100))
+        with CoingeckoApi(api_key="key", scheduler=scheduler, rate_limiter=scheduler.rate_limiter) as api:
+            assert api.rate_limiter.calls_per_minute == 100
+
+# Retry
+    def test_api_error_from_response(self):
+        rate_limit_error = ApiError.from_response(429, b'{"error": "Throttled"}', {"Retry-After": "7"})
+        assert isinstance(rate_limit_error, RateLimitError)
+        assert rate_limit_error.body == {"error": "Throttled"}
+        assert rate_limit_error.retry_after == 7
+        assert isinstance(ApiError.from_response(404, b"not found"), NotFoundError)
+        assert isinstance(ApiError.from_response(502, b""), ServerError)
+
+    def test_retry_policy_should_retry(self):
+        retry_policy = RetryPolicy(max_attempts=3)
+        server_error = ApiError.from_response(503, b"")
+        assert retry_policy.should_retry("GET", server_error, attempt=1)
+        assert not retry_policy.should_retry("GET", server_error, attempt=3)
+        assert not retry_policy.should_retry("POST", server_error, attempt=1)
+        assert not retry_policy.should_retry("GET", ApiError.from_response(400, b""), attempt=1)
+        assert retry_policy.should_retry("GET", ConnectionError(), attempt=1)
+        assert not retry_policy.should_retry("GET", requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0), attempt=1)
+        assert not retry_policy.should_retry("GET", json.JSONDecodeError("Expecting value", "<html>", 0), attempt=1)
+
+    def test_retry_policy_get_delay(self):
+        retry_policy = RetryPolicy(backoff_factor=1, max_backoff=4, jitter=False)
+        assert [retry_policy.get_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 4]
+        assert retry_policy.get_delay(1, ApiError.from_response(429, b"", {"Retry-After": "3"})) == 3
+        assert retry_policy.get_delay(1, ApiError.from_response(429, b"", {"Retry-After": "10"})) == 4
+
+    def test_retry_policy_retry_after_above_max_backoff(self):
+        retry_policy = RetryPolicy(max_attempts=3, max_backoff=60)
+        assert retry_policy.should_retry("GET", ApiError.from_response(429, b"", {"Retry-After": "60"}), attempt=1)
+        assert not retry_policy.should_retry("GET", ApiError.from_response(429, b"", {"Retry-After": "3600"}), attempt=1)
+        assert RetryPolicy(max_attempts=3, max_backoff=60, respect_retry_after=False).should_retry("GET", ApiError.from_response(429, b"", {"Retry-After": "3600"}), attempt=1)
+
+# Response cache
+    def test_response_cache_key_ignores_api_key(self):
+        key = ApiUtil.build_request_key("GET", ApiConfig.Url.COIN_LIST, {}, {"include_platform": "false", "x_cg_pro_api_key": "key"})
+        other_key = ApiUtil.build_request_key("GET", ApiConfig.Url.COIN_LIST, {}, {"include_platform": "false", "x_cg_pro_api_key": None})
+        assert key == other_key
+
+    def test_response_cache_ttl(self):
+        response_cache = ResponseCache(ttls={ApiConfig.Url.COIN_LIST: 0.05})
+        key = ApiUtil.build_request_key("GET", ApiConfig.Url.COIN_LIST, {}, {})
+        response_cache.set(key, ({}, [{"id": "bitcoin"}]))
+        assert response_cache.get(key) == ({}, [{"id": "bitcoin"}])
+
+        with ResponseCache.bypass():
+            assert response_cache.get(key) is None
+
+        time.sleep(0.06)
+        assert response_cache.get(key) is None
+        assert response_cache.get_metrics()["hits"] == 1
+
+    def test_response_cache_uncached_path(self):
+        response_cache = ResponseCache()
+        key = ApiUtil.build_request_key("GET", ApiConfig.Url.COIN, {"coin_id": "bitcoin"}, {})
+        response_cache.set(key, ({}, {"id": "bitcoin"}))
+        assert response_cache.get(key) is None
+
+    def test_response_cache_eviction(self):
+        response_cache = ResponseCache(max_entries=2, ttls={ApiConfig.Url.COIN_LIST: 60})
+        keys = [ApiUtil.build_request_key("GET", ApiConfig.Url.COIN_LIST, {}, {"page": page}) for page in range(3)]
+        for key in keys:
+            response_cache.set(key, ({}, []))
+
+        assert response_cache.get(keys[0]) is None
+        assert response_cache.get(keys[2]) is not None
+        assert response_cache.get_metrics()["evictions"] == 1
+
+        response_cache.invalidate(path=ApiConfig.Url.COIN_LIST)
+        assert response_cache.get_metrics()["entries"] == 0
+
+    def test_response_cache_size(self):
+        response_cache = ResponseCache(max_bytes=100, ttls={ApiConfig.Url.COIN_LIST: 60})
+        keys = [ApiUtil.build_request_key("GET", ApiConfig.Url.COIN_LIST, {}, {"page": page}) for page in range(3)]
+        response_cache.set(keys[0], ({}, []), size=60)
+        response_cache.set(keys[1], ({"Content-Length": "30"}, []))
+        assert response_cache.get_metrics()["bytes"] == 90
+
+        response_cache.set(keys[2], ({}, []), size=20)
+        assert response_cache.get(keys[0]) is None
+        assert response_cache.get_metrics()["bytes"] == 50
+
+# Disk cache
+    def test_disk_cache_is_immutable(self):
+        with tempfile.TemporaryDirectory() as directory:
+            disk_cache = DiskCache(os.path.join(directory, "cache.db"), safety_margin=3600)
+            now = time.time()
+            closed_key = ApiUtil.build_request_key("GET", ApiConfig.Url.COIN_MARKETCHART_RANGE, {"coin_id": "bitcoin"}, {"from": now - 86400, "to": now - 7200})
+            open_key = ApiUtil.build_request_key("GET", ApiConfig.Url.COIN_MARKETCHART_RANGE, {"coin_id": "bitcoin"}, {"from": now - 86400, "to": now})
+            history_key = ApiUtil.build_request_key("GET", ApiConfig.Url.COIN_HISTORY, {"coin_id": "bitcoin"}, {"date": "01-02-2021"})
+            assert disk_cache.is_immutable(closed_key)
+            assert not disk_cache.is_immutable(open_key)
+            assert disk_cache.is_immutable(history_key)
+            assert not disk_cache.is_immutable(ApiUtil.build_request_key("GET", ApiConfig.Url.COIN, {"coin_id": "bitcoin"}, {}))
+            disk_cache.close()
+
+    def test_disk_cache_persists(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.db")
+            key = ApiUtil.build_request_key("GET", ApiConfig.Url.COIN_HISTORY, {"coin_id": "bitcoin"}, {"date": "01-02-2021"})
+
+            disk_cache = DiskCache(path)
+            disk_cache.set(key, ({"Content-Type": "application/json"}, {"id": "bitcoin"}))
+            disk_cache.close()
+
+            disk_cache = DiskCache(path)
+            headers, response = disk_cache.get(key)
+            assert headers["content-type"] == "application/json"
+            assert response == {"id": "bitcoin"}
+            disk_cache.close()
+
+# Batching
+    def test_chunk_values(self):
+        values = ["coin-%d" % index for index in range(1000)]
+        chunks = ApiUtil.chunk_values(values, max_length=200)
+        assert [value for chunk in chunks for value in chunk] == values
+        assert all(len("%2C".join(chunk)) <= 200 for chunk in chunks)
+        assert ApiUtil.chunk_values(["bitcoin", "bitcoin"], max_length=200) == [["bitcoin"]]
+
+# Single flight
+    def test_single_flight_threads(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"bitcoin": {"usd": 1}}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: single_flight.do("key", fetch), range(8)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert single_flight.get_metrics()["coalesced"] == 7
+
+    def test_single_flight_async_error(self):
+        single_flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            raise ServerError(503, b"")
+
+        async def run():
+            return await asyncio.gather(*[single_flight.do_async("key", fetch) for _ in range(4)], return_exceptions=True)
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, ServerError) for result in results)
+        assert single_flight.get_metrics() == {"executed": 1, "coalesced": 3, "in_flight": 0}
+
+    def test_single_flight_async_leader_cancelled(self):
+        single_flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.1)
+            return {"bitcoin": {"usd": 1}}
+
+        async def run():
+            leader = asyncio.ensure_future(asyncio.wait_for(single_flight.do_async("key", fetch), 0.05))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(single_flight.do_async("key", fetch))
+            return await asyncio.gather(leader, follower, return_exceptions=True)
+
+        leader, follower = asyncio.run(run())
+        assert isinstance(leader, asyncio.TimeoutError)
+        assert follower == {"bitcoin": {"usd": 1}}
+        assert single_flight.get_metrics() == {"executed": 1, "coalesced": 1, "in_flight": 0}
+
+# Time range
+    def test_time_range_split(self):
+        from_date = datetime(year=2021, month=1, day=1)
+        to_date = datetime(year=2021, month=12, day=31)
+        windows = TimeRangeUtil.split(from_date, to_date, TimeRangeUtil.get_granularity_window(ApiConfig.Granularity.HOURLY))
+        assert windows[0][0] == from_date and windows[-1][1] == to_date
+        assert all(window_end - window_start <= timedelta(days=89) for window_start, window_end in windows)
+        assert all(windows[index][1] == windows[index + 1][0] for index in range(len(windows) - 1))
+        assert TimeRangeUtil.split(from_date, to_date, TimeRangeUtil.get_granularity_window(ApiConfig.Granularity.DAILY)) == [(from_date, to_date)]
+
+    def test_time_range_split_balanced(self):
+        from_date = datetime(year=2021, month=1, day=1)
+        to_date = datetime(year=2021, month=4, day=1)
+        windows = TimeRangeUtil.split(from_date, to_date, TimeRangeUtil.get_granularity_window(ApiConfig.Granularity.HOURLY),
+                                      TimeRangeUtil.get_granularity_min_window(ApiConfig.Granularity.HOURLY))
+        assert windows == [(from_date, datetime(year=2021, month=2, day=15)), (datetime(year=2021, month=2, day=15), to_date)]
+
+    def test_time_range_split_min_window(self):
+        from_date = datetime(year=2021, month=3, day=1)
+        to_date = datetime(year=2021, month=4, day=1)
+        windows = TimeRangeUtil.split(from_date, to_date, TimeRangeUtil.get_granularity_window(ApiConfig.Granularity.DAILY),
+                                      TimeRangeUtil.get_granularity_min_window(ApiConfig.Granularity.DAILY))
+        assert windows == [(to_date - timedelta(days=91), to_date)]
+
+        day = 24 * 3600 * 1000
+        start = int(datetime.timestamp(to_date - timedelta(days=91)) * 1000)
+        response = {"prices": [[start + index * day, float(index)] for index in range(92)]}
+        merged_response = TimeRangeUtil.merge_market_charts([response], from_date, to_date)
+        assert merged_response["prices"][0][0] == datetime.timestamp(from_date) * 1000
+        assert merged_response["prices"][-1][0] == datetime.timestamp(to_date) * 1000
+        assert len(merged_response["prices"]) == 32
+
+    def test_merge_market_charts(self):
+        responses = [
+            {"prices": [[1000, 1.0], [2000, 2.0]], "market_caps": [[1000, 10.0], [2000, 20.0]]},
+            {"prices": [[2000, 2.0], [3000, 3.0]], "market_caps": [[2000, 20.0], [3000, 30.0]]}
+        ]
+        merged_response = TimeRangeUtil.merge_market_charts(list(reversed(responses)))
+        assert merged_response["prices"] == [[1000, 1.0], [2000, 2.0], [3000, 3.0]]
+        assert merged_response["market_caps"] == [[1000, 10.0], [2000, 20.0], [3000, 30.0]]
+
+# Time series store
+    def test_time_series_store_append(self):
+        with tempfile.TemporaryDirectory() as directory:
+            time_series_store = TimeSeriesStore(directory)
+            response = {name: [[timestamp, float(timestamp)] for timestamp in range(0, 10000, 1000)] for name in TimeSeriesStore.MARKET_CHART_FIELDS}
+            assert time_series_store.write_market_chart("bitcoin-usd", response) == 10
+            assert time_series_store.write_market_chart("bitcoin-usd", response) == 0
+            assert time_series_store.get_fields("bitcoin-usd") == list(TimeSeriesStore.MARKET_CHART_FIELDS)
+
+            records = time_series_store.read("bitcoin-usd", start=2000, end=5000)
+            assert records["timestamp"].tolist() == [2000, 3000, 4000]
+            assert records["prices"].tolist() == [2000.0, 3000.0, 4000.0]
+            assert time_series_store.read_records("bitcoin-usd", start=8500) == [(9000, 9000.0, 9000.0, 9000.0)]
+
+    def test_time_series_store_ohlc(self):
+        with tempfile.TemporaryDirectory() as directory:
+            time_series_store = TimeSeriesStore(directory)
+            ohlc = [{"date_time": 1000, "open": 1.0, "close": 2.0, "low": 0.5, "high": 2.5}]
+            assert time_series_store.write_ohlc("bitcoin-usd-ohlc", ohlc) == 1
+            assert time_series_store.read_records("bitcoin-usd-ohlc") == [(1000, 1.0, 2.0, 0.5, 2.5)]
+            with self.assertRaises(ValueError):
+                time_series_store.write_volume_chart("bitcoin-usd-ohlc", [{"date_time": 2000.0, "volume_chart": 1.0}])
+
+# Validator cache
+    def test_validator_cache_not_modified(self):
+        validator_cache = ValidatorCache()
+        key = ("GET", "/coins/list", (), ())
+        assert validator_cache.get_headers(key) is None
+
+        result = ({"ETag": 'W/"abc"', "Content-Length": "1000"}, [{"id": "bitcoin"}])
+        assert validator_cache.revalidate(key, result) is result
+        assert validator_cache.get_headers(key) == {"If-None-Match": 'W/"abc"'}
+
+        assert validator_cache.revalidate(key, ({}, ApiUtil.NOT_MODIFIED)) is result
+        assert validator_cache.get_metrics() == {"entries": 1, "bytes": 1000, "revalidations": 1, "not_modified": 1, "bytes_saved": 1000}
+
+    def test_validator_cache_eviction(self):
+        validator_cache = ValidatorCache(max_entries=1)
+        validator_cache.revalidate(("a",), ({"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, {"a": 1}))
+        validator_cache.revalidate(("b",), ({"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, {"b": 1}))
+        validator_cache.revalidate(("c",), ({}, {"c": 1}))
+        assert validator_cache.get_headers(("a",)) is None
+        assert validator_cache.get_headers(("b",)) == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        assert validator_cache.get_headers(("c",)) is None
+        assert validator_cache.revalidate(("a",), ({}, ApiUtil.NOT_MODIFIED)) is None
+
+    def test_validator_cache_max_bytes(self):
+        validator_cache = ValidatorCache(max_bytes=100)
+        headers = {"ETag": 'W/"abc"'}
+        validator_cache.revalidate(("a",), (headers, {"a": 1}), size=60)
+        validator_cache.revalidate(("b",), (headers, {"b": 1}), size=60)
+        validator_cache.revalidate(("c",), (headers, {"c": 1}), size=1000)
+        assert validator_cache.get_headers(("a",)) is None
+        assert validator_cache.get_headers(("c",)) is None
+        assert validator_cache.get_size(("b",)) == 60
+        assert validator_cache.get_metrics()["bytes"] == 60
+
+# Request metrics
+    def test_request_metrics_snapshot(self):
+        request_metrics = RequestMetrics(buckets=(0.1, 1))
+        events = []
+        request_metrics.add_hook(events.append)
+        request_metrics.record_request(ApiConfig.Url.COIN_LIST, {"connect": 0.05, "ttfb": 0.5, "download": 2, "decode": 0.01, "bytes": 100, "status": 200})
+        request_metrics.record_request(ApiConfig.Url.COIN_LIST, {"ttfb": 0.2, "bytes": 10, "status": 429}, error=RateLimitError(429, b"{}"))
+        request_metrics.record_request(ApiConfig.Url.COIN_LIST, {}, retry=True, error=OSError())
+        request_metrics.record_cache_hit(ApiConfig.Url.COIN_LIST, "memory")
+
+        endpoint = request_metrics.snapshot()[ApiConfig.Url.COIN_LIST]
+        assert endpoint["requests"] == 3 and endpoint["retries"] == 1 and endpoint["errors"] == 2
+        assert endpoint["bytes"] == 110
+        assert endpoint["status"] == {200: 1, 429: 1}
+        assert endpoint["cache_hits"] == {"memory": 1}
+        assert endpoint["phases"]["ttfb"]["buckets"] == [0, 2, 0]
+        assert endpoint["phases"]["download"]["buckets"] == [0, 0, 1]
+        assert [event["event"] for event in events] == ["request", "request", "request", "cache_hit"]
+
+    def test_request_metrics_prometheus(self):
+        request_metrics = RequestMetrics(buckets=(0.1, 1))
+        request_metrics.record_request(ApiConfig.Url.COIN, {"ttfb": 0.5, "status": 200})
+        text = request_metrics.to_prometheus()
+        assert 'cg_api_requests_total{endpoint="/coins/{coin_id}"} 1' in text
+        assert 'cg_api_responses_total{endpoint="/coins/{coin_id}",status="200"} 1' in text
+        assert 'cg_api_phase_seconds_bucket{endpoint="/coins/{coin_id}",phase="ttfb",le="0.1"} 0' in text
+        assert 'cg_api_phase_seconds_bucket{endpoint="/coins/{coin_id}",phase="ttfb",le="+Inf"} 1' in text
+        assert 'phase="connect"' not in text
+
+# Cassette
+    def test_cassette_record_replay(self):
+        class Session:
+            requests = 0
+
+            def request(self, method, url, params=None, **kwargs):
+                Session.requests += 1
+                return CassetteResponse(200, {"ETag": "abc"}, b'{"gecko_says": "(V3) To the Moon!"}')
+
+            def close(self):
+                pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cassette.jsonl.gz")
+            recorder = Cassette(path, mode="record", session=Session())
+            ApiUtil.send_request("https", "example.org", "/api/v3", "GET", ApiConfig.Url.PING, {}, {"x_cg_pro_api_key": "secret"}, session=recorder)
+            recorder.close()
+
+            player = Cassette(path, mode="replay")
+            headers, response = ApiUtil.send_request("http", "localhost", "/api/v3", "GET", ApiConfig.Url.PING, {}, {"x_cg_pro_api_key": None}, session=player)
+            assert response == {"gecko_says": "(V3) To the Moon!"}
+            assert headers["etag"] == "abc"
+            assert Session.requests == 1
+            with self.assertRaises(LookupError):
+                ApiUtil.send_request("http", "localhost", "/api/v3", "GET", ApiConfig.Url.GLOBAL, {}, {}, session=player)
+
+    def test_cassette_key(self):
+        assert Cassette.get_key("get", "https://example.org/api/v3/simple/price?", {"vs_currencies": "usd", "ids": "bitcoin", "x": None}) == \
+            Cassette.get_key("GET", "http://localhost/api/v3/simple/price", {"ids": "bitcoin", "vs_currencies": "usd", "x_cg_pro_api_key": "secret"})
+
+# Http session
+    def test_http_session_reuse(self):
+        with MockServer() as server:
+            session = HttpSession()
+            connect_times = []
+            for _ in range(5):
+                session.request(method="GET", url=f"http://{server.host}/api/v3/ping").raise_for_status()
+                connect_times.append(session.get_connect_time())
+            session.close()
+
+            assert server.get_connection_count() == 1
+            assert connect_times[0] > 0 and connect_times[1:] == [0.0] * 4
+
+    def test_http_session_keep_alive(self):
+        with MockServer() as server:
+            session = HttpSession(keep_alive=0.05)
+            session.request(method="GET", url=f"http://{server.host}/api/v3/ping")
+            session.request(method="GET", url=f"http://{server.host}/api/v3/ping")
+            time.sleep(0.1)
+            session.request(method="GET", url=f"http://{server.host}/api/v3/ping")
+            session.close()
+
+            assert server.get_connection_count() == 2
+
+    def test_http_session_pool_maxsize(self):
+        with MockServer(latency=0.1) as server:
+            session = HttpSession(pool_maxsize=2)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for _ in range(2):
+                    list(executor.map(lambda _: session.request(method="GET", url=f"http://{server.host}/api/v3/ping"), range(4)))
+            session.close()
+
+            # 4 connections for the first round, the 2 kept in the pool are reused by the second one
+            assert server.get_connection_count() == 6
+
+    def test_http_session_close(self):
+        with MockServer() as server:
+            session = HttpSession()
+            session.request(method="GET", url=f"http://{server.host}/api/v3/ping")
+            session.close()
+            session.request(method="GET", url=f"http://{server.host}/api/v3/ping")
+            session.close()
+
+            assert server.get_connection_count() == 2